@@ -485,6 +485,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -500,7 +501,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -527,6 +530,7 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -542,7 +546,9 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -569,6 +575,7 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -584,7 +591,9 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
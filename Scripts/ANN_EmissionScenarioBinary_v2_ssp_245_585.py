@@ -456,6 +456,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -471,7 +472,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -499,6 +502,7 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -514,7 +518,9 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -542,6 +548,7 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -557,7 +564,9 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -586,6 +595,7 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -603,7 +613,9 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -629,6 +641,7 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -646,7 +659,9 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -672,6 +687,7 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -689,7 +705,9 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
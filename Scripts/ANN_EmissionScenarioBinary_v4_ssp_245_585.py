@@ -14,6 +14,7 @@ import cmasher as cmr
 import numpy as np
 import calc_Utilities as UT
 import calc_dataFunctions as df
+import calc_Prefetch as PF
 import calc_SegmentData as FRAC
 import tensorflow as tf
 import tensorflow.keras as keras
@@ -119,9 +120,9 @@ ravelbinary = False
 ###############################################################################
 ### Read in model and observational/reanalysis data
 def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds):
-    data,lats,lons = df.readFiles(variq,dataset,monthlychoice,scenario)
-    datar,lats,lons = df.getRegion(data,lats,lons,lat_bounds,lon_bounds)
-    print('\nOur dataset: ',dataset,' is shaped',data.shape)
+    ### Only the region is read, as the prefetch memory cap assumes
+    datar,lats,lons = df.readFiles(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    print('\nOur dataset: ',dataset,' is shaped',datar.shape)
     return datar,lats,lons     
 ###############################################################################
 ###############################################################################
@@ -141,11 +142,12 @@ if ensTypeExperi == 'ENS':
 ###############################################################################
 ###############################################################################
 ### Read in data   
+### The next model is read while the current one is stored (see calc_Prefetch)
+requests = [(variq,modelGCMs[no],monthlychoice,scenarioall[no],lat_bounds,lon_bounds)
+            for no in range(len(modelGCMs))]
 data_all = []
-for no in range(len(modelGCMs)):
-    dataset = modelGCMs[no]
-    scenario = scenarioall[no]
-    data_allq,lats,lons = read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+for request,(data_allq,lats,lons) in PF.prefetchFiles(requests,read_primary_dataset):
+    dataset,scenario = request[1],request[3]
     data_all.append(data_allq)
 data = np.asarray(data_all)
 
@@ -511,6 +513,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -526,7 +529,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -554,6 +559,7 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -569,7 +575,9 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -597,6 +605,7 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -612,7 +621,9 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -641,6 +652,7 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -658,7 +670,9 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -684,6 +698,7 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -701,7 +716,9 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -727,6 +744,7 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -744,7 +762,9 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -501,6 +501,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -516,7 +517,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -543,6 +546,7 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -558,7 +562,9 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -585,6 +591,7 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -600,7 +607,9 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -130,6 +130,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -145,7 +146,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -170,6 +173,7 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -185,7 +189,9 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
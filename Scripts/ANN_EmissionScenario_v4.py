@@ -14,6 +14,9 @@ import cmasher as cmr
 import numpy as np
 import calc_Utilities as UT
 import calc_dataFunctions as df
+import calc_ReadUtilities as RU
+import calc_Prefetch as PF
+import calc_ArrayExport as AE
 import calc_SegmentData as FRAC
 import tensorflow as tf
 import tensorflow.keras as keras
@@ -119,10 +122,11 @@ ravelbinary = False
 ###############################################################################
 ### Read in model and observational/reanalysis data
 def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds):
-    data,lats,lons = df.readFiles(variq,dataset,monthlychoice,scenario)
-    datar,lats,lons = df.getRegion(data,lats,lons,lat_bounds,lon_bounds)
-    print('\nOur dataset: ',dataset,' is shaped',data.shape)
-    return datar,lats,lons     
+    ### Only the region is read, as the prefetch memory cap assumes
+    datar,lats,lons = df.readFiles(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    filenames = list(RU.READFILES)
+    print('\nOur dataset: ',dataset,' is shaped',datar.shape)
+    return datar,lats,lons,filenames     
 ###############################################################################
 ###############################################################################
 ###############################################################################
@@ -139,19 +143,32 @@ if ensTypeExperi == 'ENS':
 ###############################################################################
 ###############################################################################
 ###############################################################################
-### Read in data   
-data_all = []
-for no in range(len(modelGCMs)):
-    dataset = modelGCMs[no]
-    scenario = scenarioall[no]
-    data_allq,lats,lons = read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
-    data_all.append(data_allq)
-data = np.asarray(data_all)
-
-### Fix missing values for snow depth
-if any([variq=='SNOW']):
-    data[np.where(data < 0.)] = 0.
-    print('\n\n\n\n\n\n--THE VARIABLE IS SNOW NEGATIVE SNOW DEPTH!--\n\n\n\n\n\n')
+### Read in data (or the memory-mapped copy exported by an earlier job,
+### set AE.setExportDirectory(directoryoutput + 'Exports/') to share it)
+exportname = AE.getExportName(variq,modelGCMs,monthlychoice,scenarioall,reg_name)
+exported = AE.loadArray(exportname)
+if exported is None:
+    ### The next model is read while the current one is stored (see calc_Prefetch)
+    requests = [(variq,modelGCMs[no],monthlychoice,scenarioall[no],lat_bounds,lon_bounds)
+                for no in range(len(modelGCMs))]
+    data_all = []
+    filenames_all = []
+    for request,(data_allq,lats,lons,filenames) in PF.prefetchFiles(requests,read_primary_dataset):
+        dataset,scenario = request[1],request[3]
+        data_all.append(data_allq)
+        filenames_all.extend(filenames)
+    data = np.asarray(data_all)
+    
+    ### Fix missing values for snow depth
+    if any([variq=='SNOW']):
+        data[np.where(data < 0.)] = 0.
+        print('\n\n\n\n\n\n--THE VARIABLE IS SNOW NEGATIVE SNOW DEPTH!--\n\n\n\n\n\n')
+    AE.exportArray(data,lats,lons,yearsall[0],exportname,filenames_all)
+else:
+    data,lats,lons = exported[:3]
+    
+    ### Last model read, same as after the read loop above
+    dataset,scenario = modelGCMs[-1],scenarioall[-1]
 
 ###############################################################################
 ###############################################################################
@@ -319,7 +336,7 @@ ypred_pickval = np.argmax(ypred_val,axis=1)
 ###############################################################
 ###############################################################
 ### Read in observations (standardize by training mean)
-data_obs,lats_obs,lons_obs = read_primary_dataset(variq,dataset_obs,monthlychoice,scenario,lat_bounds,lon_bounds)
+data_obs,lats_obs,lons_obs,filenames_obs = read_primary_dataset(variq,dataset_obs,monthlychoice,scenario,lat_bounds,lon_bounds)
 
 ### Standardize obs
 Xobs = data_obs.reshape(data_obs.shape[0],data_obs.shape[1]*data_obs.shape[2])
@@ -468,6 +485,7 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -483,7 +501,9 @@ def netcdfLRPz(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -511,6 +531,7 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -526,7 +547,9 @@ def netcdfLRPe(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -554,6 +577,7 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -569,7 +593,9 @@ def netcdfLRPig(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -598,6 +624,7 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_Z' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -615,7 +642,9 @@ def netcdfLRPz_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -641,6 +670,7 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_E' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -658,7 +688,9 @@ def netcdfLRPe_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -684,6 +716,7 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     
     from netCDF4 import Dataset
     import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'LRP/LRPMap_IG' + typemodel + '_' + savename + '.nc'
     filename = directory + name
@@ -701,7 +734,9 @@ def netcdfLRPig_OS(lats,lons,var,directory,typemodel,savename):
     years = ncfile.createVariable('years','f4',('years'))
     latitude = ncfile.createVariable('lat','f4',('lat'))
     longitude = ncfile.createVariable('lon','f4',('lon'))
-    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'))
+    varns = ncfile.createVariable('LRP','f4',('ensembles','years','lat','lon'),
+                                  chunksizes=CO.getChunks(var.shape,4),
+                                  **CO.COMPRESSION)
     
     ### Units
     varns.units = 'unitless relevance'
@@ -7,6 +7,7 @@ Date      : 19 July 2023
 
 import matplotlib.pyplot as plt
 import calc_Utilities as UT
+import calc_Extremes as XT
 import xarray as xr
 import numpy as np
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
@@ -100,21 +101,10 @@ clim = datamask[:,baseq,:,:,:]
 climdist = clim.reshape(ENS,len(baseline)*dayslength,latus1.shape[0],lonus1.shape[0])
 
 ### Calculate heat extremes
-tx90 = np.nanpercentile(climdist,90,axis=1)
-tx95 = np.nanpercentile(climdist,95,axis=1)
+tx90,tx95 = XT.calcPercentiles(climdist,[90,95])
 
 ### Frequency of heat extremes
-count = np.empty((ENS,len(years),latus1.shape[0],lonus1.shape[0]))
-for ens in range(ENS):
-    for i in range(latus1.shape[0]):
-        for j in range(lonus1.shape[0]):
-            for yr in range(years.shape[0]):
-                summerens = datamask[ens,yr,:,i,j]
-                
-                if np.isfinite(np.nanmax(summerens)):
-                    count[ens,yr,i,j] = (summerens > tx90[ens,i,j]).sum() 
-                else:
-                    count[ens,yr,i,j] = np.nan
+count = XT.countExceedances(datamask,[tx90],above=True)[0]
 
 
 executionTime = (time.time() - startTime)
@@ -7,6 +7,8 @@ Date      : 21 July 2023
 
 import matplotlib.pyplot as plt
 import calc_Utilities as UT
+import calc_DailyExtract as DX
+import calc_Extremes as XT
 import xarray as xr
 import numpy as np
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
@@ -14,7 +16,6 @@ import cmocean
 import os, glob
 import calc_Stats as dSS
 import sys
-from netCDF4 import Dataset
 
 import time
 startTime = time.time()
@@ -66,26 +67,15 @@ def readData(model,reg_name):
     elif reg_name == 'Globe':
         daysall = np.empty((ENS,years.shape[0],dayslength,360,576))
     for e in range(ENS):
-        data = Dataset(directorydata + 'June/June_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        lat = data.variables['lat'][:]
-        lon = data.variables['lon'][:]
-        june = data.variables['%s' % variq][:].reshape(len(years),len(junedays),lat.shape[0],lon.shape[0])
-        data.close()
-        
-        data2 = Dataset(directorydata + 'July/July_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        july = data2.variables['%s' % variq][:].reshape(len(years),len(julydays),lat.shape[0],lon.shape[0])
-        data2.close()
-
-        data3 = Dataset(directorydata + 'August/August_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        august = data3.variables['%s' % variq][:].reshape(len(years),len(augustdays),lat.shape[0],lon.shape[0])
-        data3.close()        
+        lat,lon,summer = DX.readSummer(directorydata,vari,variq,reg_name,model,e+1,
+                                       len(years),[len(junedays),len(julydays),len(augustdays)])
 
         ### Convert units if needed
         if any([vari == 'T2M',vari == 'TMAX',vari == 'TMIN']):
-            daysall[e,:,:,:,:] = np.concatenate([june,july,august],axis=1) - 273.15 # K to C
+            daysall[e,:,:,:,:] = summer - 273.15 # K to C
             print('Completed: Changed units (K to C)!')
         else:
-            daysall[e,:,:,:,:] = np.concatenate([june,july,august],axis=1)
+            daysall[e,:,:,:,:] = summer
             
     ### Meshgrid and mask by CONUS
     lon2,lat2 = np.meshgrid(lon,lat)
@@ -134,48 +124,10 @@ def calc_heatExtremes(datamask,model,lat,lon,baselineanom):
         climdist = baselineanom
     
     ### Calculate heat extremes
-    tx90 = np.nanpercentile(climdist,90,axis=1)
-    tx95 = np.nanpercentile(climdist,95,axis=1)
-    tx99 = np.nanpercentile(climdist,99,axis=1)
+    tx90,tx95,tx99 = XT.calcPercentiles(climdist,[90,95,99])
     
-    ### Count of heat extremes for 90th percentile
-    count90v = np.empty((ENS,len(years),lat.shape[0],lon.shape[0]))
-    for ens in range(ENS):
-        for i in range(lat.shape[0]):
-            for j in range(lon.shape[0]):
-                for yr in range(years.shape[0]):
-                    summerens = datamask[ens,yr,:,i,j]
-                    
-                    if np.isfinite(np.nanmax(summerens)):
-                        count90v[ens,yr,i,j] = (summerens > tx90[ens,i,j]).sum() 
-                    else:
-                        count90v[ens,yr,i,j] = np.nan
-                        
-    ### Count of heat extremes for 95th percentile
-    count95v = np.empty((ENS,len(years),lat.shape[0],lon.shape[0]))
-    for ens in range(ENS):
-        for i in range(lat.shape[0]):
-            for j in range(lon.shape[0]):
-                for yr in range(years.shape[0]):
-                    summerens = datamask[ens,yr,:,i,j]
-                    
-                    if np.isfinite(np.nanmax(summerens)):
-                        count95v[ens,yr,i,j] = (summerens > tx95[ens,i,j]).sum() 
-                    else:
-                        count95v[ens,yr,i,j] = np.nan
-                        
-    ### Count of heat extremes for 99th percentile
-    count99v = np.empty((ENS,len(years),lat.shape[0],lon.shape[0]))
-    for ens in range(ENS):
-        for i in range(lat.shape[0]):
-            for j in range(lon.shape[0]):
-                for yr in range(years.shape[0]):
-                    summerens = datamask[ens,yr,:,i,j]
-
-                    if np.isfinite(np.nanmax(summerens)):
-                        count99v[ens,yr,i,j] = (summerens > tx99[ens,i,j]).sum() 
-                    else:
-                        count99v[ens,yr,i,j] = np.nan
+    ### Count of heat extremes for the 90th, 95th and 99th percentiles (one pass)
+    count90v,count95v,count99v = XT.countExceedances(datamask,[tx90,tx95,tx99],above=True)
     
     ### Frequency of heat extremes
     freq90v = count90v/dayslength
@@ -184,77 +136,88 @@ def calc_heatExtremes(datamask,model,lat,lon,baselineanom):
     
     return climdist,count90v,count95v,count99v,freq90v,freq95v,freq99v
 
+def stream_heatExtremes(model,reg_name):
+    ### Baseline of the thresholds (same as calc_heatExtremes)
+    if model == 'SPEAR_MED_LM42p2_test':
+        basemodel = model
+        yearsbase = np.arange(1921,2070+1)
+    else:
+        basemodel = 'SPEAR_MED'
+        yearsbase = np.arange(1921,2100+1)
+    baseq = np.where((yearsbase >= minb) & (yearsbase <= maxb))[0]
+    
+    ### Only when both cubes were written and are up to date
+    cubefile = DX.getCube(directorydata,vari,reg_name,model)
+    basefile = DX.getCube(directorydata,vari,reg_name,basemodel)
+    if any([cubefile is None,basefile is None]):
+        return None
+    
+    ### Convert units if needed
+    if any([vari == 'T2M',vari == 'TMAX',vari == 'TMIN']):
+        offset = -273.15 # K to C
+    else:
+        offset = 0.
+    
+    ### Count of heat extremes one tile at a time
+    lat,lon,(count90v,count95v,count99v) = XT.streamExtremes(cubefile,basefile,variq,[90,95,99],
+                                                             baseq,above=True,offset=offset)
+    
+    ### Mask by CONUS
+    if reg_name == 'US':
+        data_obsnan = np.full([1,lat.shape[0],lon.shape[0]],np.nan)
+        maskus,data_obsnan = dSS.mask_CONUS(np.ones((lat.shape[0],lon.shape[0])),data_obsnan,
+                                            resolution,lat_bounds,lon_bounds)
+        for countv in [count90v,count95v,count99v]:
+            countv[:,:,np.isnan(maskus)] = np.nan
+    
+    ### Frequency of heat extremes
+    freq90v = count90v/dayslength
+    freq95v = count95v/dayslength
+    freq99v = count99v/dayslength
+    
+    return lat,lon,count90v,count95v,count99v,freq90v,freq95v,freq99v
+
 ##############################################################################
 ##############################################################################
 ##############################################################################
 def netcdfHEAT(lats,lons,count90v,count95v,count99v,freq90v,freq95v,freq99v,directory,model,reg_name,vari):
     print('\n>>> Using netcdfHEAT function!')
     
-    from netCDF4 import Dataset
-    import numpy as np
+    import calc_CompactOutput as CO
     
     name = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + vari + '_' + model + '.nc'
     filename = directory + name
-    ncfile = Dataset(filename,'w',format='NETCDF4')
-    ncfile.description = '90th, 95th, and 99th percentiles for JJA heat' 
-    
-    ### Dimensions
-    ncfile.createDimension('ensembles',count90v.shape[0])
-    ncfile.createDimension('years',count90v.shape[1])
-    ncfile.createDimension('lat',count90v.shape[2])
-    ncfile.createDimension('lon',count90v.shape[3])
-    
-    ### Variables
-    ensembles = ncfile.createVariable('ensembles','f4',('ensembles'))
-    years = ncfile.createVariable('years','f4',('years'))
-    latitude = ncfile.createVariable('lat','f4',('lat'))
-    longitude = ncfile.createVariable('lon','f4',('lon'))
-    count90n = ncfile.createVariable('count90','f4',('ensembles','years','lat','lon'))
-    count95n = ncfile.createVariable('count95','f4',('ensembles','years','lat','lon'))
-    count99n = ncfile.createVariable('count99','f4',('ensembles','years','lat','lon'))
-    freq90n = ncfile.createVariable('freq90','f4',('ensembles','years','lat','lon'))
-    freq95n = ncfile.createVariable('freq95','f4',('ensembles','years','lat','lon'))
-    freq99n = ncfile.createVariable('freq99','f4',('ensembles','years','lat','lon'))
-    
-    ### Units
-    count90n.units = 'count'
-    count95n.units = 'count'
-    freq90n.units = 'frequency'
-    freq95n.units = 'frequency'
-    ncfile.title = 'heat statistics'
-    ncfile.instituion = 'NOAA GFDL SPEAR_MED'
-    ncfile.references = 'Delworth et al. 2020'
-    
-    ### Data
-    ensembles[:] = np.arange(count90v.shape[0])
-    years[:] = np.arange(count90v.shape[1])
-    latitude[:] = lats
-    longitude[:] = lons
-    count90n[:] = count90v
-    count95n[:] = count95v
-    count99n[:] = count99v
-    freq90n[:] = freq90v
-    freq95n[:] = freq95v
-    freq99n[:] = freq99v
     
-    ncfile.close()
-    print('*Completed: Created netCDF4 File!')
+    ### Counts are stored as uint8 and the frequencies (count/dayslength)
+    ### are derived when the file is read (see calc_CompactOutput.readStat)
+    counts = {'count90' : count90v,'count95' : count95v,'count99' : count99v}
+    CO.writeStats(filename,lats,lons,counts,dayslength,
+                  '90th, 95th, and 99th percentiles for JJA heat','heat statistics',
+                  'NOAA GFDL SPEAR_MED','Delworth et al. 2020')
 
-# summer_LM42p2_test,lat,lon,years_LM42p2_test = readData('SPEAR_MED_LM42p2_test',reg_name)
-summer_osSSP245,lat,lon,years_osSSP245 = readData('SPEAR_MED_SSP245',reg_name)
-# summer_osAMOC2,lat,lon,years_osAMOC2 = readData('SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',reg_name)
-# summer_osAMOC,lat,lon,years_osAMOC = readData('SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv',reg_name)
-# summer_os10ye,lat,lon,years_os10ye = readData('SPEAR_MED_SSP534OS_10ye',reg_name)
-# summer_os,lat,lon,years_os = readData('SPEAR_MED_SSP534OS',reg_name)
-summer,lat,lon,years = readData('SPEAR_MED',reg_name)
+### Stream the daily cubes one tile at a time when they are up to date (--cube
+### in read_DailyData_SPEAR.py), or else read all members into memory
+streamedsp = stream_heatExtremes('SPEAR_MED',reg_name)
+streamed_osSSP245 = stream_heatExtremes('SPEAR_MED_SSP245',reg_name)
+if all([streamedsp is not None,streamed_osSSP245 is not None]):
+    lat,lon,count90sp,count95sp,count99sp,freq90sp,freq95sp,freq99sp = streamedsp
+    lat,lon,count90_osSSP245,count95_osSSP245,count99_osSSP245,freq90_osSSP245,freq95_osSSP245,freq99_osSSP245 = streamed_osSSP245
+else:
+    # summer_LM42p2_test,lat,lon,years_LM42p2_test = readData('SPEAR_MED_LM42p2_test',reg_name)
+    summer_osSSP245,lat,lon,years_osSSP245 = readData('SPEAR_MED_SSP245',reg_name)
+    # summer_osAMOC2,lat,lon,years_osAMOC2 = readData('SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',reg_name)
+    # summer_osAMOC,lat,lon,years_osAMOC = readData('SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv',reg_name)
+    # summer_os10ye,lat,lon,years_os10ye = readData('SPEAR_MED_SSP534OS_10ye',reg_name)
+    # summer_os,lat,lon,years_os = readData('SPEAR_MED_SSP534OS',reg_name)
+    summer,lat,lon,years = readData('SPEAR_MED',reg_name)
 
-climdist,count90sp,count95sp,count99sp,freq90sp,freq95sp,freq99sp = calc_heatExtremes(summer,'SPEAR_MED',lat,lon,np.nan)
-# climdist_os10ye,count90_os10ye,count95_os10ye,count99_os10ye,freq90_os10ye,freq95_os10ye,freq99_os10ye = calc_heatExtremes(summer_os10ye,'SPEAR_MED_SSP534OS_10ye',lat,lon,climdist)
-# climdist_os,count90_os,count95_os,count99_os,freq90_os,freq95_os,freq99_os = calc_heatExtremes(summer_os,'SPEAR_MED_SSP534OS',lat,lon,climdist)
-# climdist_osAMOC,count90_osAMOC,count95_osAMOC,count99_osAMOC,freq90_osAMOC,freq95_osAMOC,freq99_osAMOC = calc_heatExtremes(summer_osAMOC,'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv',lat,lon,climdist)
-# climdist_osAMOC2,count90_osAMOC2,count95_osAMOC2,count99_osAMOC2,freq90_osAMOC2,freq95_osAMOC2,freq99_osAMOC2 = calc_heatExtremes(summer_osAMOC2,'SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',lat,lon,climdist)
-climdist_osSSP245,count90_osSSP245,count95_osSSP245,count99_osSSP245,freq90_osSSP245,freq95_osSSP245,freq99_osSSP245 = calc_heatExtremes(summer_osSSP245,'SPEAR_MED_SSP245',lat,lon,climdist)
-# climdist_LM42p2_test,count90_LM42p2_test,count95_LM42p2_test,count99_LM42p2_test,freq90_LM42p2_test,freq95_LM42p2_test,freq99_LM42p2_test = calc_heatExtremes(summer_LM42p2_test,'SPEAR_MED_LM42p2_test',lat,lon,np.nan)
+    climdist,count90sp,count95sp,count99sp,freq90sp,freq95sp,freq99sp = calc_heatExtremes(summer,'SPEAR_MED',lat,lon,np.nan)
+    # climdist_os10ye,count90_os10ye,count95_os10ye,count99_os10ye,freq90_os10ye,freq95_os10ye,freq99_os10ye = calc_heatExtremes(summer_os10ye,'SPEAR_MED_SSP534OS_10ye',lat,lon,climdist)
+    # climdist_os,count90_os,count95_os,count99_os,freq90_os,freq95_os,freq99_os = calc_heatExtremes(summer_os,'SPEAR_MED_SSP534OS',lat,lon,climdist)
+    # climdist_osAMOC,count90_osAMOC,count95_osAMOC,count99_osAMOC,freq90_osAMOC,freq95_osAMOC,freq99_osAMOC = calc_heatExtremes(summer_osAMOC,'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv',lat,lon,climdist)
+    # climdist_osAMOC2,count90_osAMOC2,count95_osAMOC2,count99_osAMOC2,freq90_osAMOC2,freq95_osAMOC2,freq99_osAMOC2 = calc_heatExtremes(summer_osAMOC2,'SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',lat,lon,climdist)
+    climdist_osSSP245,count90_osSSP245,count95_osSSP245,count99_osSSP245,freq90_osSSP245,freq95_osSSP245,freq99_osSSP245 = calc_heatExtremes(summer_osSSP245,'SPEAR_MED_SSP245',lat,lon,climdist)
+    # climdist_LM42p2_test,count90_LM42p2_test,count95_LM42p2_test,count99_LM42p2_test,freq90_LM42p2_test,freq95_LM42p2_test,freq99_LM42p2_test = calc_heatExtremes(summer_LM42p2_test,'SPEAR_MED_LM42p2_test',lat,lon,np.nan)
 
 ### Save data
 # netcdfHEAT(lat,lon,count90sp,count95sp,count99sp,freq90sp,freq95sp,freq99sp,directorydata,'SPEAR_MED',reg_name,vari)
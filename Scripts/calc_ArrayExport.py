@@ -0,0 +1,245 @@
+"""
+Functions export processed arrays (e.g., [model,ens,year,lat,lon] from
+readFiles) as raw .npy files with a lat/lon/years sidecar, and load them
+memory-mapped, so many jobs on one machine share one page-cached copy of the
+array instead of each building its own. The modification time and size of
+the netCDF files the array was built of are kept with it, and an export of
+changed files is built again (same as calc_ReadCache)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setExportDirectory(directory)
+    [2] getExportName(variq,datasets,monthlychoice,scenarios,reg_name)
+    [3] exportArray(data,lat1,lon1,years,exportname,filenames)
+    [4] loadArray(exportname,mmap_mode)
+"""
+
+### Directory of the exported arrays and None to switch them off
+### (see setExportDirectory)
+EXPORTDIRECTORY = None
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setExportDirectory(directory):
+    """
+    Function sets where the exported arrays are kept (None to switch off)
+
+    Parameters
+    ----------
+    directory : string or None
+        directory of the exported arrays and None for no exports
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setExportDirectory(directory)
+    """
+    global EXPORTDIRECTORY
+
+    ### Import modules
+    import os
+
+    if directory is None:
+        EXPORTDIRECTORY = None
+        print('Exported arrays are OFF!')
+    else:
+        os.makedirs(directory,exist_ok=True)
+        EXPORTDIRECTORY = directory
+        print('Exported arrays are ON ---> %s' % EXPORTDIRECTORY)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getExportName(variq,datasets,monthlychoice,scenarios,reg_name):
+    """
+    Function makes the name of an exported array from what it was built of
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    datasets : list of strings
+        data sets stacked in the array (in order)
+    monthlychoice : string
+        time period of analysis
+    scenarios : list of strings
+        scenario of each data set
+    reg_name : string
+        name of the region
+
+    Returns
+    -------
+    exportname : string
+        variable, season, region and a short sha1 of the data sets
+
+    Usage
+    -----
+    exportname = getExportName(variq,datasets,monthlychoice,scenarios,reg_name)
+    """
+
+    ### Import modules
+    import hashlib
+    import calc_ReadUtilities as RU
+    import calc_ReadCache as RC
+
+    request = repr((list(datasets),list(scenarios),RC.READERVERSION,
+                    str(RU.READDTYPE)))
+    key = hashlib.sha1(request.encode('utf-8')).hexdigest()[:12]
+    exportname = '%s_%s_%s_%s' % (variq,monthlychoice,reg_name,key)
+    return exportname
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def exportArray(data,lat1,lon1,years,exportname,filenames=None):
+    """
+    Function writes an array as raw .npy, the stats of its source files and
+    its lat/lon/years as a sidecar. The sidecar is written last, so loadArray
+    never sees a half-written export
+
+    Parameters
+    ----------
+    data : numpy array
+        processed array (e.g., [model,ens,year,lat,lon])
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    years : 1d numpy array
+        years
+    exportname : string
+        name of the export (see getExportName)
+    filenames : list of strings or None
+        netCDF files the array was built of (e.g., RU.READFILES of the reads)
+        and None for an export that is never out of date
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    exportArray(data,lat1,lon1,years,exportname,filenames)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import calc_ReadCache as RC
+
+    if EXPORTDIRECTORY is None:
+        return
+
+    if filenames is None:
+        sources = []
+    else:
+        sources = RC.getFileStats(filenames)
+        if not sources:
+            print('Export %s has no source files to check, not exported!' % exportname)
+            return
+
+    filedata = os.path.join(EXPORTDIRECTORY,exportname + '.npy')
+    filesources = os.path.join(EXPORTDIRECTORY,exportname + '_sources.json')
+    filesidecar = os.path.join(EXPORTDIRECTORY,exportname + '_coords.npz')
+    if os.path.exists(filesidecar):
+        os.remove(filesidecar)
+
+    ### Write into temporary files and rename them in place
+    with open(filedata + '.tmp','wb') as fileq:
+        np.save(fileq,np.ascontiguousarray(np.ma.getdata(data)))
+    os.replace(filedata + '.tmp',filedata)
+    with open(filesources + '.tmp','w') as fileq:
+        json.dump(sources,fileq)
+    os.replace(filesources + '.tmp',filesources)
+    with open(filesidecar + '.tmp','wb') as fileq:
+        np.savez(fileq,lat=np.ma.getdata(lat1),lon=np.ma.getdata(lon1),
+                 years=np.asarray(years),shape=np.asarray(np.shape(data)))
+    os.replace(filesidecar + '.tmp',filesidecar)
+    print('Completed: exported %s %s ---> %s' % (exportname,np.shape(data),filedata))
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def loadArray(exportname,mmap_mode='r'):
+    """
+    Function loads an exported array memory-mapped if its source files are
+    unchanged
+
+    Parameters
+    ----------
+    exportname : string
+        name of the export (see getExportName)
+    mmap_mode : string or None
+        'r' (read-only and shared), 'c' (copy-on-write) or None to read the
+        whole array into memory
+
+    Returns
+    -------
+    exported : tuple or None
+        (data,lat1,lon1,years) and None when there is no (valid) export
+
+    Usage
+    -----
+    exported = loadArray(exportname,mmap_mode)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import calc_ReadCache as RC
+
+    if EXPORTDIRECTORY is None:
+        return None
+
+    filedata = os.path.join(EXPORTDIRECTORY,exportname + '.npy')
+    filesources = os.path.join(EXPORTDIRECTORY,exportname + '_sources.json')
+    filesidecar = os.path.join(EXPORTDIRECTORY,exportname + '_coords.npz')
+    if not all([os.path.exists(filedata),os.path.exists(filesidecar)]):
+        return None
+    try:
+        with open(filesources,'r') as fileq:
+            sources = json.load(fileq)
+    except (OSError,ValueError):
+        return None
+
+    ### Any change to the source files makes the export stale
+    if sources and RC.getFileStats([filestat[0] for filestat in sources]) != sources:
+        print('Export %s is out of date!' % exportname)
+        return None
+
+    with np.load(filesidecar) as sidecar:
+        lat1 = sidecar['lat']
+        lon1 = sidecar['lon']
+        years = sidecar['years']
+        shape = tuple(sidecar['shape'])
+    data = np.load(filedata,mmap_mode=mmap_mode)
+    if data.shape != shape:
+        print('Export %s does not match its sidecar!' % exportname)
+        return None
+    print('Completed: loaded %s %s (mmap_mode=%s)' % (exportname,data.shape,mmap_mode))
+    return data,lat1,lon1,years
+
+# ### Test functions - do not use!
+# import numpy as np
+# import calc_ArrayExport as AE
+# import calc_ReadUtilities as RU
+# AE.setExportDirectory('/work/Zachary.Labe/Data/Exports/')
+# exportname = AE.getExportName('T2M',['SPEAR_MED'],'annual',['SSP585'],'Globe')
+# AE.exportArray(np.zeros((1,30,86,10,20)),np.arange(10),np.arange(20),
+#                np.arange(2015,2100+1),exportname,RU.READFILES)
+# data,lat1,lon1,years = AE.loadArray(exportname)
@@ -0,0 +1,487 @@
+"""
+Functions build and query an SQLite catalog of the netCDF archive. The
+catalog records the variable, member, years, shape, data type, fill value
+and checksum of each file, so a request (missing or short members) can be
+checked before reading any data. The readers still build their own file
+names and only check them (checkFiles); findFiles is for looking up what
+is in the archive
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setCatalogFile(catalogfile)
+    [2] connectCatalog()
+    [3] parseFilename(filename)
+    [4] getChecksum(filename)
+    [5] scanFile(filename,checksum)
+    [6] buildCatalog(directory,checksum)
+    [7] getRecord(filename)
+    [8] findFiles(directory,vari,members,period)
+    [9] checkFiles(filenames,vari,numOfTime,pad)
+"""
+
+### SQLite file of the catalog and None to switch it off (see setCatalogFile)
+CATALOGFILE = None
+
+### Columns of each file in the catalog
+CATALOGCOLUMNS = ('filename','directory','vari','member','yrmin','yrmax','ntime',
+                  'shape','dtype','fillvalue','variables','mtime','size','checksum')
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setCatalogFile(catalogfile):
+    """
+    Function sets the catalog used by the readers (None to switch it off)
+
+    Parameters
+    ----------
+    catalogfile : string or None
+        path of the SQLite file and None for no catalog
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setCatalogFile(catalogfile)
+    """
+    global CATALOGFILE
+
+    CATALOGFILE = catalogfile
+    if CATALOGFILE is None:
+        print('Catalog of the archive is OFF!')
+    else:
+        print('Catalog of the archive is ON ---> %s' % CATALOGFILE)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def connectCatalog():
+    """
+    Function opens the catalog and creates its table if it is new
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    catalog : sqlite3.Connection
+        open catalog (close it when done)
+
+    Usage
+    -----
+    catalog = connectCatalog()
+    """
+
+    ### Import modules
+    import sqlite3
+    import sys
+
+    if CATALOGFILE is None:
+        print(ValueError('SET THE CATALOG FILE FIRST (setCatalogFile)!!!'))
+        sys.exit()
+
+    catalog = sqlite3.connect(CATALOGFILE)
+    catalog.execute('CREATE TABLE IF NOT EXISTS files ('
+                    'filename TEXT PRIMARY KEY,directory TEXT,vari TEXT,'
+                    'member INTEGER,yrmin INTEGER,yrmax INTEGER,ntime INTEGER,'
+                    'shape TEXT,dtype TEXT,fillvalue REAL,variables TEXT,'
+                    'mtime INTEGER,size INTEGER,checksum TEXT)')
+    catalog.execute('CREATE INDEX IF NOT EXISTS filesvari ON files '
+                    '(directory,vari,member)')
+    return catalog
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def parseFilename(filename):
+    """
+    Function gets the variable, member and years from the name of a file
+    (vari_01_1921-2010.nc for members and vari_1979-2021.nc for observations)
+
+    Parameters
+    ----------
+    filename : string
+        path of the netCDF file
+
+    Returns
+    -------
+    vari : string or None
+        variable in the name of the file
+    member : integer or None
+        ensemble member and None for observations
+    yrmin : integer or None
+        first year
+    yrmax : integer or None
+        last year
+
+    Usage
+    -----
+    vari,member,yrmin,yrmax = parseFilename(filename)
+    """
+
+    ### Import modules
+    import os
+    import re
+
+    name = os.path.basename(filename)
+    found = re.match(r'^(.+?)_(\d{2,3})_(\d{4})-(\d{4})\.nc$',name)
+    if found is not None:
+        return found.group(1),int(found.group(2)),int(found.group(3)),int(found.group(4))
+    found = re.match(r'^(.+?)_(\d{4})-(\d{4})\.nc$',name)
+    if found is not None:
+        return found.group(1),None,int(found.group(2)),int(found.group(3))
+    return None,None,None,None
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getChecksum(filename):
+    """
+    Function calculates the sha1 of a file in blocks of 16 MB
+
+    Parameters
+    ----------
+    filename : string
+        path of the file
+
+    Returns
+    -------
+    checksum : string
+        sha1 of the file
+
+    Usage
+    -----
+    checksum = getChecksum(filename)
+    """
+
+    ### Import modules
+    import hashlib
+
+    sha = hashlib.sha1()
+    with open(filename,'rb') as fileq:
+        for block in iter(lambda: fileq.read(2**24),b''):
+            sha.update(block)
+    checksum = sha.hexdigest()
+    return checksum
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def scanFile(filename,checksum=True):
+    """
+    Function reads the header of one netCDF file into a catalog record
+
+    Parameters
+    ----------
+    filename : string
+        path of the netCDF file
+    checksum : boolean
+        True to calculate the sha1 of the file (reads the whole file)
+
+    Returns
+    -------
+    record : dictionary
+        value of each column in CATALOGCOLUMNS
+
+    Usage
+    -----
+    record = scanFile(filename,checksum)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    from netCDF4 import Dataset
+
+    vari,member,yrmin,yrmax = parseFilename(filename)
+    info = os.stat(filename)
+
+    data = Dataset(filename,'r')
+    variables = list(data.variables)
+    if vari not in data.variables:
+        ### Use the variable with the most dimensions
+        vari = max(variables,key=lambda name: data.variables[name].ndim)
+    ncvar = data.variables[vari]
+    shape = list(ncvar.shape)
+    if hasattr(ncvar,'scale_factor'):
+        dtype = np.asarray(ncvar.scale_factor).dtype
+    else:
+        dtype = ncvar.dtype
+    if hasattr(ncvar,'_FillValue'):
+        fillvalue = float(np.asarray(ncvar._FillValue))
+    elif hasattr(ncvar,'missing_value'):
+        fillvalue = float(np.ravel(ncvar.missing_value)[0])
+    else:
+        fillvalue = None
+    data.close()
+
+    record = {'filename' : os.path.abspath(filename),
+              'directory' : os.path.dirname(os.path.abspath(filename)),
+              'vari' : vari,'member' : member,'yrmin' : yrmin,'yrmax' : yrmax,
+              'ntime' : shape[0] if len(shape) > 0 else 0,
+              'shape' : json.dumps(shape),'dtype' : str(dtype),
+              'fillvalue' : fillvalue,'variables' : json.dumps(variables),
+              'mtime' : info.st_mtime_ns,'size' : info.st_size,
+              'checksum' : getChecksum(filename) if checksum else None}
+    return record
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def buildCatalog(directory,checksum=True):
+    """
+    Function scans all netCDF files under a directory into the catalog. Files
+    that are unchanged (same modification time and size) are not read again
+    and files that were deleted are removed from the catalog
+
+    Parameters
+    ----------
+    directory : string
+        top directory of the archive to scan
+    checksum : boolean
+        True to calculate the sha1 of new or changed files
+
+    Returns
+    -------
+    numOfFiles : integer
+        number of files in the catalog under directory
+
+    Usage
+    -----
+    numOfFiles = buildCatalog(directory,checksum)
+    """
+    print('\n>>>>>>>>>> STARTING buildCatalog function!')
+
+    ### Import modules
+    import os
+
+    directory = os.path.abspath(directory)
+    
+    ### Rows under the directory (an exact prefix, since LIKE treats _ as a
+    ### wildcard and ignores case)
+    prefix = directory + os.sep
+    catalog = connectCatalog()
+    known = {filename : (mtime,size) for filename,mtime,size in
+             catalog.execute('SELECT filename,mtime,size FROM files WHERE '
+                             'substr(filename,1,?) = ?',(len(prefix),prefix))}
+
+    found = set()
+    numOfScan = 0
+    for root,dirs,files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith('.nc'):
+                continue
+            filename = os.path.join(root,name)
+            found.add(filename)
+            info = os.stat(filename)
+            if known.get(filename) == (info.st_mtime_ns,info.st_size):
+                continue
+            try:
+                record = scanFile(filename,checksum)
+            except OSError:
+                print('Completed: skipped unreadable file %s' % filename)
+                continue
+            catalog.execute('INSERT OR REPLACE INTO files VALUES (%s)' %
+                            ','.join(['?']*len(CATALOGCOLUMNS)),
+                            [record[column] for column in CATALOGCOLUMNS])
+            numOfScan += 1
+
+    ### Files that are gone from the archive
+    removed = [(filename,) for filename in known if filename not in found]
+    catalog.executemany('DELETE FROM files WHERE filename = ?',removed)
+    catalog.commit()
+    numOfFiles = catalog.execute('SELECT COUNT(*) FROM files WHERE substr(filename,1,?) = ?',
+                                 (len(prefix),prefix)).fetchone()[0]
+    catalog.close()
+
+    print('Completed: scanned %s files and removed %s files' % (numOfScan,
+                                                                len(removed)))
+    print('>>>>>>>>>> ENDING buildCatalog function ---> %s files' % numOfFiles)
+    return numOfFiles
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getRecord(filename):
+    """
+    Function returns the catalog record of one file
+
+    Parameters
+    ----------
+    filename : string
+        path of the netCDF file
+
+    Returns
+    -------
+    record : dictionary or None
+        value of each column in CATALOGCOLUMNS and None if it is not in the
+        catalog
+
+    Usage
+    -----
+    record = getRecord(filename)
+    """
+
+    ### Import modules
+    import os
+
+    catalog = connectCatalog()
+    row = catalog.execute('SELECT * FROM files WHERE filename = ?',
+                          (os.path.abspath(filename),)).fetchone()
+    catalog.close()
+    if row is None:
+        return None
+    record = dict(zip(CATALOGCOLUMNS,row))
+    return record
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def findFiles(directory,vari,members=None,period=None):
+    """
+    Function finds the files of a variable in a directory of the archive
+
+    Parameters
+    ----------
+    directory : string
+        directory of the files (e.g., directory + vari for SPEAR)
+    vari : string
+        variable for analysis
+    members : list of integers or None
+        ensemble members and None for all members
+    period : 2 integers or None
+        (yrmin,yrmax) of the files and None for all periods
+
+    Returns
+    -------
+    filenames : list of strings
+        files ordered by member and first year
+
+    Usage
+    -----
+    filenames = findFiles(directory,vari,members,period)
+    """
+
+    ### Import modules
+    import os
+
+    query = 'SELECT filename FROM files WHERE directory = ? AND vari = ?'
+    values = [os.path.abspath(directory),vari]
+    if members is not None:
+        query += ' AND member IN (%s)' % ','.join(['?']*len(members))
+        values += [int(member) for member in members]
+    if period is not None:
+        query += ' AND yrmin = ? AND yrmax = ?'
+        values += [int(period[0]),int(period[1])]
+    query += ' ORDER BY member,yrmin'
+
+    catalog = connectCatalog()
+    filenames = [row[0] for row in catalog.execute(query,values)]
+    catalog.close()
+    return filenames
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def checkFiles(filenames,vari,numOfTime=None,pad=False):
+    """
+    Function checks a request against the catalog before any data are read.
+    Every file has to be in the catalog and unchanged, have the variable and
+    the same grid, and have at least numOfTime time steps
+
+    Parameters
+    ----------
+    filenames : list of strings
+        netCDF files of the request
+    vari : string
+        variable for analysis
+    numOfTime : integer, list of integers or None
+        time steps needed from each file (one for all files or one per file)
+        and None for no check
+    pad : boolean
+        True if the reader pads short files with nan (only print them)
+
+    Returns
+    -------
+    records : list of dictionaries
+        catalog record of each file
+
+    Usage
+    -----
+    records = checkFiles(filenames,vari,numOfTime,pad)
+    """
+
+    ### Import modules
+    import os
+    import json
+    import sys
+
+    if not isinstance(numOfTime,list):
+        numOfTime = [numOfTime]*len(filenames)
+
+    catalog = connectCatalog()
+    records = []
+    problems = []
+    for filename,ntime in zip(filenames,numOfTime):
+        row = catalog.execute('SELECT * FROM files WHERE filename = ?',
+                              (os.path.abspath(filename),)).fetchone()
+        if row is None:
+            problems.append('%s is not in the catalog' % filename)
+            continue
+        record = dict(zip(CATALOGCOLUMNS,row))
+        records.append(record)
+        try:
+            info = os.stat(filename)
+        except OSError:
+            problems.append('%s is missing' % filename)
+            continue
+        if (info.st_mtime_ns,info.st_size) != (record['mtime'],record['size']):
+            problems.append('%s changed since the catalog was built' % filename)
+        elif vari not in json.loads(record['variables']):
+            problems.append('%s has no variable %s' % (filename,vari))
+        elif json.loads(record['shape'])[1:] != json.loads(records[0]['shape'])[1:]:
+            problems.append('%s has a different grid' % filename)
+        elif ntime is not None and record['ntime'] < ntime:
+            if pad == True:
+                print('Completed: %s is short (%s of %s time steps) and is padded with nan' %
+                      (filename,record['ntime'],ntime))
+            else:
+                problems.append('%s is short (%s of %s time steps)' % (filename,
+                                                                       record['ntime'],
+                                                                       ntime))
+    catalog.close()
+
+    if len(problems) > 0:
+        for problem in problems:
+            print('Catalog: %s' % problem)
+        print(ValueError('REQUEST DOES NOT MATCH THE CATALOG!!!'))
+        sys.exit()
+    print('Completed: checked %s files against the catalog' % len(filenames))
+    return records
+
+# ### Test functions - do not use!
+# import calc_Catalog as CG
+# CG.setCatalogFile('/work/Zachary.Labe/Data/catalog.sqlite')
+# CG.buildCatalog('/work/Zachary.Labe/Data/SPEAR/SPEAR_MED/monthly/')
+# filenames = CG.findFiles('/work/Zachary.Labe/Data/SPEAR/SPEAR_MED/monthly/T2M/','T2M',
+#                          members=[1,2,3],period=(1921,2010))
+# records = CG.checkFiles(filenames,'T2M',numOfTime=1080)
@@ -0,0 +1,207 @@
+"""
+Functions write compact netCDF outputs (uint8 day counts, zlib/shuffle
+compression and chunks that match how the files are read) and read the
+statistics back as float arrays with nan, deriving the frequencies from the
+counts
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getChunks(shape,itemsize,maxbytes)
+    [2] writeStats(filename,lats,lons,counts,dayslength,description,title,institution,references)
+    [3] readStat(data,stat)
+"""
+
+### Compression of the compact outputs
+COMPRESSION = {'zlib' : True,'complevel' : 4,'shuffle' : True}
+
+### Fill value of the uint8 day counts (counts must be smaller)
+COUNTFILL = 255
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getChunks(shape,itemsize,maxbytes=2**22):
+    """
+    Function picks the chunk shape of a [...,time,lat,lon] variable. Chunks
+    hold one member and whole maps, with as many time steps as fit in
+    maxbytes, since the outputs are read as maps or whole members
+
+    Parameters
+    ----------
+    shape : tuple
+        shape of the variable (at least [time,lat,lon])
+    itemsize : integer
+        bytes of one value
+    maxbytes : integer
+        largest size of one chunk
+
+    Returns
+    -------
+    chunks : tuple
+        chunk shape
+
+    Usage
+    -----
+    chunks = getChunks(shape,itemsize,maxbytes)
+    """
+
+    mapbytes = max(int(shape[-1])*int(shape[-2])*itemsize,1)
+    numOfTime = int(max(1,min(int(shape[-3]),maxbytes//mapbytes)))
+    chunks = (1,)*(len(shape)-3) + (numOfTime,int(shape[-2]),int(shape[-1]))
+    return chunks
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def writeStats(filename,lats,lons,counts,dayslength,description,title,
+               institution,references):
+    """
+    Function writes [ens,years,lat,lon] day counts as compressed uint8 (nan is
+    stored as COUNTFILL). Frequencies are not stored, since they are the
+    counts divided by dayslength (see readStat)
+
+    Parameters
+    ----------
+    filename : string
+        path of the netCDF file
+    lats : 1d numpy array
+        latitudes
+    lons : 1d numpy array
+        longitudes
+    counts : dictionary
+        name : [ens,years,lat,lon] count array (e.g., {'count90' : count90v})
+    dayslength : integer
+        number of days in each season
+    description : string
+        description of the file
+    title : string
+        title of the file
+    institution : string
+        model or institution
+    references : string
+        references of the data
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    writeStats(filename,lats,lons,counts,dayslength,description,title,
+               institution,references)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    from netCDF4 import Dataset
+
+    if dayslength >= COUNTFILL:
+        print(ValueError('SEASON IS TOO LONG FOR UINT8 COUNTS!!!'))
+        sys.exit()
+    shape = list(counts.values())[0].shape
+
+    ncfile = Dataset(filename,'w',format='NETCDF4')
+    ncfile.description = description
+    ncfile.dayslength = dayslength
+
+    ### Dimensions
+    ncfile.createDimension('ensembles',shape[0])
+    ncfile.createDimension('years',shape[1])
+    ncfile.createDimension('lat',shape[2])
+    ncfile.createDimension('lon',shape[3])
+
+    ### Variables
+    ensembles = ncfile.createVariable('ensembles','f4',('ensembles'))
+    years = ncfile.createVariable('years','f4',('years'))
+    latitude = ncfile.createVariable('lat','f4',('lat'))
+    longitude = ncfile.createVariable('lon','f4',('lon'))
+    countsn = {}
+    for name in counts:
+        countsn[name] = ncfile.createVariable(name,'u1',('ensembles','years','lat','lon'),
+                                              fill_value=COUNTFILL,
+                                              chunksizes=getChunks(shape,1),
+                                              **COMPRESSION)
+        countsn[name].units = 'count'
+        countsn[name].set_auto_maskandscale(False)
+
+    ### Units
+    ncfile.title = title
+    ncfile.instituion = institution
+    ncfile.references = references
+
+    ### Data
+    ensembles[:] = np.arange(shape[0])
+    years[:] = np.arange(shape[1])
+    latitude[:] = lats
+    longitude[:] = lons
+    for name in counts:
+        count = np.asarray(counts[name])
+        missing = ~np.isfinite(count)
+        if np.any(count[~missing] > dayslength) or np.any(count[~missing] < 0):
+            ncfile.close()
+            print(ValueError('COUNTS OF %s ARE OUTSIDE 0-%s!!!' % (name,dayslength)))
+            sys.exit()
+        countu1 = np.where(missing,COUNTFILL,np.round(np.where(missing,0,count)))
+        countsn[name][:] = countu1.astype(np.uint8)
+
+    ncfile.close()
+    print('*Completed: Created netCDF4 File!')
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readStat(data,stat):
+    """
+    Function reads a count or frequency from a statistics file as float32
+    with nan for missing values. Frequencies are derived from the uint8
+    counts, and files written before the counts were uint8 are read as they
+    are
+
+    Parameters
+    ----------
+    data : netCDF4.Dataset
+        open statistics file (e.g., HeatStats)
+    stat : string
+        variable to read (e.g., count90 or freq90)
+
+    Returns
+    -------
+    var : numpy array
+        [ens,years,lat,lon] counts or frequencies
+
+    Usage
+    -----
+    var = readStat(data,stat)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    ### Files with float counts and frequencies
+    if stat in data.variables and data.variables[stat].dtype != np.uint8:
+        return data.variables[stat][:]
+
+    if stat.startswith('freq'):
+        countname = 'count' + stat[len('freq'):]
+    else:
+        countname = stat
+    ncvar = data.variables[countname]
+    ncvar.set_auto_maskandscale(False)
+    count = ncvar[:]
+    ncvar.set_auto_maskandscale(True)
+
+    if stat.startswith('freq'):
+        var = (count/np.float64(data.dayslength)).astype(np.float32)
+    else:
+        var = count.astype(np.float32)
+    var[count == COUNTFILL] = np.nan
+    return var
@@ -0,0 +1,681 @@
+"""
+Functions extract the days of selected months (e.g., JJA) from the raw SPEAR
+daily files. Days are selected by their integer time index from the time
+axis only, each run of days is read as one hyperslab for the region, and each
+member is written to one chunked file with all of the months. Members run in
+a process pool, and a marker is written for each finished member, so a
+stopped job only redoes the members that were not finished. The members can
+also be gathered into one cube with chunks that hold all years and days of
+a small lat/lon tile, which is read back one tile at a time. The cube is a
+second copy of the members, so it is only written on request (--cube in
+read_DailyData_SPEAR.py), and the extremes scripts stream it tile by tile
+whenever it is up to date (see calc_Extremes.streamExtremes)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getMemberFiles(directorydata,vari,variq,member)
+    [2] getTimeSlices(filename,months)
+    [3] getOutputFile(dataoutput,vari,reg_name,model,member,sliceperiod)
+    [4] extractMember(directorydata,dataoutput,vari,variq,reg_name,model,member,sliceperiod)
+    [5] extractMembers(directorydata,dataoutput,vari,variq,reg_name,model,members,sliceperiod,workers)
+    [6] readSummer(directorydata,vari,variq,reg_name,model,member,numOfYears,monthdays,latslice)
+    [7] setTileShape(tileshape)
+    [8] getCubeFile(dataoutput,vari,reg_name,model)
+    [9] getCube(dataoutput,vari,reg_name,model)
+    [10] writeCube(directorydata,vari,variq,reg_name,model,numOfMembers,numOfYears,monthdays)
+    [11] iterTiles(cubefile,variq)
+"""
+
+### Latitudes and longitudes in one chunk of the cube (see setTileShape)
+TILESHAPE = (8,8)
+
+### Largest block of one member held in memory while writing the cube
+CUBEMEMORY = 2**30
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getMemberFiles(directorydata,vari,variq,member):
+    """
+    Function returns the raw daily files of one ensemble member in order
+
+    Parameters
+    ----------
+    directorydata : string
+        daily directory of the model
+    vari : string
+        variable name for processed data
+    variq : string
+        variable name for raw SPEAR data
+    member : integer
+        ensemble member (1, 2, ...)
+
+    Returns
+    -------
+    filenames : list of strings
+        atmos_daily files sorted by date
+
+    Usage
+    -----
+    filenames = getMemberFiles(directorydata,vari,variq,member)
+    """
+
+    ### Import modules
+    import os
+    import glob
+
+    pattern = os.path.join(directorydata,'%s/raw/raw_%s/atmos_daily.*.%s.nc' % (vari,member,variq))
+    filenames = sorted(glob.glob(pattern))
+    return filenames
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getTimeSlices(filename,months):
+    """
+    Function finds the days of the selected months in a daily file from its
+    time axis only
+
+    Parameters
+    ----------
+    filename : string
+        daily netCDF file
+    months : list of integers
+        month indices (0 = January, see calc_ReadUtilities.getMonthIndices)
+
+    Returns
+    -------
+    timeslices : list of slices
+        one slice for each run of consecutive days
+
+    Usage
+    -----
+    timeslices = getTimeSlices(filename,months)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset,num2date
+
+    data = Dataset(filename,'r')
+    nctime = data.variables['time']
+    dates = num2date(nctime[:],nctime.units,getattr(nctime,'calendar','standard'))
+    data.close()
+
+    monthsfile = np.array([date.month - 1 for date in np.ravel(dates)])
+    days = np.where(np.isin(monthsfile,months))[0]
+    if days.size == 0:
+        return []
+    starts = np.append(0,np.where(np.diff(days) != 1)[0] + 1)
+    stops = np.append(starts[1:],days.size)
+    timeslices = [slice(int(days[start]),int(days[stop-1])+1)
+                  for start,stop in zip(starts,stops)]
+    return timeslices
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getOutputFile(dataoutput,vari,reg_name,model,member,sliceperiod='JJA'):
+    """
+    Function returns the output file of one member
+
+    Parameters
+    ----------
+    dataoutput : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+    member : integer
+        ensemble member (1, 2, ...)
+    sliceperiod : string
+        months to extract (see calc_ReadUtilities.getMonthIndices)
+
+    Returns
+    -------
+    filename : string
+        netCDF file of the member
+
+    Usage
+    -----
+    filename = getOutputFile(dataoutput,vari,reg_name,model,member,sliceperiod)
+    """
+
+    filename = dataoutput + '%s/%s_%s_%s_%s_ens%s.nc' % (sliceperiod,sliceperiod,vari,reg_name,
+                                                        model,str(member).zfill(2))
+    return filename
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def extractMember(directorydata,dataoutput,vari,variq,reg_name,model,member,
+                  sliceperiod='JJA'):
+    """
+    Function extracts the selected months of one member into one chunked
+    file, unless the member was already finished
+
+    Parameters
+    ----------
+    directorydata : string
+        daily directory of the model
+    dataoutput : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    variq : string
+        variable name for raw SPEAR data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+    member : integer
+        ensemble member (1, 2, ...)
+    sliceperiod : string
+        months to extract (see calc_ReadUtilities.getMonthIndices)
+
+    Returns
+    -------
+    filename : string
+        netCDF file of the member
+
+    Usage
+    -----
+    filename = extractMember(directorydata,dataoutput,vari,variq,reg_name,
+                             model,member,sliceperiod)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import sys
+    import json
+    from netCDF4 import Dataset
+    import calc_Utilities as UT
+    import calc_ReadUtilities as RU
+    import calc_ReadCache as RC
+    import calc_CompactOutput as CO
+
+    filename = getOutputFile(dataoutput,vari,reg_name,model,member,sliceperiod)
+    if os.path.exists(filename + '.done') and os.path.exists(filename):
+        print('Completed: member %s was already extracted (%s)' % (member,filename))
+        return filename
+
+    filenames = getMemberFiles(directorydata,vari,variq,member)
+    if len(filenames) == 0:
+        print(ValueError('NO DAILY FILES FOR MEMBER %s!!!' % member))
+        sys.exit()
+    months = RU.getMonthIndices(sliceperiod)
+    timeslices = [getTimeSlices(filenameq,months) for filenameq in filenames]
+    numOfTime = sum([timeq.stop - timeq.start for slices in timeslices for timeq in slices])
+
+    ### Region from the grid of the first file (whole grid for Globe)
+    if reg_name != 'Globe':
+        lat_bounds,lon_bounds = UT.regions(reg_name)
+    else:
+        lat_bounds,lon_bounds = None,None
+    source = Dataset(filenames[0],'r')
+    lat1 = source.variables['lat'][:]
+    lon1 = source.variables['lon'][:]
+    latslice,lonslices = RU.getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    latus1 = lat1[latslice]
+    lonus1 = np.ma.concatenate([lon1[lonq] for lonq in lonslices])
+    ncsource = source.variables['%s' % variq]
+    nctime = source.variables['time']
+
+    os.makedirs(os.path.dirname(filename),exist_ok=True)
+    ncfile = Dataset(filename + '.tmp','w',format='NETCDF4')
+    ncfile.description = '%s days of %s for %s (%s member %s)' % (sliceperiod,variq,reg_name,
+                                                                  model,member)
+    ncfile.createDimension('time',numOfTime)
+    ncfile.createDimension('lat',latus1.shape[0])
+    ncfile.createDimension('lon',lonus1.shape[0])
+    timeout = ncfile.createVariable('time','f8',('time',))
+    for att in ('units','calendar'):
+        if hasattr(nctime,att):
+            timeout.setncattr(att,nctime.getncattr(att))
+    ncfile.createVariable('lat','f4',('lat',))[:] = latus1
+    ncfile.createVariable('lon','f4',('lon',))[:] = lonus1
+    shape = (numOfTime,latus1.shape[0],lonus1.shape[0])
+    attributes = {att : ncsource.getncattr(att) for att in ncsource.ncattrs()}
+    varout = ncfile.createVariable(variq,ncsource.dtype,('time','lat','lon'),
+                                   fill_value=attributes.pop('_FillValue',None),
+                                   chunksizes=CO.getChunks(shape,ncsource.dtype.itemsize),
+                                   **CO.COMPRESSION)
+    varout.setncatts(attributes)
+    varout.set_auto_maskandscale(False)
+    source.close()
+
+    ### One hyperslab read and write for each run of days
+    t = 0
+    for filenameq,slices in zip(filenames,timeslices):
+        source = Dataset(filenameq,'r')
+        ncsource = source.variables['%s' % variq]
+        ncsource.set_auto_maskandscale(False)
+        for timeq in slices:
+            block = RU.readRegion(ncsource,timeq,latslice,lonslices)
+            varout[t:t+block.shape[0]] = block
+            timeout[t:t+block.shape[0]] = source.variables['time'][timeq]
+            t += block.shape[0]
+        source.close()
+    ncfile.close()
+    os.replace(filename + '.tmp',filename)
+
+    ### Marker of a finished member (the output file is only complete now)
+    with open(filename + '.done','w') as fileq:
+        json.dump({'sources' : RC.getFileStats(filenames),'numOfTime' : numOfTime},fileq)
+    print('Completed: extracted %s days of member %s (%s)' % (numOfTime,member,filename))
+    return filename
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def extractMembers(directorydata,dataoutput,vari,variq,reg_name,model,members,
+                   sliceperiod='JJA',workers=1):
+    """
+    Function extracts the selected months of several members in a process
+    pool (members that are already finished are skipped)
+
+    Parameters
+    ----------
+    directorydata : string
+        daily directory of the model
+    dataoutput : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    variq : string
+        variable name for raw SPEAR data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+    members : list of integers
+        ensemble members (1, 2, ...)
+    sliceperiod : string
+        months to extract (see calc_ReadUtilities.getMonthIndices)
+    workers : integer
+        number of members extracted at once
+
+    Returns
+    -------
+    filenames : list of strings
+        netCDF file of each member
+
+    Usage
+    -----
+    filenames = extractMembers(directorydata,dataoutput,vari,variq,reg_name,
+                               model,members,sliceperiod,workers)
+    """
+    print('\n>>>>>>>>>> STARTING extractMembers function!')
+
+    ### Import modules
+    from concurrent.futures import ProcessPoolExecutor
+
+    arguments = [(directorydata,dataoutput,vari,variq,reg_name,model,member,sliceperiod)
+                 for member in members]
+    if workers == 1:
+        filenames = [extractMember(*argument) for argument in arguments]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(extractMember,*argument) for argument in arguments]
+            filenames = [future.result() for future in futures]
+
+    print('>>>>>>>>>> ENDING extractMembers function!')
+    return filenames
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readSummer(directorydata,vari,variq,reg_name,model,member,numOfYears,monthdays,
+               latslice=slice(None)):
+    """
+    Function reads the JJA days of one member as [year,day,lat,lon], from
+    the file of extractMember or else the June/July/August files
+
+    Parameters
+    ----------
+    directorydata : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    variq : string
+        variable name for raw SPEAR data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+    member : integer
+        ensemble member (1, 2, ...)
+    numOfYears : integer
+        number of years
+    monthdays : list of integers
+        number of days of June, July and August
+    latslice : slice
+        latitudes to read (all by default)
+
+    Returns
+    -------
+    lat : 1d numpy array
+        latitudes
+    lon : 1d numpy array
+        longitudes
+    summer : 4d numpy array
+        [year,day,lat,lon]
+
+    Usage
+    -----
+    lat,lon,summer = readSummer(directorydata,vari,variq,reg_name,model,member,
+                                numOfYears,monthdays,latslice)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    from netCDF4 import Dataset
+
+    filename = getOutputFile(directorydata,vari,reg_name,model,member,'JJA')
+    if os.path.exists(filename + '.done'):
+        data = Dataset(filename,'r')
+        lat = data.variables['lat'][latslice]
+        lon = data.variables['lon'][:]
+        summer = data.variables['%s' % variq][:,latslice].reshape(numOfYears,sum(monthdays),
+                                                                  lat.shape[0],lon.shape[0])
+        data.close()
+        return lat,lon,summer
+
+    ### Files of each month
+    summer = []
+    for monthname,numOfDays in zip(['June','July','August'],monthdays):
+        data = Dataset(directorydata + '%s/%s_%s_%s_%s_ens%s.nc' % (monthname,monthname,vari,
+                                                                   reg_name,model,
+                                                                   str(member).zfill(2)))
+        lat = data.variables['lat'][latslice]
+        lon = data.variables['lon'][:]
+        summer.append(data.variables['%s' % variq][:,latslice].reshape(numOfYears,numOfDays,
+                                                                       lat.shape[0],lon.shape[0]))
+        data.close()
+    summer = np.ma.concatenate(summer,axis=1)
+    return lat,lon,summer
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setTileShape(tileshape):
+    """
+    Function sets the latitudes and longitudes in one chunk of the cube
+
+    Parameters
+    ----------
+    tileshape : 2 integers
+        (latitudes,longitudes) of one tile
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setTileShape(tileshape)
+    """
+    global TILESHAPE
+
+    TILESHAPE = tuple(int(size) for size in tileshape)
+    print('Tiles of the daily cube ---> %s x %s' % TILESHAPE)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getCubeFile(dataoutput,vari,reg_name,model):
+    """
+    Function returns the JJA cube of all members
+
+    Parameters
+    ----------
+    dataoutput : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+
+    Returns
+    -------
+    filename : string
+        netCDF file of the cube
+
+    Usage
+    -----
+    filename = getCubeFile(dataoutput,vari,reg_name,model)
+    """
+
+    filename = dataoutput + 'JJA/Cube_JJA_%s_%s_%s.nc' % (vari,reg_name,model)
+    return filename
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getCube(dataoutput,vari,reg_name,model):
+    """
+    Function returns the JJA cube of all members if it was written and its
+    member files are unchanged since
+
+    Parameters
+    ----------
+    dataoutput : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+
+    Returns
+    -------
+    filename : string or None
+        netCDF file of the cube and None when there is no (valid) cube
+
+    Usage
+    -----
+    filename = getCube(dataoutput,vari,reg_name,model)
+    """
+
+    ### Import modules
+    import os
+    import json
+    import calc_ReadCache as RC
+
+    filename = getCubeFile(dataoutput,vari,reg_name,model)
+    if not all([os.path.exists(filename + '.done'),os.path.exists(filename)]):
+        return None
+    with open(filename + '.done','r') as fileq:
+        sources = json.load(fileq)['sources']
+
+    ### Any change to the member files makes the cube stale (see writeCube)
+    if RC.getFileStats([filestat[0] for filestat in sources]) != sources:
+        print('Cube %s is out of date!' % filename)
+        return None
+    return filename
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def writeCube(directorydata,vari,variq,reg_name,model,numOfMembers,numOfYears,
+              monthdays):
+    """
+    Function gathers the JJA days of all members into a [ens,year,day,lat,lon]
+    float32 cube. Each chunk holds all years and days of one member for one
+    tile, so a tile is read with one sequential read per member
+
+    Parameters
+    ----------
+    directorydata : string
+        directory of the extracted data
+    vari : string
+        variable name for processed data
+    variq : string
+        variable name for raw SPEAR data
+    reg_name : string
+        region of analysis
+    model : string
+        model to read daily data from
+    numOfMembers : integer
+        number of ensemble members
+    numOfYears : integer
+        number of years
+    monthdays : list of integers
+        number of days of June, July and August
+
+    Returns
+    -------
+    filename : string
+        netCDF file of the cube
+
+    Usage
+    -----
+    filename = writeCube(directorydata,vari,variq,reg_name,model,numOfMembers,
+                         numOfYears,monthdays)
+    """
+    print('\n>>>>>>>>>> STARTING writeCube function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    from netCDF4 import Dataset
+    import calc_ReadCache as RC
+    import calc_CompactOutput as CO
+
+    filename = getCubeFile(directorydata,vari,reg_name,model)
+    members = [getOutputFile(directorydata,vari,reg_name,model,e+1,'JJA')
+               for e in range(numOfMembers)]
+    sources = RC.getFileStats([member for member in members if os.path.exists(member)])
+    if os.path.exists(filename + '.done') and os.path.exists(filename):
+        with open(filename + '.done','r') as fileq:
+            if json.load(fileq)['sources'] == sources:
+                print('Completed: cube is up to date (%s)' % filename)
+                print('>>>>>>>>>> ENDING writeCube function!')
+                return filename
+
+    ### Grid and attributes of the first member
+    if os.path.exists(members[0] + '.done'):
+        data = Dataset(members[0],'r')
+    else:
+        data = Dataset(directorydata + 'June/June_%s_%s_%s_ens01.nc' % (vari,reg_name,model),'r')
+    lat = data.variables['lat'][:]
+    lon = data.variables['lon'][:]
+    attributes = {att : data.variables['%s' % variq].getncattr(att)
+                  for att in data.variables['%s' % variq].ncattrs()
+                  if att not in ('_FillValue','missing_value','scale_factor','add_offset')}
+    data.close()
+    numOfDays = sum(monthdays)
+
+    os.makedirs(os.path.dirname(filename),exist_ok=True)
+    ncfile = Dataset(filename + '.tmp','w',format='NETCDF4')
+    ncfile.description = 'JJA days of %s for %s (%s)' % (variq,reg_name,model)
+    ncfile.createDimension('ens',numOfMembers)
+    ncfile.createDimension('year',numOfYears)
+    ncfile.createDimension('day',numOfDays)
+    ncfile.createDimension('lat',lat.shape[0])
+    ncfile.createDimension('lon',lon.shape[0])
+    ncfile.createVariable('lat','f4',('lat',))[:] = lat
+    ncfile.createVariable('lon','f4',('lon',))[:] = lon
+    chunks = (1,numOfYears,numOfDays,min(TILESHAPE[0],lat.shape[0]),
+              min(TILESHAPE[1],lon.shape[0]))
+    cube = ncfile.createVariable(variq,'f4',('ens','year','day','lat','lon'),
+                                 fill_value=np.nan,chunksizes=chunks,**CO.COMPRESSION)
+    cube.setncatts(attributes)
+
+    ### Bands of whole tiles of one member at a time
+    rowbytes = numOfYears*numOfDays*lon.shape[0]*4
+    bandsize = max(chunks[3],(CUBEMEMORY//rowbytes)//chunks[3]*chunks[3])
+    for e in range(numOfMembers):
+        for i in range(0,lat.shape[0],bandsize):
+            band = slice(i,min(i+bandsize,lat.shape[0]))
+            lat1,lon1,summer = readSummer(directorydata,vari,variq,reg_name,model,e+1,
+                                          numOfYears,monthdays,band)
+            cube[e,:,:,band,:] = np.ma.filled(summer.astype('f4'),np.nan)
+        print('Completed: member %s of the cube' % (e+1))
+    ncfile.close()
+    os.replace(filename + '.tmp',filename)
+
+    with open(filename + '.done','w') as fileq:
+        json.dump({'sources' : sources},fileq)
+    print('>>>>>>>>>> ENDING writeCube function!')
+    return filename
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def iterTiles(cubefile,variq):
+    """
+    Function reads the cube one tile at a time in the order of the chunks
+
+    Parameters
+    ----------
+    cubefile : string
+        netCDF file of the cube (see writeCube)
+    variq : string
+        variable name for raw SPEAR data
+
+    Returns
+    -------
+    latslice : slice
+        latitudes of the tile
+    lonslice : slice
+        longitudes of the tile
+    tile : 5d numpy array
+        [ens,year,day,lat,lon] float32 with nan for missing days
+
+    Usage
+    -----
+    for latslice,lonslice,tile in iterTiles(cubefile,variq):
+    """
+
+    ### Import modules
+    from netCDF4 import Dataset
+
+    data = Dataset(cubefile,'r')
+    cube = data.variables['%s' % variq]
+    cube.set_auto_mask(False)
+    chunks = cube.chunking()
+    numOfLats,numOfLons = cube.shape[3:]
+    try:
+        for i in range(0,numOfLats,chunks[3]):
+            for j in range(0,numOfLons,chunks[4]):
+                latslice = slice(i,min(i+chunks[3],numOfLats))
+                lonslice = slice(j,min(j+chunks[4],numOfLons))
+                yield latslice,lonslice,cube[:,:,:,latslice,lonslice]
+    finally:
+        data.close()
+
+# ### Test functions - do not use!
+# import calc_DailyExtract as DX
+# directorydata = '/work/Zachary.Labe/Data/SPEAR/SPEAR_MED/daily/'
+# dataoutput = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
+# filenames = DX.extractMembers(directorydata,dataoutput,'TMAX','t_ref_max','US',
+#                               'SPEAR_MED',range(1,30+1),'JJA',workers=8)
+# cubefile = DX.writeCube(dataoutput,'TMAX','t_ref_max','US','SPEAR_MED',30,180,[30,31,31])
+# for latslice,lonslice,tile in DX.iterTiles(cubefile,'t_ref_max'):
+#     print(latslice,lonslice,tile.shape)
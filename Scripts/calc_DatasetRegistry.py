@@ -0,0 +1,526 @@
+"""
+Registry of the data sets that readFiles can read. Each entry describes the
+reader, directory, years, members, grid and scenario of one data set, so a
+request can be checked (shape, years, size) before any data are read
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getDataset(dataset)
+    [2] getYears(dataset)
+    [3] getGrid(dataset,variq,lat_bounds,lon_bounds)
+    [4] getShape(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    [5] getSizeBytes(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    [6] readDataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds,members)
+    [7] getMemberRead(dataset)
+"""
+
+###############################################################################
+###############################################################################
+###############################################################################
+### Data sets
+###     reader     : module (and function) name of the reader
+###     call       : argument order of the reader
+###                  'obs'      = (variq,directory,monthlychoice,sliceyear,sliceshape,slicenan)
+###                  'era5'     = (variq,directory,monthlychoice,sliceyear,sliceshape,True,slicenan,level)
+###                  'model'    = (directory,variq,monthlychoice,sliceshape,slicenan,numOfEns,timeper)
+###                  'scenario' = (directory,scenario,variq,monthlychoice,sliceshape,slicenan,numOfEns,timeper)
+###                  'mmlea'    = (directory,variq,monthlychoice,sliceshape,slicenan,timeper)
+###     directory  : directory passed to the reader
+###     sliceyear  : years passed to the obs/era5 readers
+###     years      : years of the returned data
+###     members    : number of ensemble members (1 for observations)
+###     sliceshape : (shape for monthlychoice 'none', shape for the others)
+###     timeper    : time period passed to the model readers
+###     scenario   : emissions scenario of the future period
+###     regionread : True if the reader slices lat_bounds/lon_bounds itself
+###     level      : level passed to the era5 readers
+###     grid       : file (relative to directory) with the lat/lon of the grid
+DIRECTORYDATA = '/work/Zachary.Labe/Data/'
+
+def obsEntry(reader,directory,years,grid,sliceyear=None):
+    return {'reader' : reader,'call' : 'obs','directory' : directory,
+            'sliceyear' : sliceyear or years,'years' : years,'members' : 1,
+            'sliceshape' : (4,3),'timeper' : None,'scenario' : None,
+            'regionread' : False,'level' : None,'grid' : grid}
+
+def era5Entry(reader,level,years,grid,sliceshape=(4,3)):
+    return {'reader' : reader,'call' : 'era5','directory' : DIRECTORYDATA,
+            'sliceyear' : (1979,2021),'years' : years,'members' : 1,
+            'sliceshape' : sliceshape,'timeper' : None,'scenario' : None,
+            'regionread' : False,'level' : level,'grid' : grid}
+
+def modelEntry(reader,directory,years,members,scenario,grid,timeper='futureforcing',
+               regionread=False,sliceshape=(5,4),call='model'):
+    return {'reader' : reader,'call' : call,'directory' : directory,
+            'sliceyear' : None,'years' : years,'members' : members,
+            'sliceshape' : sliceshape,'timeper' : timeper,'scenario' : scenario,
+            'regionread' : regionread,'level' : None,'grid' : grid}
+
+DIRECTORYSPEAR = DIRECTORYDATA + 'SPEAR/'
+DATASETS = {
+    '20CRv3' : obsEntry('read_20CRv3_monthly',DIRECTORYDATA + '20CRv3/',(1921,2015),
+                        'monthly/{vari}_1836-2015.nc',sliceyear=(1836,2015)),
+    '20CRv3_LOWS' : obsEntry('read_20CRv3_monthlyLOWS',DIRECTORYDATA + '20CRv3_LOWS/',(1921,2015),
+                             'monthly/{vari}_1836-2015.nc',sliceyear=(1836,2015)),
+    'NClimGrid' : obsEntry('read_NClimGrid_monthly',DIRECTORYDATA,(1895,2021),
+                           'NClimGrid/{vari}_1895-2021.nc'),
+    'NClimGrid_LOWS' : obsEntry('read_NClimGrid_monthlyLOWS',DIRECTORYDATA,(1895,2021),
+                                'NClimGrid_LOWS/{vari}_1895-2021.nc'),
+    'NClimGrid_MEDS' : obsEntry('read_NClimGrid_monthlyMEDS',DIRECTORYDATA,(1921,2021),
+                                'NClimGrid_MEDS/{vari}_1895-2021.nc',sliceyear=(1895,2021)),
+    'NClimGrid_HIGHS' : obsEntry('read_NClimGrid_monthlyHIGHS',DIRECTORYDATA,(1921,2021),
+                                 'NClimGrid_HIGHS/{vari}_1895-2021.nc',sliceyear=(1895,2021)),
+    'ERA5_025x025' : era5Entry('read_ERA5_monthly025x025','nan',(1979,2021),None,
+                               sliceshape=(3,3)),
+    'ERA5_1x1' : era5Entry('read_ERA5_monthly1x1','nan',(1979,2021),
+                           'ERA5_1x1/{vari}_1979-2021.nc'),
+    'ERA5_LOWS' : era5Entry('read_ERA5_monthlyLOWS','surface',(1979,2021),
+                            'ERA5_LOWS/{vari}_1979-2021.nc'),
+    'ERA5_MEDS' : era5Entry('read_ERA5_monthlyMEDS','surface',(1980,2022),
+                            'ERA5_MEDS/{vari}_1940-2022.nc'),
+    'ERA5_HIGHS' : era5Entry('read_ERA5_monthlyHIGHS','surface',(1979,2021),
+                             'ERA5_HIGHS/{vari}_1979-2021.nc'),
+    'LENS1' : modelEntry('read_LENS1',DIRECTORYDATA,(1920,2100),40,'RCP85',
+                         'LENS1/monthly/{vari}/{vari}_001_1920-2100.nc'),
+    'LENS1_LOWS' : modelEntry('read_LENS1_LOWS',DIRECTORYDATA,(1920,2100),40,'RCP85',
+                              'LENS1_LOWS/monthly/{vari}/{vari}_001_1920-2100.nc'),
+    'LENS2' : modelEntry('read_LENS2',DIRECTORYDATA + 'LENS2/monthly/',(1850,2100),100,'SSP370',
+                         '{vari}/{vari}_001_1850-2100.nc',regionread=True),
+    'LENS2_smoothed' : modelEntry('read_LENS2_smoothed',DIRECTORYDATA,(1850,2100),50,'SSP370',
+                                  'LENS2_smoothed/monthly/{vari}/{vari}_001_1850-2100.nc',
+                                  regionread=True),
+    'LENS2_cmip6bb' : modelEntry('read_LENS2_cmip6bb',DIRECTORYDATA,(1850,2100),50,'SSP370',
+                                 'LENS2_cmip6bb/monthly/{vari}/{vari}_001_1850-2100.nc',
+                                 regionread=True),
+    'LENS2_LOWS' : modelEntry('read_LENS2_LOWS',DIRECTORYDATA + 'LENS2_LOWS/monthly/',(1850,2100),100,'SSP370',
+                              '{vari}/{vari}_001_1850-2100.nc',regionread=True),
+    'LENS2_smoothed_LOWS' : modelEntry('read_LENS2_smoothed_LOWS',DIRECTORYDATA,(1850,2100),50,'SSP370',
+                                       'LENS2_smoothed_LOWS/monthly/{vari}/{vari}_001_1850-2100.nc',
+                                       regionread=True),
+    'LENS2_cmip6bb_LOWS' : modelEntry('read_LENS2_cmip6bb_LOWS',DIRECTORYDATA,(1850,2100),50,'SSP370',
+                                      'LENS2_cmip6bb_LOWS/monthly/{vari}/{vari}_001_1850-2100.nc',
+                                      regionread=True),
+    'MIROC6_LE_LOWS' : modelEntry('read_MIROC6_LE_LOWS',DIRECTORYDATA,(1850,2100),50,'SSP585',
+                                  'MIROC6_LE_LOWS/monthly/{vari}/{vari}_001_1850-2100.nc'),
+    'SMHI_LE_LOWS' : modelEntry('read_SMHI_LE_LOWS',DIRECTORYDATA,(1970,2100),50,'SSP585',
+                                'SMHI_LE_LOWS/monthly/{vari}/{vari}_001_1970-2100.nc'),
+    'MPI_ESM12_HR_LOWS' : modelEntry('read_MPI_ESM12_HR_LOWS',DIRECTORYDATA,(1850,2100),10,'SSP370',
+                                     'MPI_ESM12_HR_LOWS/monthly/{vari}/{vari}_001_1850-2100.nc'),
+    'MPI_ESM12_LE' : modelEntry('read_MPI_ESM12_LE',DIRECTORYDATA,(1850,2100),30,'SSP585',
+                                'MPI_ESM12_LE/monthly/{vari}/{vari}_001_1850-2100.nc'),
+    'FLOR' : modelEntry('read_FLOR',DIRECTORYDATA,(1921,2100),30,'RCP85',
+                        'FLOR/FLOR_LE/monthly/{vari}/{vari}_01_1921-2100.nc'),
+    'FLOR_LOWS' : modelEntry('read_FLOR_LOWS',DIRECTORYDATA,(1921,2100),30,'RCP85',
+                             'FLOR/FLOR_LOWS/monthly/{vari}/{vari}_001_1921-2100.nc'),
+    'SPEAR_LOW' : modelEntry('read_SPEAR_LOW',DIRECTORYSPEAR + 'SPEAR_LOW/monthly/',(1921,2100),30,'SSP585',
+                             '{vari}/{vari}_01_1851-2010.nc'),
+    'SPEAR_MED' : modelEntry('read_SPEAR_MED',DIRECTORYSPEAR + 'SPEAR_MED/monthly/',(2015,2100),30,'SSP585',
+                             '{vari}/{vari}_01_1921-2010.nc',regionread=True),
+    'SPEAR_MED_Historical' : modelEntry('read_SPEAR_MED_Historical',DIRECTORYSPEAR + 'SPEAR_MED/monthly/',
+                                        (1929,2014),30,'SSP585','{vari}/{vari}_01_1921-2010.nc',
+                                        timeper='historicalforcing',regionread=True),
+    'SPEAR_MED_ALLofHistorical' : modelEntry('read_SPEAR_MED_Historical',DIRECTORYSPEAR + 'SPEAR_MED/monthly/',
+                                             (1921,2014),30,'SSP585','{vari}/{vari}_01_1921-2010.nc',
+                                             timeper='ALLofhistoricalforcing',regionread=True),
+    'SPEAR_MED_FA' : modelEntry('read_SPEAR_MED_FA',DIRECTORYDATA,(1921,2100),30,'SSP585',
+                                'SPEAR/SPEAR_MED_FA/monthly/{vari}/{vari}_01_1921-2100.nc',
+                                regionread=True),
+    'SPEAR_MED_Scenario' : modelEntry('read_SPEAR_MED_Scenario',DIRECTORYSPEAR + 'SPEAR_MED/monthly/',
+                                      (2015,2100),30,None,'{vari}/{vari}_01_1921-2010.nc',
+                                      regionread=True,sliceshape=(4,4),call='scenario'),
+    'SPEAR_MED_SSP534OS_10ye' : modelEntry('read_SPEAR_MED_SSP534OS_10ye',
+                                           DIRECTORYSPEAR + 'SPEAR_MED_SSP534OS_10ye/monthly/',
+                                           (2015,2100),30,'SSP534OS_10ye',
+                                           '{vari}/{vari}_01_2031-2100.nc',
+                                           regionread=True,sliceshape=(4,4)),
+    'SPEAR_MED_SSP370_OS2040a' : modelEntry('read_SPEAR_MED_SSP370_OS2040a',
+                                            DIRECTORYSPEAR + 'SPEAR_MED_SSP370_OS2040a/monthly/',
+                                            (2015,2100),30,'SSP370_OS2040a',
+                                            '{vari}/{vari}_01_2041-2100.nc',
+                                            regionread=True,sliceshape=(4,4)),
+    'SPEAR_MED_LM42p2_test' : modelEntry('read_SPEAR_MED_LM42p2_test',DIRECTORYDATA,(2015,2070),3,'SSP585',
+                                         'SPEAR/SPEAR_MED_LM42p2_test/monthly/{vari}/{vari}_01_1851-2070.nc',
+                                         regionread=True,sliceshape=(4,4)),
+    'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' : modelEntry('read_SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv',
+                                                      DIRECTORYSPEAR + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv/monthly/',
+                                                      (2015,2100),9,'STRONGAMOC',
+                                                      '{vari}/{vari}_01_2041-2100.nc',
+                                                      regionread=True,sliceshape=(4,4)),
+    'SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv' : modelEntry('read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',
+                                                      DIRECTORYSPEAR + 'SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv/monthly/',
+                                                      (2015,2100),9,'STRONGAMOC',
+                                                      '{vari}/{vari}_01_2041-2100.nc',
+                                                      regionread=True,sliceshape=(4,4)),
+    'SPEAR_MED_NATURAL' : modelEntry('read_SPEAR_MED_NATURAL',DIRECTORYSPEAR + 'SPEAR_MED_NATURAL/monthly/',
+                                     (2015,2100),30,'natural','{vari}/{vari}_01_1921-2100.nc',
+                                     regionread=True),
+    'SPEAR_MED_NATURAL_ALLYRS' : modelEntry('read_SPEAR_MED_NATURAL',DIRECTORYSPEAR + 'SPEAR_MED_NATURAL/monthly/',
+                                            (1929,2100),30,'natural','{vari}/{vari}_01_1921-2100.nc',
+                                            timeper='alldet',regionread=True),
+    'SPEAR_MED_NATURAL_Historical' : modelEntry('read_SPEAR_MED_NATURAL',DIRECTORYSPEAR + 'SPEAR_MED_NATURAL/monthly/',
+                                                (1929,2014),30,'natural','{vari}/{vari}_01_1921-2100.nc',
+                                                timeper='historicalforcing',regionread=True),
+    'SPEAR_MED_NOAER' : modelEntry('read_SPEAR_MED_NOAER',DIRECTORYSPEAR + 'SPEAR_MED_NOAER/monthly/',
+                                   (1921,2020),12,'SSP585','{vari}/{vari}_01_1921-2020.nc',
+                                   regionread=True),
+    'SPEAR_HIGH' : modelEntry('read_SPEAR_HIGH',DIRECTORYDATA,(1921,2100),10,'SSP585',
+                              'SPEAR/SPEAR_HIGH/monthly/{vari}/{vari}_01_1921-2010.nc'),
+    'MMLEA' : modelEntry('read_MMLEA',DIRECTORYDATA,(1921,2100),30+100+10+50+40+30,None,
+                         'SPEAR/SPEAR_LOW/monthly/{vari}/{vari}_01_1851-2010.nc',
+                         call='mmlea'),
+    }
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getDataset(dataset):
+    """
+    Function returns the registry entry of a data set
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+
+    Returns
+    -------
+    entry : dictionary
+        reader, call, directory, years, members, sliceshape, timeper,
+        scenario, regionread, level and grid of the data set
+
+    Usage
+    -----
+    entry = getDataset(dataset)
+    """
+
+    ### Import modules
+    import sys
+
+    if dataset not in DATASETS:
+        print(ValueError('WRONG DATA SET SELECTED!'))
+        sys.exit()
+    return DATASETS[dataset]
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getYears(dataset):
+    """
+    Function returns the years of the data returned for a data set
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+
+    Returns
+    -------
+    years : 1d numpy array
+        years
+
+    Usage
+    -----
+    years = getYears(dataset)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    entry = getDataset(dataset)
+    years = np.arange(entry['years'][0],entry['years'][1]+1,1)
+    return years
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getGrid(dataset,variq,lat_bounds=None,lon_bounds=None):
+    """
+    Function reads only the lat/lon of a data set from one file header
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+    variq : string
+        variable for analysis
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    dtype : numpy dtype
+        data type of the variable in the file
+
+    Usage
+    -----
+    lat1,lon1,dtype = getGrid(dataset,variq,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    from netCDF4 import Dataset
+    import calc_ReadUtilities as RU
+
+    entry = getDataset(dataset)
+    if entry['grid'] is None:
+        print(ValueError('NO GRID FILE FOR %s!!!' % dataset))
+        sys.exit()
+    filename = entry['directory'] + entry['grid'].format(vari=variq)
+
+    data = Dataset(filename,'r')
+    if 'lat' in data.variables:
+        lat1 = data.variables['lat'][:]
+        lon1 = data.variables['lon'][:]
+    else:
+        lat1 = data.variables['latitude'][:]
+        lon1 = data.variables['longitude'][:]
+    ncvar = data.variables['%s' % variq]
+    if hasattr(ncvar,'scale_factor'):
+        dtype = np.asarray(ncvar.scale_factor).dtype
+    else:
+        dtype = ncvar.dtype
+    data.close()
+
+    if any([lat_bounds is not None,lon_bounds is not None]):
+        latslice,lonslices = RU.getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+        lat1 = lat1[latslice]
+        lon1 = np.ma.concatenate([lon1[lonq] for lonq in lonslices])
+    return lat1,lon1,dtype
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getShape(dataset,variq,monthlychoice,lat_bounds=None,lon_bounds=None):
+    """
+    Function returns the shape of the array readFiles would return, without
+    reading any data
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+    variq : string
+        variable for analysis
+    monthlychoice : string
+        time period of analysis
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    shape : tuple
+        [ens,years,(months),lat,lon] for models and [years,(months),lat,lon]
+        for observations
+
+    Usage
+    -----
+    shape = getShape(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    """
+
+    entry = getDataset(dataset)
+    lat1,lon1,dtype = getGrid(dataset,variq,lat_bounds,lon_bounds)
+    numOfYears = getYears(dataset).shape[0]
+
+    ### Observations have no ensemble dimension
+    if entry['call'] in ('obs','era5'):
+        leadshape = ()
+    else:
+        leadshape = (entry['members'],)
+
+    ### Months stay a separate dimension if the sliceshape has room for it
+    if monthlychoice == 'DJF':
+        timeshape = (numOfYears-1,)
+    elif monthlychoice != 'none':
+        timeshape = (numOfYears,)
+    elif entry['sliceshape'][0] == len(leadshape) + 4:
+        timeshape = (numOfYears,12)
+    else:
+        timeshape = (numOfYears*12,)
+
+    shape = leadshape + timeshape + (lat1.shape[0],lon1.shape[0])
+    return shape
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getSizeBytes(dataset,variq,monthlychoice,lat_bounds=None,lon_bounds=None):
+    """
+    Function returns the size in bytes of the array readFiles would return
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+    variq : string
+        variable for analysis
+    monthlychoice : string
+        time period of analysis
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    sizebytes : integer
+        number of bytes (using the reader data type, see setReadDtype)
+
+    Usage
+    -----
+    sizebytes = getSizeBytes(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_ReadUtilities as RU
+
+    shape = getShape(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    if RU.READDTYPE is not None:
+        dtype = RU.READDTYPE
+    else:
+        dtype = getGrid(dataset,variq)[2]
+    sizebytes = int(np.prod(shape))*np.dtype(dtype).itemsize
+    return sizebytes
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readDataset(variq,dataset,monthlychoice,scenario,lat_bounds=None,lon_bounds=None,
+                members=None):
+    """
+    Function imports the reader of a data set and reads it
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+    members : list of integers or None
+        ensemble members to read (1 = first, see getMemberRead) and None for
+        all members of the data set
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    data : numpy array
+        data from selected data set
+    regionread : boolean
+        True if the reader already cut out lat_bounds/lon_bounds
+
+    Usage
+    -----
+    lat1,lon1,data,regionread = readDataset(variq,dataset,monthlychoice,scenario,
+                                            lat_bounds,lon_bounds,members)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    import importlib
+
+    entry = getDataset(dataset)
+    reader = getattr(importlib.import_module(entry['reader']),entry['reader'])
+    directory = entry['directory']
+    if monthlychoice == 'none':
+        sliceshape = entry['sliceshape'][0]
+    else:
+        sliceshape = entry['sliceshape'][1]
+    slicenan = 'nan'
+    regionargs = (lat_bounds,lon_bounds) if entry['regionread'] else ()
+    if members is None:
+        numOfEns = entry['members']
+        memberargs = {}
+    elif getMemberRead(dataset):
+        numOfEns = len(members)
+        memberargs = {'members' : list(members)}
+    else:
+        print(ValueError('%s CANNOT READ SINGLE MEMBERS!!!' % dataset))
+        sys.exit()
+
+    if entry['call'] == 'obs':
+        sliceyear = np.arange(entry['sliceyear'][0],entry['sliceyear'][1]+1,1)
+        lat1,lon1,data = reader(variq,directory,monthlychoice,
+                                sliceyear,sliceshape,slicenan)
+    elif entry['call'] == 'era5':
+        sliceyear = np.arange(entry['sliceyear'][0],entry['sliceyear'][1]+1,1)
+        output = reader(variq,directory,monthlychoice,sliceyear,sliceshape,True,
+                        slicenan,entry['level'])
+        lat1,lon1,data = output[0],output[1],output[-1]
+    elif entry['call'] == 'model':
+        lat1,lon1,data = reader(directory,variq,monthlychoice,sliceshape,slicenan,
+                                numOfEns,entry['timeper'],*regionargs,**memberargs)
+    elif entry['call'] == 'scenario':
+        lat1,lon1,data = reader(directory,scenario,variq,monthlychoice,sliceshape,
+                                slicenan,numOfEns,entry['timeper'],*regionargs,
+                                **memberargs)
+    elif entry['call'] == 'mmlea':
+        lat1,lon1,data = reader(directory,variq,monthlychoice,sliceshape,slicenan,
+                                entry['timeper'])
+    return lat1,lon1,data,entry['regionread']
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getMemberRead(dataset):
+    """
+    Function checks if the reader of a data set can read single ensemble
+    members (members argument of readDataset)
+
+    Parameters
+    ----------
+    dataset : string
+        name of data set for primary data
+
+    Returns
+    -------
+    memberread : boolean
+        True if the reader takes a list of members
+
+    Usage
+    -----
+    memberread = getMemberRead(dataset)
+    """
+
+    ### Import modules
+    import importlib
+    import inspect
+
+    entry = getDataset(dataset)
+    if entry['call'] not in ('model','scenario'):
+        return False
+    reader = getattr(importlib.import_module(entry['reader']),entry['reader'])
+    memberread = 'members' in inspect.signature(reader).parameters
+    return memberread
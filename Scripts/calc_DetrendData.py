@@ -42,6 +42,7 @@ def detrendData(datavar,level,timeperiod):
     ### Import modules
     import numpy as np
     import scipy.stats as sts
+    import calc_ReadUtilities as RU
     
     ### Detrend data array
     if level == 'surface':
@@ -72,7 +73,7 @@ def detrendData(datavar,level,timeperiod):
                             intercepts[ens,i,j] = np.nan
             print('Completed: Detrended data for each grid point!')
                                 
-            datavardt = np.empty(datavar.shape)
+            datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
             for ens in range(datavar.shape[0]):
                 for yr in range(datavar.shape[1]):
                     datavardt[ens,yr,:,:] = datavar[ens,yr,:,:] - \
@@ -108,7 +109,7 @@ def detrendData(datavar,level,timeperiod):
                                 intercepts[ens,mo,i,j] = np.nan
             print('Completed: Detrended data for each grid point!')
                                 
-            datavardt = np.empty(datavar.shape)
+            datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
             for ens in range(datavar.shape[0]):
                 for yr in range(datavar.shape[1]):
                     for mo in range(datavar.shape[2]):
@@ -149,7 +150,7 @@ def detrendData(datavar,level,timeperiod):
                                 intercepts[ens,mo,le,i,j] = np.nan
         print('Completed: Detrended data for each grid point!')
                             
-        datavardt = np.empty(datavar.shape)
+        datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
         for yr in range(datavar.shape[1]):
             datavardt[:,yr,:,:,:,:] = datavar[:,yr,:,:,:,:] - \
                                     (slopes*x[yr] + intercepts)        
@@ -194,6 +195,7 @@ def detrendDataR(datavar,level,timeperiod):
     import numpy as np
     import sys
     import scipy.stats as sts
+    import calc_ReadUtilities as RU
     
     ### Detrend data array
     if level == 'surface':
@@ -222,7 +224,7 @@ def detrendDataR(datavar,level,timeperiod):
                         intercepts[i,j] = np.nan
             print('Completed: Detrended data for each grid point!')
                                 
-            datavardt = np.empty(datavar.shape)
+            datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
             for yr in range(datavar.shape[0]):
                 datavardt[yr,:,:] = datavar[yr,:,:] - (slopes*x[yr] + intercepts)
                 
@@ -254,7 +256,7 @@ def detrendDataR(datavar,level,timeperiod):
                             intercepts[mo,i,j] = np.nan
             print('Completed: Detrended data for each grid point!')
                                 
-            datavardt = np.empty(datavar.shape)
+            datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
             for yr in range(datavar.shape[0]):
                 datavardt[yr,:,:,:] = datavar[yr,:,:,:] - (slopes*x[yr] + intercepts)
                 
@@ -293,7 +295,7 @@ def detrendDataR(datavar,level,timeperiod):
                             intercepts[mo,le,i,j] = np.nan
         print('Completed: Detrended data for each grid point!')
                             
-        datavardt = np.empty(datavar.shape)
+        datavardt = np.empty(datavar.shape,dtype=RU.getComputeDtype())
         for yr in range(datavar.shape[1]):
             datavardt[yr,:,:,:,:] = datavar[yr,:,:,:,:] - \
                                     (slopes*x[yr] + intercepts)        
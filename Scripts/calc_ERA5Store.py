@@ -0,0 +1,385 @@
+"""
+Functions keep an append-only, chunked store of the ERA5 monthly fields for
+each variable. New months are appended to the store, and the derived
+products (annual/seasonal means, the 1981-2010 monthly climatology and the
+anomalies against it) are only updated for the years that changed. Each grid
+(LOWS, MEDS or HIGHS) has its own stores in ERA5_<grid>/ of the directory
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setStoreDirectory(directory)
+    [2] getStoreFile(vari,grid)
+    [3] getStoreYears(storefile)
+    [4] appendMonths(vari,filename,yearstart,monthstart,grid)
+    [5] updateDerived(storefile,vari,years)
+    [6] readDerived(vari,product,anomalies,grid)
+"""
+
+### Directory of the ERA5 stores and None to read the single files
+### (see setStoreDirectory)
+STOREDIRECTORY = None
+
+### Months of each derived product
+PRODUCTS = {'annual' : list(range(12)),'MAM' : [2,3,4],'JJA' : [5,6,7],
+            'SON' : [8,9,10]}
+
+### Baseline of the climatology and anomalies
+YEARBASEMIN = 1981
+YEARBASEMAX = 2010
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setStoreDirectory(directory):
+    """
+    Function sets where the ERA5 stores are kept (None to switch off)
+
+    Parameters
+    ----------
+    directory : string or None
+        directory of the stores and None to read the single files
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setStoreDirectory(directory)
+    """
+    global STOREDIRECTORY
+
+    STOREDIRECTORY = directory
+    print('ERA5 monthly stores ---> %s' % STOREDIRECTORY)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getStoreFile(vari,grid='MEDS'):
+    """
+    Function returns the store of a variable
+
+    Parameters
+    ----------
+    vari : string
+        variable for analysis
+    grid : string
+        LOWS or MEDS or HIGHS
+
+    Returns
+    -------
+    storefile : string or None
+        path of the store and None if there is no store
+
+    Usage
+    -----
+    storefile = getStoreFile(vari,grid)
+    """
+
+    ### Import modules
+    import os
+
+    if STOREDIRECTORY is None:
+        return None
+    storefile = os.path.join(STOREDIRECTORY,'ERA5_%s' % grid,'%s_store.nc' % vari)
+    if not os.path.exists(storefile):
+        return None
+    return storefile
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getStoreYears(storefile):
+    """
+    Function returns the years of a store that have all 12 months
+
+    Parameters
+    ----------
+    storefile : string
+        path of the store (see getStoreFile)
+
+    Returns
+    -------
+    years : 1d numpy array
+        complete years
+
+    Usage
+    -----
+    years = getStoreYears(storefile)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+
+    data = Dataset(storefile,'r')
+    yearstart = int(data.yearstart)
+    numOfMonths = data.variables['time'].shape[0]
+    data.close()
+
+    years = np.arange(yearstart,yearstart + numOfMonths//12,1)
+    return years
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def appendMonths(vari,filename,yearstart,monthstart=1,grid='MEDS'):
+    """
+    Function appends the months of a file to the store of a variable (the
+    store is created from the first file). Months that are already in the
+    store are skipped and a gap before the new months stops the ingest
+
+    Parameters
+    ----------
+    vari : string
+        variable for analysis
+    filename : string
+        netCDF file with [time,(level),lat,lon] monthly fields
+    yearstart : integer
+        year of the first month in the file
+    monthstart : integer
+        first month in the file (1 = January)
+    grid : string
+        LOWS or MEDS or HIGHS (grid of the file)
+
+    Returns
+    -------
+    years : 1d numpy array
+        years that were changed
+
+    Usage
+    -----
+    years = appendMonths(vari,filename,yearstart,monthstart,grid)
+    """
+    print('\n>>>>>>>>>> STARTING appendMonths function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import sys
+    from netCDF4 import Dataset
+
+    if STOREDIRECTORY is None:
+        print(ValueError('SET THE STORE DIRECTORY FIRST (setStoreDirectory)!!!'))
+        sys.exit()
+    directorystore = os.path.join(STOREDIRECTORY,'ERA5_%s' % grid)
+    storefile = os.path.join(directorystore,'%s_store.nc' % vari)
+
+    source = Dataset(filename,'r')
+    ncsource = source.variables['%s' % vari]
+    ncsource.set_auto_maskandscale(False)
+    monthfirst = yearstart*12 + monthstart - 1
+
+    ### Create the store with the grid and attributes of the first file
+    if not os.path.exists(storefile):
+        os.makedirs(directorystore,exist_ok=True)
+        if monthstart != 1:
+            source.close()
+            print(ValueError('A NEW STORE HAS TO START IN JANUARY!!!'))
+            sys.exit()
+        store = Dataset(storefile + '.tmp','w',format='NETCDF4')
+        store.description = 'Append-only ERA5 monthly %s (see calc_ERA5Store)' % vari
+        store.yearstart = yearstart
+        store.createDimension('time',None)
+        store.createDimension('year',None)
+        store.createDimension('month',12)
+        store.createVariable('time','i4',('time',))
+        store.createVariable('year','i4',('year',))
+        dims = ncsource.dimensions[1:]
+        for dim in dims:
+            store.createDimension(dim,source.dimensions[dim].size)
+            if dim in source.variables:
+                coord = store.createVariable(dim,source.variables[dim].dtype,(dim,))
+                coord[:] = source.variables[dim][:]
+        attributes = {att : ncsource.getncattr(att) for att in ncsource.ncattrs()}
+        chunks = (12,) + tuple(source.dimensions[dim].size for dim in dims)
+        storevar = store.createVariable(vari,ncsource.dtype,('time',) + dims,
+                                        fill_value=attributes.pop('_FillValue',None),
+                                        chunksizes=chunks,zlib=True,shuffle=True)
+        storevar.setncatts(attributes)
+        for product in list(PRODUCTS) + ['%s_anom' % product for product in PRODUCTS]:
+            store.createVariable(product,'f4',('year',) + dims,fill_value=np.nan,
+                                 chunksizes=(1,) + chunks[1:],zlib=True,shuffle=True)
+        store.createVariable('climo','f4',('month',) + dims,fill_value=np.nan)
+        store.close()
+        os.replace(storefile + '.tmp',storefile)
+
+    store = Dataset(storefile,'a')
+    storevar = store.variables['%s' % vari]
+    storevar.set_auto_maskandscale(False)
+    numOfStore = storevar.shape[0]
+    monthnext = int(store.yearstart)*12 + numOfStore
+    if monthfirst > monthnext:
+        store.close()
+        source.close()
+        print(ValueError('MONTHS ARE MISSING BEFORE THE NEW FILE!!!'))
+        sys.exit()
+
+    ### Append the new months one year of months at a time
+    skip = monthnext - monthfirst
+    numOfNew = max(ncsource.shape[0] - skip,0)
+    for t in range(0,numOfNew,12):
+        block = ncsource[skip+t:skip+min(t+12,numOfNew)]
+        storevar[numOfStore+t:numOfStore+t+block.shape[0]] = block
+        store.variables['time'][numOfStore+t:numOfStore+t+block.shape[0]] = \
+            np.arange(monthnext+t,monthnext+t+block.shape[0])
+    store.close()
+    source.close()
+
+    months = np.arange(monthnext,monthnext+numOfNew)
+    years = np.unique(months//12)
+    print('Completed: appended %s new months of %s' % (numOfNew,vari))
+    if years.shape[0] > 0:
+        updateDerived(storefile,vari,years)
+    print('>>>>>>>>>> ENDING appendMonths function!')
+    return years
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def updateDerived(storefile,vari,years):
+    """
+    Function updates the derived products of the years that changed. The
+    climatology (and so every anomaly) is only updated when a changed year is
+    in the 1981-2010 baseline
+
+    Parameters
+    ----------
+    storefile : string
+        path of the store (see getStoreFile)
+    vari : string
+        variable for analysis
+    years : 1d numpy array
+        years that changed
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    updateDerived(storefile,vari,years)
+    """
+
+    ### Import modules
+    import numpy as np
+    import warnings
+    from netCDF4 import Dataset
+    warnings.simplefilter(action='ignore',category=RuntimeWarning)
+
+    store = Dataset(storefile,'a')
+    storevar = store.variables['%s' % vari]
+    storevar.set_auto_mask(False)
+    yearstart = int(store.yearstart)
+    numOfMonths = storevar.shape[0]
+    yearsall = np.arange(yearstart,yearstart + (numOfMonths+11)//12,1)
+
+    def readYear(year):
+        t = (year - yearstart)*12
+        monthsyear = np.full((12,) + storevar.shape[1:],np.nan)
+        block = storevar[t:min(t+12,numOfMonths)]
+        monthsyear[:block.shape[0]] = block
+        return monthsyear
+
+    ### 1981-2010 monthly climatology (same as the readers)
+    baseline = np.arange(YEARBASEMIN,YEARBASEMAX+1,1)
+    if np.any(np.isin(years,baseline)):
+        total = np.zeros((12,) + storevar.shape[1:])
+        count = np.zeros((12,) + storevar.shape[1:])
+        for year in baseline[np.isin(baseline,yearsall)]:
+            monthsyear = readYear(year)
+            total += np.where(np.isnan(monthsyear),0,monthsyear)
+            count += np.isfinite(monthsyear)
+        store.variables['climo'][:] = total/count
+        years = yearsall
+        print('Completed: updated the %s-%s climatology' % (YEARBASEMIN,YEARBASEMAX))
+    climo = np.ma.getdata(store.variables['climo'][:])
+
+    ### Means and anomalies of the changed years (nan until complete)
+    for year in years:
+        monthsyear = readYear(year)
+        y = year - yearstart
+        numOfYearMonths = min(numOfMonths - y*12,12)
+        for product,months in PRODUCTS.items():
+            if max(months) < numOfYearMonths:
+                store.variables[product][y] = np.nanmean(monthsyear[months],axis=0)
+                store.variables['%s_anom' % product][y] = np.nanmean(monthsyear[months] -
+                                                                     climo[months],axis=0)
+            else:
+                store.variables[product][y] = np.nan
+                store.variables['%s_anom' % product][y] = np.nan
+        store.variables['year'][y] = year
+    store.close()
+    print('Completed: updated derived products for %s years' % len(years))
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readDerived(vari,product,anomalies=False,grid='MEDS'):
+    """
+    Function reads a derived product of the complete years in a store
+
+    Parameters
+    ----------
+    vari : string
+        variable for analysis
+    product : string
+        annual or MAM or JJA or SON
+    anomalies : boolean
+        True for anomalies against 1981-2010
+    grid : string
+        LOWS or MEDS or HIGHS
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    years : 1d numpy array
+        years
+    var : numpy array
+        [year,(level),lat,lon] in the units of the store
+
+    Usage
+    -----
+    lat1,lon1,years,var = readDerived(vari,product,anomalies,grid)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    from netCDF4 import Dataset
+
+    storefile = getStoreFile(vari,grid)
+    if storefile is None or product not in PRODUCTS:
+        print(ValueError('NO STORE OR WRONG PRODUCT FOR %s!!!' % vari))
+        sys.exit()
+    years = getStoreYears(storefile)
+
+    data = Dataset(storefile,'r')
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    name = '%s_anom' % product if anomalies == True else product
+    var = np.ma.getdata(data.variables[name][:years.shape[0]])
+    data.close()
+    return lat1,lon1,years,var
+
+# ### Test functions - do not use!
+# import calc_ERA5Store as ES
+# ES.setStoreDirectory('/work/Zachary.Labe/Data/ERA5_store/')
+# years = ES.appendMonths('T2M','/work/Zachary.Labe/Data/ERA5_MEDS/T2M_1940-2022.nc',1940)
+# years = ES.appendMonths('T2M','/work/Zachary.Labe/Data/ERA5_MEDS/T2M_2023-01.nc',2023,1)
+# years = ES.appendMonths('T2M','/work/Zachary.Labe/Data/ERA5_LOWS/T2M_1979-2021.nc',1979,1,'LOWS')
+# lat1,lon1,years,var = ES.readDerived('T2M','JJA',anomalies=True)
@@ -0,0 +1,426 @@
+"""
+Functions count the days beyond percentile thresholds of daily data for each
+member, year and grid point. The counts of all thresholds are found in one
+pass over [ens,year,day,lat,lon] with broadcast comparisons, one band of
+latitudes at a time in a pool of workers. The percentile thresholds of all
+quantiles are found from one partition (or sort) of each grid point's
+samples in float32, one lat/lon tile at a time in a pool of processes. When
+the daily cubes of calc_DailyExtract exist, both are found one tile of the
+cubes at a time, so only one tile is ever read into memory
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setExtremeWorkers(workers)
+    [2] countBand(data,thresholds,above)
+    [3] countExceedances(data,thresholds,above,workers)
+    [4] percentileBlock(data,quantiles)
+    [5] percentileTile(descriptor,quantiles,latslice,lonslice)
+    [6] calcPercentiles(climdist,quantiles,workers)
+    [7] streamExtremes(cubefile,basefile,variq,quantiles,baseq,above,offset)
+"""
+
+### Number of latitude bands counted (and tiles of percentiles found) at the
+### same time (see setExtremeWorkers)
+EXTREMEWORKERS = 1
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setExtremeWorkers(workers):
+    """
+    Function sets how many latitude bands are counted (and percentile tiles
+    are found) at the same time
+
+    Parameters
+    ----------
+    workers : integer
+        number of bands or tiles at once (1 = one after another)
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setExtremeWorkers(workers)
+    """
+    global EXTREMEWORKERS
+
+    ### Import modules
+    import sys
+
+    if workers < 1:
+        print(ValueError('WRONG NUMBER OF WORKERS SELECTED!!!'))
+        sys.exit()
+    EXTREMEWORKERS = int(workers)
+    print('Counting extremes with %s worker(s)!' % EXTREMEWORKERS)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def countBand(data,thresholds,above=True):
+    """
+    Function counts the days beyond each threshold for one band of grid
+    points. Years without any finite day (or with an infinite day) are nan,
+    and nan days are never counted
+
+    Parameters
+    ----------
+    data : 5d numpy array
+        [ens,year,day,lat,lon]
+    thresholds : 4d numpy array
+        [threshold,ens,lat,lon]
+    above : boolean
+        True to count days > threshold and False for days < threshold
+
+    Returns
+    -------
+    counts : 5d numpy array
+        [threshold,ens,year,lat,lon]
+
+    Usage
+    -----
+    counts = countBand(data,thresholds,above)
+    """
+
+    ### Import modules
+    import numpy as np
+    import warnings
+
+    with warnings.catch_warnings():
+        warnings.simplefilter(action='ignore',category=RuntimeWarning)
+        valid = np.isfinite(np.nanmax(data,axis=2))
+
+    counts = np.empty((thresholds.shape[0],) + valid.shape)
+    for t in range(thresholds.shape[0]):
+        threshold = thresholds[t][:,np.newaxis,np.newaxis,:,:]
+        if above == True:
+            np.sum(data > threshold,axis=2,out=counts[t])
+        else:
+            np.sum(data < threshold,axis=2,out=counts[t])
+    counts[:,~valid] = np.nan
+    return counts
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def countExceedances(data,thresholds,above=True,workers=None):
+    """
+    Function counts the days beyond each threshold for every member, year
+    and grid point (same as looping over ens, lat, lon and year with
+    (summerens > threshold).sum() when np.nanmax(summerens) is finite)
+
+    Parameters
+    ----------
+    data : 5d numpy array
+        [ens,year,day,lat,lon] (masked values are treated as nan)
+    thresholds : list of 3d numpy arrays
+        [ens,lat,lon] for each threshold (e.g., tx90,tx95,tx99)
+    above : boolean
+        True to count days > threshold and False for days < threshold
+    workers : integer or None
+        number of bands counted at once (None = EXTREMEWORKERS)
+
+    Returns
+    -------
+    counts : list of 4d numpy arrays
+        [ens,year,lat,lon] for each threshold
+
+    Usage
+    -----
+    counts = countExceedances(data,thresholds,above,workers)
+    """
+    print('\n>>>>>>>>>> STARTING countExceedances function!')
+
+    ### Import modules
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers is None:
+        workers = EXTREMEWORKERS
+    if np.ma.isMaskedArray(data):
+        data = np.ma.filled(data.astype(np.result_type(data.dtype,np.float32)),np.nan)
+    thresholds = np.stack([np.ma.filled(np.ma.asarray(threshold,dtype=float),np.nan)
+                           for threshold in thresholds])
+
+    ### Bands of latitudes (numpy releases the GIL, so threads share data)
+    numOfLats = data.shape[3]
+    numOfBands = min(numOfLats,max(1,workers*4))
+    edges = np.linspace(0,numOfLats,numOfBands+1).astype(int)
+    bands = [slice(edges[b],edges[b+1]) for b in range(numOfBands)]
+
+    counts = np.empty((thresholds.shape[0],data.shape[0],data.shape[1],numOfLats,
+                       data.shape[4]))
+    def countOne(band):
+        counts[:,:,:,band,:] = countBand(data[:,:,:,band,:],thresholds[:,:,band,:],above)
+    if workers == 1:
+        for band in bands:
+            countOne(band)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(countOne,bands))
+
+    print('Completed: counted %s thresholds in %s bands' % (thresholds.shape[0],numOfBands))
+    print('>>>>>>>>>> ENDING countExceedances function!')
+    return list(counts)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def percentileBlock(data,quantiles):
+    """
+    Function finds the percentiles of all quantiles for a block of grid
+    points from one partition of the samples (same as np.nanpercentile with
+    linear interpolation). Blocks with missing samples are sorted once
+    instead, since each grid point then has its own number of samples
+
+    Parameters
+    ----------
+    data : 4d numpy array
+        [ens,sample,lat,lon] float32 with nan for missing samples
+    quantiles : list of floats
+        percentiles (0 to 100)
+
+    Returns
+    -------
+    percentiles : 4d numpy array
+        [quantile,ens,lat,lon] float32 (nan without any sample)
+
+    Usage
+    -----
+    percentiles = percentileBlock(data,quantiles)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    numOfSamples = data.shape[1]
+    count = np.sum(~np.isnan(data),axis=1)
+    quantiles = np.asarray(quantiles,dtype=np.float64)/100.
+
+    ### Positions of the quantiles in the sorted samples
+    virtual = (count[np.newaxis] - 1)*quantiles[:,np.newaxis,np.newaxis,np.newaxis]
+    previous = np.clip(np.floor(virtual),0,np.maximum(count - 1,0)).astype(np.intp)
+    following = np.clip(previous + 1,0,np.maximum(count - 1,0))
+    gamma = (virtual - previous).astype(data.dtype)
+
+    if np.all(count == numOfSamples):
+        kth = np.unique(np.concatenate([previous.ravel(),following.ravel()]))
+        ordered = np.partition(data,kth,axis=1)
+    else:
+        ordered = np.sort(data,axis=1)
+
+    percentiles = np.empty(virtual.shape,dtype=data.dtype)
+    for q in range(quantiles.shape[0]):
+        below = np.take_along_axis(ordered,previous[q][:,np.newaxis],axis=1)[:,0]
+        above = np.take_along_axis(ordered,following[q][:,np.newaxis],axis=1)[:,0]
+        difference = above - below
+        percentiles[q] = np.where(gamma[q] >= 0.5,above - difference*(1 - gamma[q]),
+                                  below + difference*gamma[q])
+    percentiles[:,count == 0] = np.nan
+    return percentiles
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def percentileTile(descriptor,quantiles,latslice,lonslice):
+    """
+    Function finds the percentiles of one tile of a shared array (worker of
+    calcPercentiles)
+
+    Parameters
+    ----------
+    descriptor : tuple
+        (name,shape,dtype) of the shared [ens,sample,lat,lon] array
+    quantiles : list of floats
+        percentiles (0 to 100)
+    latslice : slice
+        latitudes of the tile
+    lonslice : slice
+        longitudes of the tile
+
+    Returns
+    -------
+    latslice : slice
+        latitudes of the tile
+    lonslice : slice
+        longitudes of the tile
+    percentiles : 4d numpy array
+        [quantile,ens,lat,lon] float32
+
+    Usage
+    -----
+    latslice,lonslice,percentiles = percentileTile(descriptor,quantiles,latslice,lonslice)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_SharedArrays as SA
+
+    data = SA.attachArray(descriptor)
+    tile = np.array(data[:,:,latslice,lonslice])
+    del data
+    return latslice,lonslice,percentileBlock(tile,quantiles)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def calcPercentiles(climdist,quantiles,workers=None):
+    """
+    Function finds the percentile thresholds of all quantiles for every
+    member and grid point (e.g., tx90,tx95,tx99 of the 1981-2010 JJA days).
+    The baseline is copied once into shared memory as float32, and the tiles
+    are split over a pool of processes
+
+    Parameters
+    ----------
+    climdist : 4d numpy array
+        [ens,sample,lat,lon] (masked values are treated as nan)
+    quantiles : list of floats
+        percentiles (0 to 100)
+    workers : integer or None
+        number of tiles at once (None = EXTREMEWORKERS)
+
+    Returns
+    -------
+    percentiles : list of 3d numpy arrays
+        [ens,lat,lon] float32 for each quantile
+
+    Usage
+    -----
+    percentiles = calcPercentiles(climdist,quantiles,workers)
+    """
+    print('\n>>>>>>>>>> STARTING calcPercentiles function!')
+
+    ### Import modules
+    import numpy as np
+    from concurrent.futures import ProcessPoolExecutor
+    import calc_SharedArrays as SA
+    import calc_DailyExtract as DX
+
+    if workers is None:
+        workers = EXTREMEWORKERS
+    climdist = np.ma.filled(np.ma.asarray(climdist).astype(np.float32),np.nan)
+
+    ### Tiles of the daily cube (see calc_DailyExtract.setTileShape)
+    numOfLats,numOfLons = climdist.shape[2:]
+    tiles = [(slice(i,min(i+DX.TILESHAPE[0],numOfLats)),slice(j,min(j+DX.TILESHAPE[1],numOfLons)))
+             for i in range(0,numOfLats,DX.TILESHAPE[0])
+             for j in range(0,numOfLons,DX.TILESHAPE[1])]
+
+    percentiles = np.empty((len(quantiles),climdist.shape[0],numOfLats,numOfLons),
+                           dtype=np.float32)
+    if workers == 1:
+        for latslice,lonslice in tiles:
+            percentiles[:,:,latslice,lonslice] = percentileBlock(climdist[:,:,latslice,lonslice],
+                                                                 quantiles)
+    else:
+        descriptor = SA.publishArray(climdist)
+        del climdist
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(percentileTile,descriptor,quantiles,latslice,lonslice)
+                           for latslice,lonslice in tiles]
+                for future in futures:
+                    latslice,lonslice,tile = future.result()
+                    percentiles[:,:,latslice,lonslice] = tile
+        finally:
+            SA.releaseArray(descriptor)
+
+    print('Completed: %s percentiles in %s tiles' % (len(quantiles),len(tiles)))
+    print('>>>>>>>>>> ENDING calcPercentiles function!')
+    return list(percentiles)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def streamExtremes(cubefile,basefile,variq,quantiles,baseq,above=True,offset=0.):
+    """
+    Function finds the percentile thresholds of the baseline years and counts
+    the days beyond them one tile of the daily cubes at a time (same as
+    calcPercentiles and countExceedances on the whole arrays). Both cubes are
+    read in the order of their chunks (see calc_DailyExtract.iterTiles)
+
+    Parameters
+    ----------
+    cubefile : string
+        cube of the days that are counted (see calc_DailyExtract.getCube)
+    basefile : string
+        cube of the baseline (e.g., SPEAR_MED, or cubefile itself)
+    variq : string
+        variable name for raw SPEAR data
+    quantiles : list of floats
+        percentiles (0 to 100)
+    baseq : 1d numpy array
+        indices of the baseline years in basefile
+    above : boolean
+        True to count days > threshold and False for days < threshold
+    offset : float
+        added to the days of both cubes (e.g., -273.15 for K to C)
+
+    Returns
+    -------
+    lat : 1d numpy array
+        latitudes
+    lon : 1d numpy array
+        longitudes
+    counts : list of 4d numpy arrays
+        [ens,year,lat,lon] float32 for each quantile
+
+    Usage
+    -----
+    lat,lon,counts = streamExtremes(cubefile,basefile,variq,quantiles,baseq,above,offset)
+    """
+    print('\n>>>>>>>>>> STARTING streamExtremes function!')
+
+    ### Import modules
+    import numpy as np
+    import sys
+    from netCDF4 import Dataset
+    import calc_DailyExtract as DX
+
+    data = Dataset(cubefile,'r')
+    lat = data.variables['lat'][:]
+    lon = data.variables['lon'][:]
+    shape = data.variables['%s' % variq].shape
+    data.close()
+
+    counts = np.empty((len(quantiles),shape[0],shape[1],lat.shape[0],lon.shape[0]),
+                      dtype=np.float32)
+    numOfTiles = 0
+    for (latslice,lonslice,tile),(latbase,lonbase,base) in zip(DX.iterTiles(cubefile,variq),
+                                                              DX.iterTiles(basefile,variq)):
+        if any([latslice != latbase,lonslice != lonbase]):
+            print(ValueError('CUBES DO NOT HAVE THE SAME TILES!!!'))
+            sys.exit()
+        climdist = base[:,baseq].reshape(base.shape[0],len(baseq)*base.shape[2],
+                                         base.shape[3],base.shape[4])
+        if offset != 0.:
+            tile = tile + offset
+            climdist = climdist + offset
+        thresholds = percentileBlock(climdist,quantiles)
+        counts[:,:,:,latslice,lonslice] = countBand(tile,thresholds,above)
+        numOfTiles += 1
+
+    print('Completed: %s percentiles in %s tiles' % (len(quantiles),numOfTiles))
+    print('>>>>>>>>>> ENDING streamExtremes function!')
+    return lat,lon,list(counts)
+
+# ### Test functions - do not use!
+# import calc_Extremes as XT
+# XT.setExtremeWorkers(8)
+# count90v,count95v,count99v = XT.countExceedances(datamask,[tx90,tx95,tx99],above=True)
+# tx90,tx95,tx99 = XT.calcPercentiles(climdist,[90,95,99])
+# lat,lon,counts = XT.streamExtremes(cubefile,basefile,'t_ref_max',[90,95,99],baseq)
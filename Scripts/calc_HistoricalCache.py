@@ -0,0 +1,250 @@
+"""
+Functions share the 1921-2010 historical segment of the SPEAR_MED members
+between the scenario reads, so it is only read once for each variable,
+season and region. Segments are kept in memory within a process (see
+setHistoricalCache) and on disk across processes when the readFiles cache is
+on (see calc_ReadCache.setCacheDirectory)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setHistoricalCache(memory)
+    [2] getSegmentKey(filenames,vari,months,lat_bounds,lon_bounds,dtype)
+    [3] loadSegment(filenames,vari,months,lat_bounds,lon_bounds,out)
+    [4] saveSegment(segment,filenames,vari,months,lat_bounds,lon_bounds)
+"""
+
+### True to keep the segments in memory (see setHistoricalCache)
+HISTORICALMEMORY = False
+
+### Segments kept in memory (key : (file stats,[ens,time,lat,lon] array))
+HISTORICALSEGMENTS = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setHistoricalCache(memory):
+    """
+    Function switches the in-memory historical segments on or off
+
+    Parameters
+    ----------
+    memory : boolean
+        True to keep each segment in memory after it is read once
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setHistoricalCache(memory)
+    """
+    global HISTORICALMEMORY
+
+    HISTORICALMEMORY = memory
+    if HISTORICALMEMORY == False:
+        HISTORICALSEGMENTS.clear()
+    print('Historical segments in memory are %s!' % ('ON' if memory else 'OFF'))
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getSegmentKey(filenames,vari,months,lat_bounds,lon_bounds,dtype):
+    """
+    Function makes the name of a historical segment
+
+    Parameters
+    ----------
+    filenames : list of strings
+        historical file of each ensemble member (in order)
+    vari : string
+        variable for analysis
+    months : list of integers
+        months of each year that were read
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    dtype : numpy dtype
+        data type of the segment
+
+    Returns
+    -------
+    key : string
+        sha1 of the request
+
+    Usage
+    -----
+    key = getSegmentKey(filenames,vari,months,lat_bounds,lon_bounds,dtype)
+    """
+
+    ### Import modules
+    import numpy as np
+    import hashlib
+    import calc_ReadCache as RC
+
+    request = repr((list(filenames),vari,list(months),
+                    None if lat_bounds is None else tuple(lat_bounds),
+                    None if lon_bounds is None else tuple(lon_bounds),
+                    np.dtype(dtype).str,RC.READERVERSION))
+    key = hashlib.sha1(request.encode('utf-8')).hexdigest()
+    return key
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def loadSegment(filenames,vari,months,lat_bounds,lon_bounds,out):
+    """
+    Function copies a shared historical segment into the output array
+
+    Parameters
+    ----------
+    filenames : list of strings
+        historical file of each ensemble member (in order)
+    vari : string
+        variable for analysis
+    months : list of integers
+        months of each year to read
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    out : 4d numpy array
+        [ens,time,lat,lon] array (or view) to copy the segment into
+
+    Returns
+    -------
+    found : boolean
+        True if the segment was copied into out
+
+    Usage
+    -----
+    found = loadSegment(filenames,vari,months,lat_bounds,lon_bounds,out)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import calc_ReadUtilities as RU
+    import calc_ReadCache as RC
+
+    key = getSegmentKey(filenames,vari,months,lat_bounds,lon_bounds,out.dtype)
+    sourcesnow = RC.getFileStats(filenames)
+
+    ### Segment read earlier in this process (unless the files changed)
+    if key in HISTORICALSEGMENTS:
+        sources,segment = HISTORICALSEGMENTS[key]
+        if sources == sourcesnow and segment.shape == out.shape:
+            out[...] = segment
+            RU.READFILES.extend(filenames)
+            print('Completed: historical segment from memory (%s)' % key)
+            return True
+        del HISTORICALSEGMENTS[key]
+
+    ### Segment saved by any process with the readFiles cache on
+    if RC.CACHEDIRECTORY is None:
+        return False
+    directorykey = os.path.join(RC.CACHEDIRECTORY,'historical',key)
+    try:
+        with open(os.path.join(directorykey,'sources.json'),'r') as fileq:
+            sources = json.load(fileq)
+    except (OSError,ValueError):
+        return False
+    if sourcesnow != sources:
+        print('Historical segment %s is out of date!' % key)
+        return False
+    segment = np.load(os.path.join(directorykey,'segment.npy'),mmap_mode='r')
+    if segment.shape != out.shape:
+        return False
+    out[...] = segment
+    del segment
+    RU.READFILES.extend(filenames)
+    if HISTORICALMEMORY == True:
+        HISTORICALSEGMENTS[key] = (sources,out.copy())
+    print('Completed: historical segment from the cache (%s)' % key)
+    return True
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def saveSegment(segment,filenames,vari,months,lat_bounds,lon_bounds):
+    """
+    Function keeps a historical segment that was just read for the next
+    scenario reads (a copy is kept, so the reader can change its array)
+
+    Parameters
+    ----------
+    segment : 4d numpy array
+        [ens,time,lat,lon] historical segment
+    filenames : list of strings
+        historical file of each ensemble member (in order)
+    vari : string
+        variable for analysis
+    months : list of integers
+        months of each year that were read
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    saveSegment(segment,filenames,vari,months,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import shutil
+    import tempfile
+    import calc_ReadCache as RC
+
+    key = getSegmentKey(filenames,vari,months,lat_bounds,lon_bounds,segment.dtype)
+    sources = RC.getFileStats(filenames)
+    if HISTORICALMEMORY == True:
+        HISTORICALSEGMENTS[key] = (sources,segment.copy())
+
+    if RC.CACHEDIRECTORY is None:
+        return
+    if not sources:
+        return
+    directoryhist = os.path.join(RC.CACHEDIRECTORY,'historical')
+    os.makedirs(directoryhist,exist_ok=True)
+    directorykey = os.path.join(directoryhist,key)
+
+    ### Keep an entry of the same files and replace a stale one
+    try:
+        with open(os.path.join(directorykey,'sources.json'),'r') as fileq:
+            if json.load(fileq) == sources:
+                return
+    except (OSError,ValueError):
+        pass
+
+    ### Write into a temporary directory and rename it so readers never see
+    ### a half-written segment
+    directorytemp = tempfile.mkdtemp(prefix=key + '.',dir=directoryhist)
+    np.save(os.path.join(directorytemp,'segment.npy'),np.ascontiguousarray(segment))
+    with open(os.path.join(directorytemp,'sources.json'),'w') as fileq:
+        json.dump(sources,fileq)
+    shutil.rmtree(directorykey,ignore_errors=True)
+    try:
+        os.rename(directorytemp,directorykey)
+    except OSError:
+        shutil.rmtree(directorytemp,ignore_errors=True)
+        return
+    print('Completed: saved historical segment in the cache (%s)' % key)
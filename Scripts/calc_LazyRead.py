@@ -0,0 +1,224 @@
+"""
+Functions build a lazy, chunked xarray.DataArray (dask) for any data set in
+the registry, so selections, anomalies and means are only computed for what
+is finally used. Readers that can read single members (see
+calc_DatasetRegistry.getMemberRead) get one dask chunk per member, so a
+selection of members only reads those members
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getCoords(variq,dataset,monthlychoice,lat_bounds,lon_bounds)
+    [2] readChunk(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds,members)
+    [3] readLazy(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+"""
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getCoords(variq,dataset,monthlychoice,lat_bounds=None,lon_bounds=None):
+    """
+    Function returns the dimension names and coordinates of the array
+    readFiles would return, without reading any data
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    dims : tuple of strings
+        ('ens','years',('months'),'lat','lon') for models and no 'ens' for
+        observations ('time' for monthly data without a months dimension)
+    coords : dictionary
+        coordinates of each dimension (DJF is labeled by the year of Jan/Feb)
+
+    Usage
+    -----
+    dims,coords = getCoords(variq,dataset,monthlychoice,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_DatasetRegistry as DR
+    import calc_dataFunctions as df
+
+    entry = DR.getDataset(dataset)
+    shape = DR.getShape(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    years = DR.getYears(dataset)
+
+    ### Same lat/lon as readFiles (readers or getRegion cut out the region)
+    if entry['regionread'] or all([lat_bounds is None,lon_bounds is None]):
+        lat1,lon1,dtype = DR.getGrid(dataset,variq,lat_bounds,lon_bounds)
+    else:
+        lat1,lon1,dtype = DR.getGrid(dataset,variq)
+        lat1,lon1 = df.getRegion(np.empty((lat1.shape[0],lon1.shape[0])),lat1,lon1,
+                                 lat_bounds if lat_bounds is not None else (-90.,90.),
+                                 lon_bounds if lon_bounds is not None else (0.,360.))[1:]
+
+    dims = ()
+    coords = {}
+    if entry['call'] not in ('obs','era5'):
+        dims += ('ens',)
+        coords['ens'] = np.arange(1,entry['members']+1,1)
+    if monthlychoice == 'DJF':
+        dims += ('years',)
+        coords['years'] = years[1:]
+    elif monthlychoice != 'none':
+        dims += ('years',)
+        coords['years'] = years
+    elif len(shape) == len(dims) + 4:
+        dims += ('years','months')
+        coords['years'] = years
+        coords['months'] = np.arange(1,12+1,1)
+    else:
+        dims += ('time',)
+        coords['time'] = np.repeat(years,12) + (np.tile(np.arange(12),years.shape[0]))/12.
+    dims += ('lat','lon')
+    coords['lat'] = np.ma.getdata(lat1)
+    coords['lon'] = np.ma.getdata(lon1)
+    return dims,coords
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readChunk(variq,dataset,monthlychoice,scenario,lat_bounds=None,lon_bounds=None,
+              members=None):
+    """
+    Function reads one chunk of the lazy array with the registry reader
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+    members : list of integers or None
+        ensemble members to read (1 = first) and None for all members
+
+    Returns
+    -------
+    data : numpy array
+        data from selected data set (same as readFiles)
+
+    Usage
+    -----
+    data = readChunk(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds,members)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_DatasetRegistry as DR
+    import calc_dataFunctions as df
+
+    lat1,lon1,data,regionread = DR.readDataset(variq,dataset,monthlychoice,scenario,
+                                               lat_bounds,lon_bounds,members)
+    if regionread == False and any([lat_bounds is not None,lon_bounds is not None]):
+        data = df.getRegion(data,lat1,lon1,
+                            lat_bounds if lat_bounds is not None else (-90.,90.),
+                            lon_bounds if lon_bounds is not None else (0.,360.))[0]
+    return np.asarray(data)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readLazy(variq,dataset,monthlychoice,scenario,lat_bounds=None,lon_bounds=None):
+    """
+    Function builds a lazy, dimension-named array of a data set. Nothing is
+    read until .compute() (or .values) is called on the final result, and
+    the chunks are then read in parallel by dask
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    data : xarray.DataArray
+        dask-backed data with the dimensions of getCoords
+
+    Usage
+    -----
+    data = readLazy(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    """
+    print('\n>>>>>>>>>> Using readLazy function!')
+
+    ### Import modules
+    import numpy as np
+    import dask
+    import dask.array as da
+    import xarray as xr
+    import calc_ReadUtilities as RU
+    import calc_DatasetRegistry as DR
+
+    dims,coords = getCoords(variq,dataset,monthlychoice,lat_bounds,lon_bounds)
+    shape = tuple(coords[dim].shape[0] for dim in dims)
+    ### Same data type as the readers (DJF means are built in a new array)
+    if monthlychoice == 'DJF':
+        dtype = RU.getComputeDtype()
+    elif RU.READDTYPE is not None:
+        dtype = RU.READDTYPE
+    else:
+        dtype = DR.getGrid(dataset,variq)[2]
+
+    ### One chunk per member when the reader can read single members
+    if DR.getMemberRead(dataset):
+        chunks = [da.from_delayed(dask.delayed(readChunk)(variq,dataset,monthlychoice,
+                                                          scenario,lat_bounds,lon_bounds,
+                                                          [ensmember]),
+                                  shape=(1,)+shape[1:],dtype=dtype)
+                  for ensmember in coords['ens']]
+        lazy = da.concatenate(chunks,axis=0)
+    else:
+        lazy = da.from_delayed(dask.delayed(readChunk)(variq,dataset,monthlychoice,
+                                                       scenario,lat_bounds,lon_bounds),
+                               shape=shape,dtype=dtype)
+
+    data = xr.DataArray(lazy,dims=dims,coords=coords,name=variq,
+                        attrs={'dataset' : dataset,'monthlychoice' : monthlychoice,
+                               'scenario' : str(scenario)})
+    print('>>>>>>>>>> Completed: lazy %s %s %s (%s chunks)' % (dataset,variq,
+                                                               str(shape),
+                                                               np.prod(lazy.numblocks)))
+    return data
+
+# ### Test functions - do not use!
+# import calc_LazyRead as LZ
+# data = LZ.readLazy('T2M','SPEAR_MED','JJA','SSP585',(20,60),(230,300))
+# ensmean = data.sel(ens=slice(1,10)).mean('ens')
+# anomalies = (ensmean - ensmean.sel(years=slice(2015,2044)).mean('years')).compute()
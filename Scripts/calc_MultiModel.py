@@ -0,0 +1,405 @@
+"""
+Functions read several large ensembles (SMILE, the MMLEA models and CMIP6)
+for one common period, reading only those years from the files of each
+model, and put them in one [model,ens,year,lat,lon] array. Models with fewer
+members are padded with a mask instead of nan-filled copies
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] addModel(model,directory,filename,years,members,latname,lonname,missing,units)
+    [2] getModel(model)
+    [3] getOverlap(models,monthlychoice,years)
+    [4] getTimeIndex(model,years,monthlychoice)
+    [5] readModel(variq,model,monthlychoice,years,lat_bounds,lon_bounds,workers)
+    [6] readModels(variq,models,monthlychoice,years,grid,lat_bounds,lon_bounds,workers)
+"""
+
+###############################################################################
+###############################################################################
+###############################################################################
+### Large ensembles
+###     directory : directory of the model
+###     filename  : file of each member relative to directory, formatted with
+###                 model, vari, member (1, 2, ...) and years ('YYYY-YYYY')
+###     years     : (first,last) year of the files
+###     members   : number of ensemble members
+###     latname   : name of the latitude variable
+###     lonname   : name of the longitude variable
+###     missing   : (operator,value) of the missing values of the reader
+###     units     : unit conversion of the reader (vari : (operator,value))
+DIRECTORYDATA = '/work/Zachary.Labe/Data/'
+
+### Unit conversions of the readers (read_SMILE only changes T2M and SLP, and
+### the LOWS readers only change temperatures)
+KELVIN = {'T2M' : ('-',273.15),'SST' : ('-',273.15),'TMAX' : ('-',273.15),
+          'TMIN' : ('-',273.15)}
+SMILEUNITS = {'T2M' : ('-',273.15),'SLP' : ('/',100)}
+
+def modelEntry(directory,filename,years,members,latname='lat',lonname='lon',
+               missing=(('<=',-999),),units=None):
+    return {'directory' : directory,'filename' : filename,'years' : years,
+            'members' : members,'latname' : latname,'lonname' : lonname,
+            'missing' : list(missing),'units' : dict(units) if units is not None else {}}
+
+def smileEntry(years,members):
+    return modelEntry(DIRECTORYDATA + 'SMILE/','{model}/monthly/{vari}_{member}_{years}.nc',
+                      years,members,latname='latitude',lonname='longitude',
+                      missing=[('<=',-999)],units=SMILEUNITS)
+
+def lowsEntry(directory,years,members,missing):
+    return modelEntry(DIRECTORYDATA + directory,'{vari}/{vari}_{member:03d}_{years}.nc',
+                      years,members,missing=missing,units=KELVIN)
+
+MODELS = {
+    'CCCma_canesm2' : smileEntry((1950,2100),50),
+    'CSIRO_MK3.6' : smileEntry((1850,2100),30),
+    'GFDL_CM3' : smileEntry((1920,2100),20),
+    'GFDL_ESM2M' : smileEntry((1950,2100),30),
+    'KNMI_ecearth' : smileEntry((1860,2100),16),
+    'MPI' : smileEntry((1850,2099),40),
+    'LENS1_LOWS' : lowsEntry('LENS1_LOWS/monthly/',(1920,2100),40,[('<',-999)]),
+    'LENS2_LOWS' : lowsEntry('LENS2_LOWS/monthly/',(1850,2100),100,[('<',-999)]),
+    'MIROC6_LE_LOWS' : lowsEntry('MIROC6_LE_LOWS/monthly/',(1850,2100),50,
+                                 [('<=',-999),('>=',1e16)]),
+    'SMHI_LE_LOWS' : lowsEntry('SMHI_LE_LOWS/monthly/',(1970,2100),50,
+                               [('<=',-999),('>=',1e20)]),
+    'MPI_ESM12_HR_LOWS' : lowsEntry('MPI_ESM12_HR_LOWS/monthly/',(1850,2100),10,
+                                    [('<=',-999),('>=',1e16)]),
+    'FLOR_LOWS' : lowsEntry('FLOR/FLOR_LOWS/monthly/',(1921,2100),30,[('<',-999)]),
+    }
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def addModel(model,directory,filename,years,members,latname='lat',lonname='lon',
+             missing=(('<=',-999),),units=None):
+    """
+    Function adds a model to MODELS (e.g., a CMIP6 model, whose years depend
+    on the files that were processed)
+
+    Parameters
+    ----------
+    model : string
+        name of the model
+    directory : string
+        directory of the model
+    filename : string
+        file of each member relative to directory (see MODELS)
+    years : 2 integers
+        (first,last) year of the files
+    members : integer
+        number of ensemble members
+    latname : string
+        name of the latitude variable
+    lonname : string
+        name of the longitude variable
+    missing : list of tuples
+        (operator,value) of the missing values
+    units : dictionary or None
+        unit conversion of each variable (vari : (operator,value)) and None
+        to keep the units of the files
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    addModel(model,directory,filename,years,members,latname,lonname,missing,units)
+    """
+
+    MODELS[model] = modelEntry(directory,filename,tuple(years),members,
+                               latname=latname,lonname=lonname,missing=missing,
+                               units=units)
+    print('Added model ---> %s (%s-%s, %s members)' % (model,years[0],years[1],members))
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getModel(model):
+    """
+    Function returns the entry of a model
+
+    Parameters
+    ----------
+    model : string
+        name of the model (see MODELS)
+
+    Returns
+    -------
+    entry : dictionary
+        directory, filename, years, members, latname, lonname, missing and
+        units
+
+    Usage
+    -----
+    entry = getModel(model)
+    """
+
+    ### Import modules
+    import sys
+
+    if model not in MODELS:
+        print(ValueError('WRONG MODEL SELECTED (see addModel)!'))
+        sys.exit()
+    return MODELS[model]
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getOverlap(models,monthlychoice,years=None):
+    """
+    Function returns the years that every model covers. DJF years are the
+    year of January/February, so they need December of the year before
+
+    Parameters
+    ----------
+    models : list of strings
+        names of the models
+    monthlychoice : string
+        time period of analysis
+    years : 2 integers or None
+        (first,last) target period and None for the whole overlap
+
+    Returns
+    -------
+    years : 1d numpy array
+        common years
+
+    Usage
+    -----
+    years = getOverlap(models,monthlychoice,years)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+
+    yearmin = max([getModel(model)['years'][0] for model in models])
+    yearmax = min([getModel(model)['years'][1] for model in models])
+    if monthlychoice == 'DJF':
+        yearmin = yearmin + 1
+    if years is not None:
+        if years[0] < yearmin or years[1] > yearmax:
+            print(ValueError('%s-%s IS NOT IN EVERY MODEL (%s-%s)!!!' % (years[0],years[1],
+                                                                        yearmin,yearmax)))
+            sys.exit()
+        yearmin,yearmax = years
+    years = np.arange(yearmin,yearmax+1,1)
+    return years
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getTimeIndex(model,years,monthlychoice):
+    """
+    Function returns the monthly time steps of the files for a period
+
+    Parameters
+    ----------
+    model : string
+        name of the model
+    years : 1d numpy array
+        years to read
+    monthlychoice : string
+        time period of analysis
+
+    Returns
+    -------
+    timeindex : slice
+        time steps of whole years (from the year before for DJF)
+
+    Usage
+    -----
+    timeindex = getTimeIndex(model,years,monthlychoice)
+    """
+
+    yearstart = getModel(model)['years'][0]
+    yearfirst = years.min() - (1 if monthlychoice == 'DJF' else 0)
+    timeindex = slice((yearfirst - yearstart)*12,(years.max() - yearstart + 1)*12)
+    return timeindex
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readModel(variq,model,monthlychoice,years,lat_bounds=None,lon_bounds=None,
+              workers=None):
+    """
+    Function reads the members of one model for only the selected years
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    model : string
+        name of the model
+    monthlychoice : string
+        time period of analysis (not none)
+    years : 1d numpy array
+        years to return (see getOverlap)
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+    workers : integer or None
+        number of member files read at once and None for READWORKERS
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    data : 4d numpy array
+        [ens,year,lat,lon] with the missing values and units of the reader
+        of the model (see MODELS)
+
+    Usage
+    -----
+    lat1,lon1,data = readModel(variq,model,monthlychoice,years,lat_bounds,
+                               lon_bounds,workers)
+    """
+
+    ### Import modules
+    import numpy as np
+    import calc_ReadUtilities as RU
+
+    entry = getModel(model)
+    yearsfile = '%s-%s' % entry['years']
+    filenames = [entry['directory'] + entry['filename'].format(model=model,vari=variq,
+                                                               member=member,years=yearsfile)
+                 for member in range(1,entry['members']+1)]
+    months = RU.getMonthIndices(monthlychoice)
+    timeindex = getTimeIndex(model,years,monthlychoice)
+
+    lat1,lon1,membersvar = RU.readMembers(filenames,variq,timeindex,lat_bounds,lon_bounds,
+                                          latname=entry['latname'],lonname=entry['lonname'],
+                                          months=months,workers=workers)
+    ensvalue = np.reshape(membersvar,(membersvar.shape[0],-1,len(months),
+                                      lat1.shape[0],lon1.shape[0]))
+    del membersvar
+    data = RU.ingestMembers(ensvalue,monthlychoice,4,'nan',missing=entry['missing'],
+                            units=entry['units'].get(variq))
+    print('Completed: read %s members of %s for %s-%s' % (data.shape[0],model,
+                                                          years.min(),years.max()))
+    return np.ma.getdata(lat1),np.ma.getdata(lon1),data
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readModels(variq,models,monthlychoice,years=None,grid=None,lat_bounds=None,
+               lon_bounds=None,workers=None):
+    """
+    Function reads several models for their common years into one
+    [model,ens,year,lat,lon] masked array. Each model is read straight into
+    its slot, and the member slots of models with fewer members are never
+    written, only masked
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    models : list of strings
+        names of the models (see MODELS)
+    monthlychoice : string
+        time period of analysis (not none)
+    years : 2 integers or None
+        (first,last) target period and None for the whole overlap
+    grid : string or None
+        LOWS or MEDS or HIGHS to regrid the models (see calc_Regrid) and None
+        if they are on the same grid
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+    workers : integer or None
+        number of member files read at once and None for READWORKERS
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    years : 1d numpy array
+        years
+    data : 5d numpy masked array
+        [model,ens,year,lat,lon] with the missing members masked
+
+    Usage
+    -----
+    lat1,lon1,years,data = readModels(variq,models,monthlychoice,years,grid,
+                                      lat_bounds,lon_bounds,workers)
+    """
+    print('\n>>>>>>>>>> STARTING readModels function!')
+
+    ### Import modules
+    import numpy as np
+    import sys
+    import calc_ReadUtilities as RU
+    import calc_Regrid as RG
+    import calc_dataFunctions as df
+
+    if monthlychoice == 'none':
+        print(ValueError('READ SEASONS OR MONTHS, NOT ALL MONTHS!!!'))
+        sys.exit()
+    models = list(models)
+    years = getOverlap(models,monthlychoice,years)
+    members = np.array([getModel(model)['members'] for model in models])
+    if grid is not None:
+        lat2,lon2 = RG.getTargetGrid(grid)
+
+    for i,model in enumerate(models):
+        ### Regrid the whole map and cut out the region on the target grid
+        if grid is not None:
+            lat1,lon1,data = readModel(variq,model,monthlychoice,years,workers=workers)
+            data = RG.regridArray(data,lat1,lon1,lat2,lon2,RG.REGRIDMETHOD)
+            lat1,lon1 = lat2,lon2
+            if any([lat_bounds is not None,lon_bounds is not None]):
+                data,lat1,lon1 = df.getRegion(data,lat2,lon2,
+                                              lat_bounds if lat_bounds is not None else (-90.,90.),
+                                              lon_bounds if lon_bounds is not None else (0.,360.))
+        else:
+            lat1,lon1,data = readModel(variq,model,monthlychoice,years,
+                                       lat_bounds,lon_bounds,workers)
+
+        ### Output sized by the first model (slots of extra members stay empty)
+        if i == 0:
+            latq,lonq = lat1,lon1
+            alldata = np.empty((len(models),members.max(),years.shape[0],
+                                lat1.shape[0],lon1.shape[0]),
+                               dtype=RU.getComputeDtype(data))
+        elif lat1.shape != latq.shape or lon1.shape != lonq.shape or \
+            not np.allclose(lat1,latq) or not np.allclose(lon1,lonq):
+            print(ValueError('%s IS ON A DIFFERENT GRID (SET grid)!!!' % model))
+            sys.exit()
+        alldata[i,:members[i]] = data
+        del data
+
+    padded = np.arange(members.max())[np.newaxis,:] >= members[:,np.newaxis]
+    mask = np.zeros(alldata.shape,dtype=bool)
+    mask[...] = padded[:,:,np.newaxis,np.newaxis,np.newaxis]
+    alldata = np.ma.MaskedArray(alldata,mask=mask)
+    print('Shape of output FINAL = ',alldata.shape,[[alldata.ndim]])
+    print('>>>>>>>>>> ENDING readModels function!')
+    return latq,lonq,years,alldata
+
+# ### Test functions - do not use!
+# import calc_MultiModel as MM
+# MM.addModel('ACCESS-CM2','/work/Zachary.Labe/Data/CMIP6/',
+#             '{model}/monthly/{vari}_{model}_{years}.nc',(1921,2100),1,
+#             latname='latitude',lonname='longitude')
+# lat1,lon1,years,data = MM.readModels('T2M',['CCCma_canesm2','CSIRO_MK3.6','GFDL_CM3',
+#                                             'KNMI_ecearth','MPI'],'annual',
+#                                      years=(1950,2099),grid='LOWS')
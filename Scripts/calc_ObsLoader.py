@@ -0,0 +1,383 @@
+"""
+Functions read a set of observational products at the same time (one
+process each), put them on a common time axis and grid as anomalies against
+the same 1981-2010 baseline, and keep the harmonized cube in the readFiles
+cache (see calc_ReadCache.setCacheDirectory)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getProduct(product)
+    [2] getProductFiles(variq,product)
+    [3] readProduct(variq,product,monthlychoice)
+    [4] getObsKey(variq,products,monthlychoice,years,grid)
+    [5] readObservations(variq,products,monthlychoice,years,grid,workers)
+"""
+
+###############################################################################
+###############################################################################
+###############################################################################
+### Observational products
+###     reader     : (module,function) of the reader
+###     call       : argument order of the reader
+###                  'temp' = (directory,monthlychoice,sliceyear,sliceshape,addclimo,slicenan,*extra)
+###                  'vari' = (variq,directory,monthlychoice,sliceyear,sliceshape,addclimo,slicenan,*extra)
+###     directory  : directory passed to the reader
+###     filename   : file (relative to directory) opened by the reader
+###     sliceyear  : years passed to the reader
+###     yearfirst  : first year returned by the reader (the next year for DJF)
+###     anomalies  : addclimo value that makes the reader return anomalies
+###     extra      : arguments after slicenan
+###     variables  : variables of the product and None for any
+###     store      : grid of the calc_ERA5Store that can replace the file and None for none
+DIRECTORYDATA = '/work/Zachary.Labe/Data/'
+
+def obsProduct(reader,call,directory,filename,sliceyear,yearfirst,anomalies,
+               extra=(),variables=('T2M',),store=None):
+    return {'reader' : reader,'call' : call,'directory' : directory,
+            'filename' : filename,'sliceyear' : sliceyear,'yearfirst' : yearfirst,
+            'anomalies' : anomalies,'extra' : extra,'variables' : variables,
+            'store' : store}
+
+OBSPRODUCTS = {
+    'BEST' : obsProduct(('read_BEST','read_BEST'),'temp',DIRECTORYDATA + 'BEST/',
+                        'T2M_BEST_1850-2022.nc',(1850,2022),1929,True),
+    'GISTEMP' : obsProduct(('read_GISTEMP','read_GISTEMP'),'temp',DIRECTORYDATA + 'GISTEMP/',
+                           'T2M_GISTEMP_1880-2022.nc',(1880,2022),1929,False,extra=(True,)),
+    'HadCRUT' : obsProduct(('read_HadCRUT','read_HadCRUT'),'temp',DIRECTORYDATA + 'HadCRUT/',
+                           'T2M_HadCRUT_1850-2020.nc',(1850,2020),1950,False),
+    'NOAAGlobalTemp' : obsProduct(('read_NOAAglobaltemp','read_NOAA'),'temp',
+                                  DIRECTORYDATA + 'NOAAGlobalTemp/',
+                                  'T2M_NOAAGlobalTemp_1880-2022.nc',(1880,2022),1979,False,
+                                  extra=(True,)),
+    'GPCP' : obsProduct(('read_GPCP_monthly','read_GPCP_monthly'),'vari',DIRECTORYDATA + 'GPCP/',
+                        '{vari}_GPCP_1979-2019.nc',(1979,2019),1979,False,variables=None),
+    'ERA5_1x1' : obsProduct(('read_ERA5_monthly1x1','read_ERA5_monthly1x1'),'vari',DIRECTORYDATA,
+                            'ERA5_1x1/{vari}_1979-2021.nc',(1979,2021),1979,False,
+                            extra=('surface',),variables=None),
+    'ERA5_MEDS' : obsProduct(('read_ERA5_monthlyMEDS','read_ERA5_monthlyMEDS'),'vari',DIRECTORYDATA,
+                             'ERA5_MEDS/{vari}_1940-2022.nc',(1940,2022),1940,False,
+                             extra=('surface',),variables=None,store='MEDS'),
+    }
+
+### Baseline of the harmonized anomalies
+YEARBASEMIN = 1981
+YEARBASEMAX = 2010
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getProduct(product):
+    """
+    Function returns the entry of an observational product
+
+    Parameters
+    ----------
+    product : string
+        name of the observational product (see OBSPRODUCTS)
+
+    Returns
+    -------
+    entry : dictionary
+        reader, call, directory, filename, sliceyear, yearfirst, anomalies,
+        extra, variables and store of the product
+
+    Usage
+    -----
+    entry = getProduct(product)
+    """
+
+    ### Import modules
+    import sys
+
+    if product not in OBSPRODUCTS:
+        print(ValueError('WRONG OBSERVATIONAL PRODUCT SELECTED!'))
+        sys.exit()
+    return OBSPRODUCTS[product]
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getProductFiles(variq,product):
+    """
+    Function returns the files read for an observational product
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    product : string
+        name of the observational product
+
+    Returns
+    -------
+    filenames : list of strings
+        netCDF files read by the reader
+
+    Usage
+    -----
+    filenames = getProductFiles(variq,product)
+    """
+
+    ### Import modules
+    import calc_ERA5Store as ES
+
+    entry = getProduct(product)
+    filenames = [entry['directory'] + entry['filename'].format(vari=variq)]
+    if entry['store'] is not None and ES.getStoreFile(variq,entry['store']) is not None:
+        filenames = [ES.getStoreFile(variq,entry['store'])]
+    return filenames
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readProduct(variq,product,monthlychoice):
+    """
+    Function reads the anomalies of one observational product (run in a
+    worker process by readObservations)
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    product : string
+        name of the observational product
+    monthlychoice : string
+        time period of analysis (not none)
+
+    Returns
+    -------
+    data : 3d numpy array
+        [years,lat,lon] anomalies
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    years : 1d numpy array
+        years of the data
+
+    Usage
+    -----
+    data,lat1,lon1,years = readProduct(variq,product,monthlychoice)
+    """
+
+    ### Import modules
+    import numpy as np
+    import importlib
+    import sys
+    import calc_ERA5Store as ES
+
+    entry = getProduct(product)
+    if entry['variables'] is not None and variq not in entry['variables']:
+        print(ValueError('%s IS NOT IN %s!!!' % (variq,product)))
+        sys.exit()
+    if monthlychoice == 'none':
+        print(ValueError('READ SEASONS OR MONTHS, NOT ALL MONTHS!!!'))
+        sys.exit()
+
+    module,function = entry['reader']
+    reader = getattr(importlib.import_module(module),function)
+    sliceyear = np.arange(entry['sliceyear'][0],entry['sliceyear'][1]+1,1)
+    arguments = (entry['directory'],monthlychoice,sliceyear,3,entry['anomalies'],'nan')
+    if entry['call'] == 'vari':
+        arguments = (variq,) + arguments
+    output = reader(*(arguments + tuple(entry['extra'])))
+    lat1,lon1,data = output[0],output[1],output[-1]
+
+    ### A store starts in the first year given to appendMonths (see getProductFiles)
+    yearfirst = entry['yearfirst']
+    if entry['store'] is not None:
+        storefile = ES.getStoreFile(variq,entry['store'])
+        if storefile is not None:
+            yearfirst = int(ES.getStoreYears(storefile)[0])
+    yearfirst = yearfirst + (1 if monthlychoice == 'DJF' else 0)
+    years = np.arange(yearfirst,yearfirst + data.shape[0],1)
+    data = np.ma.filled(np.asarray(data,dtype=np.float32),np.nan)
+    return data,np.ma.getdata(lat1),np.ma.getdata(lon1),years
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getObsKey(variq,products,monthlychoice,years,grid):
+    """
+    Function makes the name of a harmonized cube
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    products : list of strings
+        observational products (in order)
+    monthlychoice : string
+        time period of analysis
+    years : 1d numpy array or None
+        common years and None for the overlap of the products
+    grid : string or None
+        LOWS or MEDS or HIGHS and None for the grid of the first product
+
+    Returns
+    -------
+    key : string
+        sha1 of the request
+
+    Usage
+    -----
+    key = getObsKey(variq,products,monthlychoice,years,grid)
+    """
+
+    ### Import modules
+    import hashlib
+    import calc_ReadCache as RC
+    import calc_Regrid as RG
+
+    request = repr((variq,list(products),monthlychoice,
+                    None if years is None else [int(year) for year in years],
+                    grid,RG.REGRIDMETHOD,YEARBASEMIN,YEARBASEMAX,RC.READERVERSION))
+    key = hashlib.sha1(request.encode('utf-8')).hexdigest()
+    return key
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readObservations(variq,products,monthlychoice,years=None,grid=None,workers=None):
+    """
+    Function reads observational products concurrently and returns them as
+    one cube of 1981-2010 anomalies on a common time axis and grid. Years a
+    product does not cover are nan
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    products : list of strings
+        observational products (see OBSPRODUCTS)
+    monthlychoice : string
+        time period of analysis (not none)
+    years : 1d numpy array or None
+        common years and None for the overlap of the products
+    grid : string or None
+        LOWS or MEDS or HIGHS (see calc_Regrid) and None for the grid of the
+        first product
+    workers : integer or None
+        number of processes and None for one for each product
+
+    Returns
+    -------
+    cube : 4d numpy array
+        [product,years,lat,lon] anomalies
+    years : 1d numpy array
+        years
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+
+    Usage
+    -----
+    cube,years,lat1,lon1 = readObservations(variq,products,monthlychoice,
+                                            years,grid,workers)
+    """
+    print('\n>>>>>>>>>> STARTING readObservations function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import shutil
+    import tempfile
+    from concurrent.futures import ProcessPoolExecutor
+    import calc_ReadCache as RC
+    import calc_Regrid as RG
+
+    products = list(products)
+    filenames = [filename for product in products
+                 for filename in getProductFiles(variq,product)]
+    key = getObsKey(variq,products,monthlychoice,years,grid)
+
+    ### Harmonized cube saved by any process with the readFiles cache on
+    if RC.CACHEDIRECTORY is not None:
+        directorykey = os.path.join(RC.CACHEDIRECTORY,'obs',key)
+        try:
+            with open(os.path.join(directorykey,'sources.json'),'r') as fileq:
+                sources = json.load(fileq)
+            if RC.getFileStats(filenames) == sources:
+                cube = np.load(os.path.join(directorykey,'cube.npy'))
+                coords = np.load(os.path.join(directorykey,'coords.npz'))
+                print('Completed: harmonized observations from the cache (%s)' % key)
+                print('>>>>>>>>>> ENDING readObservations function!')
+                return cube,coords['years'],coords['lat'],coords['lon']
+        except (OSError,ValueError):
+            pass
+
+    ### Read every product at the same time
+    numOfWorkers = workers or len(products)
+    with ProcessPoolExecutor(max_workers=numOfWorkers) as executor:
+        futures = [executor.submit(readProduct,variq,product,monthlychoice)
+                   for product in products]
+        outputs = [future.result() for future in futures]
+    print('Completed: read %s observational products' % len(products))
+
+    ### Common time axis
+    if years is None:
+        yearmin = max([output[3].min() for output in outputs])
+        yearmax = min([output[3].max() for output in outputs])
+        years = np.arange(yearmin,yearmax+1,1)
+    years = np.asarray(years)
+
+    ### Common grid
+    if grid is not None:
+        lat1,lon1 = RG.getTargetGrid(grid)
+    else:
+        lat1,lon1 = outputs[0][1],outputs[0][2]
+
+    cube = np.full((len(products),years.shape[0],lat1.shape[0],lon1.shape[0]),
+                   np.nan,dtype=np.float32)
+    for i,(data,latq,lonq,yearsq) in enumerate(outputs):
+        ### Anomalies against the same baseline for every product
+        yearbase = np.where((yearsq >= YEARBASEMIN) & (yearsq <= YEARBASEMAX))[0]
+        data = data - np.nanmean(data[yearbase],axis=0)
+
+        if latq.shape != lat1.shape or lonq.shape != lon1.shape or \
+            not np.allclose(latq,lat1) or not np.allclose(lonq,lon1):
+            data = RG.regridArray(data,latq,lonq,lat1,lon1,RG.REGRIDMETHOD)
+        yearboth,yearcube,yeardata = np.intersect1d(years,yearsq,return_indices=True)
+        cube[i,yearcube] = data[yeardata]
+        print('Completed: harmonized %s (%s of %s years)' % (products[i],
+                                                              yearboth.shape[0],
+                                                              years.shape[0]))
+
+    ### Write into a temporary directory and rename it so readers never see
+    ### a half-written cube
+    sources = RC.getFileStats(filenames)
+    if RC.CACHEDIRECTORY is not None and sources:
+        directoryobs = os.path.join(RC.CACHEDIRECTORY,'obs')
+        os.makedirs(directoryobs,exist_ok=True)
+        directorykey = os.path.join(directoryobs,key)
+        shutil.rmtree(directorykey,ignore_errors=True)
+        directorytemp = tempfile.mkdtemp(prefix=key + '.',dir=directoryobs)
+        np.save(os.path.join(directorytemp,'cube.npy'),cube)
+        np.savez(os.path.join(directorytemp,'coords.npz'),years=years,lat=lat1,lon=lon1)
+        with open(os.path.join(directorytemp,'sources.json'),'w') as fileq:
+            json.dump(sources,fileq)
+        try:
+            os.rename(directorytemp,directorykey)
+            print('Completed: saved harmonized observations in the cache (%s)' % key)
+        except OSError:
+            shutil.rmtree(directorytemp,ignore_errors=True)
+
+    print('>>>>>>>>>> ENDING readObservations function!')
+    return cube,years,lat1,lon1
+
+# ### Test functions - do not use!
+# import calc_ObsLoader as OB
+# cube,years,lat1,lon1 = OB.readObservations('T2M',['BEST','GISTEMP','NOAAGlobalTemp','ERA5_MEDS'],
+#                                            'annual',grid='MEDS')
@@ -0,0 +1,161 @@
+"""
+Functions read a list of data sets in a background thread while the caller
+works on the previous one, so reading and processing overlap. The number of
+bytes held by the prefetcher is capped (see setPrefetchBytes)
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setPrefetchBytes(maxbytes)
+    [2] getRequestBytes(request)
+    [3] prefetchFiles(requests,reader,depth)
+"""
+
+### Largest number of bytes of the data set being used plus the data sets
+### read ahead and None for no cap (see setPrefetchBytes)
+PREFETCHBYTES = None
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setPrefetchBytes(maxbytes):
+    """
+    Function sets the memory cap of prefetchFiles
+
+    Parameters
+    ----------
+    maxbytes : integer or None
+        largest number of bytes held at once and None for no cap
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setPrefetchBytes(maxbytes)
+    """
+    global PREFETCHBYTES
+
+    PREFETCHBYTES = maxbytes
+    print('Prefetching data sets with a cap of %s bytes!' % PREFETCHBYTES)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getRequestBytes(request):
+    """
+    Function estimates the size of a request from the data set registry
+
+    Parameters
+    ----------
+    request : tuple
+        (variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds) as
+        passed to readFiles
+
+    Returns
+    -------
+    sizebytes : integer or None
+        size of the returned array and None if it cannot be estimated
+
+    Usage
+    -----
+    sizebytes = getRequestBytes(request)
+    """
+
+    ### Import modules
+    import calc_DatasetRegistry as DR
+
+    variq,dataset,monthlychoice = request[:3]
+    lat_bounds = request[4] if len(request) > 4 else None
+    lon_bounds = request[5] if len(request) > 5 else None
+    if dataset not in DR.DATASETS or DR.DATASETS[dataset]['grid'] is None:
+        return None
+    try:
+        sizebytes = DR.getSizeBytes(dataset,variq,monthlychoice,lat_bounds,lon_bounds)
+    except OSError:
+        return None
+    return sizebytes
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def prefetchFiles(requests,reader=None,depth=1):
+    """
+    Function yields the data of each request in order while the next
+    requests are read in a background thread. A request is only read ahead
+    if it fits under PREFETCHBYTES together with the data set the caller is
+    using and the ones already read ahead (requests of unknown size are
+    never read ahead)
+
+    Parameters
+    ----------
+    requests : list of tuples
+        (variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds) for
+        each data set
+    reader : function or None
+        called as reader(*request) and None for readFiles
+    depth : integer
+        largest number of requests read ahead
+
+    Returns
+    -------
+    prefetched : generator
+        (request,output of the reader) for each request in order
+
+    Usage
+    -----
+    for request,(data,lat1,lon1) in prefetchFiles(requests): ...
+    """
+
+    ### Import modules
+    from concurrent.futures import ThreadPoolExecutor
+
+    if reader is None:
+        import calc_dataFunctions as df
+        reader = df.readFiles
+    requests = [tuple(request) for request in requests]
+    sizes = [getRequestBytes(request) for request in requests]
+
+    def fitsCap(k,heldbytes):
+        if PREFETCHBYTES is None:
+            return True
+        if sizes[k] is None:
+            return False
+        return heldbytes + sizes[k] <= PREFETCHBYTES
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = {}
+        nextrequest = 0
+        for k in range(len(requests)):
+            ### The current request is always read (after the ones before it)
+            if k not in pending:
+                pending[k] = executor.submit(reader,*requests[k])
+                nextrequest = k + 1
+            output = pending.pop(k).result()
+
+            ### Read ahead while the caller works on request k
+            heldbytes = (sizes[k] or 0) + sum([sizes[i] or 0 for i in pending])
+            while nextrequest < len(requests) and len(pending) < depth and \
+                fitsCap(nextrequest,heldbytes):
+                pending[nextrequest] = executor.submit(reader,*requests[nextrequest])
+                heldbytes += sizes[nextrequest] or 0
+                nextrequest += 1
+
+            yield requests[k],output
+            del output
+
+# ### Test functions - do not use!
+# import calc_Prefetch as PF
+# PF.setPrefetchBytes(8*1024**3)
+# requests = [('T2M',dataset,'annual',scenario,None,None) for dataset,scenario in
+#             [('SPEAR_MED','SSP585'),('SPEAR_MED_Scenario','SSP245')]]
+# for request,(data,lat1,lon1) in PF.prefetchFiles(requests):
+#     print(request,data.shape)
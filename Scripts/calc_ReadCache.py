@@ -0,0 +1,288 @@
+"""
+Functions keep an on-disk cache of the arrays returned by readFiles, so the
+same dataset/variable/season is only read from the netCDF archive once
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setCacheDirectory(directory)
+    [2] getCacheKey(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    [3] getFileStats(filenames)
+    [4] loadCache(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    [5] saveCache(data,lat1,lon1,filenames,variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+"""
+
+### Directory of the cache and None to switch it off (see setCacheDirectory)
+CACHEDIRECTORY = None
+
+### Change this whenever a reader starts returning different values
+READERVERSION = 1
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setCacheDirectory(directory):
+    """
+    Function switches the readFiles cache on (or off with None)
+
+    Parameters
+    ----------
+    directory : string or None
+        directory for the cached arrays and None for no cache
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setCacheDirectory(directory)
+    """
+    global CACHEDIRECTORY
+
+    ### Import modules
+    import os
+
+    if directory is None:
+        CACHEDIRECTORY = None
+        print('Cache for readFiles is OFF!')
+    else:
+        os.makedirs(directory,exist_ok=True)
+        CACHEDIRECTORY = directory
+        print('Cache for readFiles is ON ---> %s' % CACHEDIRECTORY)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getCacheKey(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds):
+    """
+    Function makes the name of the cache entry for one readFiles request
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    key : string
+        sha1 of the request, the reader version and the data type
+
+    Usage
+    -----
+    key = getCacheKey(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import hashlib
+    import calc_ReadUtilities as RU
+
+    request = repr((dataset,variq,monthlychoice,scenario,
+                    None if lat_bounds is None else tuple(lat_bounds),
+                    None if lon_bounds is None else tuple(lon_bounds),
+                    READERVERSION,str(RU.READDTYPE)))
+    key = hashlib.sha1(request.encode('utf-8')).hexdigest()
+    return key
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getFileStats(filenames):
+    """
+    Function returns the modification time and size of the source files
+
+    Parameters
+    ----------
+    filenames : list of strings
+        netCDF files that were read
+
+    Returns
+    -------
+    stats : list
+        [filename,mtime,size] for each file and None if a file is missing
+
+    Usage
+    -----
+    stats = getFileStats(filenames)
+    """
+
+    ### Import modules
+    import os
+
+    stats = []
+    for filename in sorted(set(filenames)):
+        try:
+            info = os.stat(filename)
+        except OSError:
+            return None
+        stats.append([filename,info.st_mtime_ns,info.st_size])
+    return stats
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def loadCache(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds):
+    """
+    Function loads a cached readFiles result if its source files are unchanged
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    cached : tuple or None
+        (data,lat1,lon1) with data memory-mapped (copy-on-write) and None
+        when there is no valid cache entry
+
+    Usage
+    -----
+    cached = loadCache(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import calc_ReadUtilities as RU
+
+    if CACHEDIRECTORY is None:
+        return None
+
+    key = getCacheKey(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    directorykey = os.path.join(CACHEDIRECTORY,key)
+    try:
+        with open(os.path.join(directorykey,'sources.json'),'r') as fileq:
+            sources = json.load(fileq)
+    except (OSError,ValueError):
+        return None
+
+    ### Any change to the source files makes the entry stale
+    filenames = [filestat[0] for filestat in sources]
+    if getFileStats(filenames) != sources:
+        print('Cache for %s-%s-%s is out of date!' % (dataset,variq,monthlychoice))
+        return None
+
+    data = np.load(os.path.join(directorykey,'data.npy'),mmap_mode='c')
+    lat1 = np.load(os.path.join(directorykey,'lat.npy'))
+    lon1 = np.load(os.path.join(directorykey,'lon.npy'))
+    
+    ### The source files still count as read (see calc_ArrayExport)
+    RU.READFILES.extend(filenames)
+    print('Completed: loaded %s-%s-%s from the cache (%s)' % (dataset,variq,
+                                                              monthlychoice,key))
+    return data,lat1,lon1
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def saveCache(data,lat1,lon1,filenames,variq,dataset,monthlychoice,scenario,
+              lat_bounds,lon_bounds):
+    """
+    Function saves a readFiles result and the state of its source files
+
+    Parameters
+    ----------
+    data : numpy array
+        data from selected data set
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    filenames : list of strings
+        netCDF files that were read (nothing is saved if this is empty)
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    saveCache(data,lat1,lon1,filenames,variq,dataset,monthlychoice,scenario,
+              lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import json
+    import shutil
+    import tempfile
+
+    if CACHEDIRECTORY is None:
+        return
+
+    ### Without the list of source files the entry could never go stale
+    sources = getFileStats(filenames)
+    if not sources:
+        print('No cache for %s-%s-%s (source files are unknown)' % (dataset,variq,
+                                                                    monthlychoice))
+        return
+
+    key = getCacheKey(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+    directorykey = os.path.join(CACHEDIRECTORY,key)
+
+    ### Write into a temporary directory and rename it so readers never see
+    ### a half-written entry
+    directorytemp = tempfile.mkdtemp(prefix=key + '.',dir=CACHEDIRECTORY)
+    np.save(os.path.join(directorytemp,'data.npy'),np.asarray(data))
+    np.save(os.path.join(directorytemp,'lat.npy'),np.asarray(lat1))
+    np.save(os.path.join(directorytemp,'lon.npy'),np.asarray(lon1))
+    with open(os.path.join(directorytemp,'request.json'),'w') as fileq:
+        json.dump({'dataset' : dataset,'variq' : variq,
+                   'monthlychoice' : monthlychoice,'scenario' : scenario,
+                   'lat_bounds' : lat_bounds,'lon_bounds' : lon_bounds,
+                   'readerversion' : READERVERSION},fileq)
+    with open(os.path.join(directorytemp,'sources.json'),'w') as fileq:
+        json.dump(sources,fileq)
+
+    shutil.rmtree(directorykey,ignore_errors=True)
+    try:
+        os.rename(directorytemp,directorykey)
+    except OSError:
+        shutil.rmtree(directorytemp,ignore_errors=True)
+        return
+    print('Completed: saved %s-%s-%s in the cache (%s)' % (dataset,variq,
+                                                           monthlychoice,key))
@@ -0,0 +1,827 @@
+"""
+Functions are useful utilities for reading the netCDF archive in the read_*
+functions
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    [2] readRegion(ncvar,timeindex,latslice,lonslices)
+    [3] readMember(filename,vari,timeindex,lat_bounds,lon_bounds,latname,lonname,months)
+    [4] getMonthIndices(sliceperiod)
+    [5] readMonths(ncvar,timeindex,months,latslice,lonslices)
+    [6] calcMonthMean(ensvalue,sliceperiod,sliceshape)
+    [7] ingestMembers(ensvalue,sliceperiod,sliceshape,slicenan,missing,units)
+    [8] setReadWorkers(workers,pool)
+    [9] readMembers(filenames,vari,timeindex,lat_bounds,lon_bounds,latname,lonname,months,workers,pool,out,dtype)
+    [10] setReadDtype(dtype)
+    [11] emptyMembers(filename,vari,lat_bounds,lon_bounds,leadshape,latname,lonname,dtype)
+    [12] getComputeDtype(var)
+    [13] getTimeLength(timeindex)
+    [14] iterMembers(reader,numOfEns,**arguments)
+"""
+
+### Number of member files read at the same time (see setReadWorkers)
+READWORKERS = 1
+READPOOL = 'process'
+
+### Data type of the arrays built by the readers and the calc_ functions
+### (see setReadDtype)
+READDTYPE = None
+
+### Member files read through readMembers since the start of the last
+### readFiles call, which empties it (used by calc_ReadCache)
+READFILES = []
+
+### Size of the blocks of each member processed at once by ingestMembers
+INGESTBYTES = 2**26
+
+def getRegionSlices(lat1,lon1,lat_bounds,lon_bounds):
+    """
+    Function converts region bounds into index slices for reading only the
+    region from a netCDF file (same inclusive bounds as getRegion)
+
+    Parameters
+    ----------
+    lat1 : 1d array
+        latitudes
+    lon1 : 1d array
+        longitudes (0 to 360!!!)
+    lat_bounds : 2 floats or None
+        (latmin,latmax)
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) where lonmin > lonmax wraps around 0E
+
+    Returns
+    -------
+    latslice : slice
+        contiguous slice of latitudes
+    lonslices : list of slices
+        one slice or two slices for boxes wrapping around 0E
+
+    Usage
+    -----
+    latslice,lonslices = getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+
+    ### Note there is an issue with 90N latitude (same as getRegion)
+    lat1 = np.round(np.asarray(lat1),3)
+    lon1 = np.asarray(lon1)
+
+    ### Slice latitudes
+    if lat_bounds is None:
+        latslice = slice(None)
+    else:
+        latq = np.where((lat1 >= lat_bounds[0]) & (lat1 <= lat_bounds[1]))[0]
+        if latq.size == 0:
+            print(ValueError('NO LATITUDES IN THE SELECTED REGION!!!'))
+            sys.exit()
+        latslice = slice(latq.min(),latq.max()+1)
+
+    ### Slice longitudes
+    if lon_bounds is None:
+        lonslices = [slice(None)]
+    else:
+        lonmin,lonmax = lon_bounds
+        if lonmin <= lonmax:
+            lonq = np.where((lon1 >= lonmin) & (lon1 <= lonmax))[0]
+            lonqs = [lonq]
+        else:
+            lonqs = [np.where(lon1 >= lonmin)[0],np.where(lon1 <= lonmax)[0]]
+        lonqs = [q for q in lonqs if q.size > 0]
+        if len(lonqs) == 0:
+            print(ValueError('NO LONGITUDES IN THE SELECTED REGION!!!'))
+            sys.exit()
+        lonslices = [slice(q.min(),q.max()+1) for q in lonqs]
+
+    return latslice,lonslices
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readRegion(ncvar,timeindex,latslice,lonslices):
+    """
+    Function reads a [time,lat,lon] hyperslab for a region from a netCDF
+    variable without reading the rest of the grid
+
+    Parameters
+    ----------
+    ncvar : netCDF4 variable
+        [time,lat,lon] variable in an open file
+    timeindex : slice or 1d array
+        time steps to read
+    latslice : slice
+        latitudes to read
+    lonslices : list of slices
+        longitudes to read (two slices for boxes wrapping around 0E)
+
+    Returns
+    -------
+    var : 3d numpy array
+        [time,lat,lon] for the region
+
+    Usage
+    -----
+    var = readRegion(ncvar,timeindex,latslice,lonslices)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if len(lonslices) == 1:
+        var = ncvar[timeindex,latslice,lonslices[0]]
+    else:
+        var = np.ma.concatenate([ncvar[timeindex,latslice,lonq]
+                                 for lonq in lonslices],axis=-1)
+    return var
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readMember(filename,vari,timeindex,lat_bounds,lon_bounds,
+               latname='lat',lonname='lon',months=None):
+    """
+    Function reads one ensemble member file for the selected region
+
+    Parameters
+    ----------
+    filename : string
+        path of the netCDF file
+    vari : string
+        variable for analysis
+    timeindex : slice or 1d array
+        time steps to read
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    latname : string
+        name of the latitude variable
+    lonname : string
+        name of the longitude variable
+    months : list of integers or None
+        months of each year to read (see getMonthIndices) and None for all
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    var : 3d numpy array
+        [time,lat,lon] with only the selected months of each year
+
+    Usage
+    -----
+    lat1,lon1,var = readMember(filename,vari,timeindex,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+
+    data = Dataset(filename,'r')
+    lat1 = data.variables[latname][:]
+    lon1 = data.variables[lonname][:]
+    latslice,lonslices = getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    ncvar = data.variables['%s' % vari]
+    if months is None or list(months) == list(range(12)):
+        var = readRegion(ncvar,timeindex,latslice,lonslices)
+    else:
+        var = readMonths(ncvar,timeindex,months,latslice,lonslices)
+    data.close()
+
+    lat1 = lat1[latslice]
+    if len(lonslices) == 1:
+        lon1 = lon1[lonslices[0]]
+    else:
+        lon1 = np.ma.concatenate([lon1[lonq] for lonq in lonslices])
+    return lat1,lon1,var
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getMonthIndices(sliceperiod):
+    """
+    Function returns the months of each year needed for a time period
+
+    Parameters
+    ----------
+    sliceperiod : string
+        how to average time component of data
+
+    Returns
+    -------
+    months : list of integers
+        month indices (0 = January) in the order they are read
+
+    Usage
+    -----
+    months = getMonthIndices(sliceperiod)
+    """
+
+    ### Import modules
+    import sys
+
+    monthnames = ['January','February','March','April','May','June','July',
+                  'August','September','October','November','December']
+    seasons = {'annual' : list(range(12)),
+               'none' : list(range(12)),
+               'DJF' : [0,1,11],
+               'MAM' : [2,3,4],
+               'JJA' : [5,6,7],
+               'SON' : [8,9,10],
+               'JFM' : [0,1,2],
+               'FMA' : [1,2,3],
+               'FM' : [1,2],
+               'AMJ' : [3,4,5],
+               'JAS' : [6,7,8],
+               'OND' : [9,10,11]}
+
+    if sliceperiod in seasons:
+        months = seasons[sliceperiod]
+    elif sliceperiod in monthnames:
+        months = [monthnames.index(sliceperiod)]
+    else:
+        print(ValueError('WRONG MONTHS SELECTED FOR WHAT IS AVAILABLE!!!'))
+        sys.exit()
+    return months
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readMonths(ncvar,timeindex,months,latslice,lonslices):
+    """
+    Function reads only the selected months of each year as one strided
+    hyperslab per month
+
+    Parameters
+    ----------
+    ncvar : netCDF4 variable
+        [time,lat,lon] variable in an open file
+    timeindex : slice
+        time steps to read (must start in January and cover whole years)
+    months : list of integers
+        months of each year to read
+    latslice : slice
+        latitudes to read
+    lonslices : list of slices
+        longitudes to read
+
+    Returns
+    -------
+    var : 3d numpy array
+        [year*month,lat,lon] in the same order as months
+
+    Usage
+    -----
+    var = readMonths(ncvar,timeindex,months,latslice,lonslices)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    start,stop,step = timeindex.indices(ncvar.shape[0])
+    years = (stop - start)//12
+
+    for i,mo in enumerate(months):
+        varmo = readRegion(ncvar,slice(start+mo,start+years*12,12),
+                           latslice,lonslices)
+        if i == 0:
+            var = np.empty((years,len(months)) + varmo.shape[1:],
+                           dtype=varmo.dtype)
+        var[:,i,:,:] = np.ma.getdata(varmo)
+    return np.reshape(var,(years*len(months),) + var.shape[2:])
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def calcMonthMean(ensvalue,sliceperiod,sliceshape):
+    """
+    Function averages the months that were read for a time period
+
+    Parameters
+    ----------
+    ensvalue : 5d numpy array
+        [ens,year,month,lat,lon] with the months from getMonthIndices
+    sliceperiod : string
+        how to average time component of data
+    sliceshape : string
+        shape of output array
+
+    Returns
+    -------
+    ensshape : numpy array
+        averaged variable
+
+    Usage
+    -----
+    ensshape = calcMonthMean(ensvalue,sliceperiod,sliceshape)
+    """
+
+    ensshape = ingestMembers(ensvalue,sliceperiod,sliceshape,None)
+    return ensshape
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def ingestMembers(ensvalue,sliceperiod,sliceshape,slicenan,missing=(),units=None):
+    """
+    Function averages the months that were read for a time period, changes
+    missing values and changes units in one pass over blocks of each member,
+    so the (large) reader output is only traversed once
+
+    Parameters
+    ----------
+    ensvalue : 5d numpy array
+        [ens,year,month,lat,lon] with the months from getMonthIndices (it is
+        changed in place for sliceperiod 'none')
+    sliceperiod : string
+        how to average time component of data
+    sliceshape : string
+        shape of output array
+    slicenan : string or float or None
+        Set missing values ('nan' or a value) and None to leave them
+    missing : list of tuples
+        (operator,value) of the missing values, e.g. [('<=',-999),('>=',1e20)]
+    units : tuple or None
+        (operator,value) of the unit conversion, e.g. ('-',273.15)
+
+    Returns
+    -------
+    ensshape : numpy array
+        averaged variable
+
+    Usage
+    -----
+    ensshape = ingestMembers(ensvalue,sliceperiod,sliceshape,slicenan,missing,units)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    compare = {'<' : np.less,'<=' : np.less_equal,
+               '>' : np.greater,'>=' : np.greater_equal}
+    convert = {'+' : np.add,'-' : np.subtract,
+               '*' : np.multiply,'/' : np.true_divide}
+    if slicenan == 'nan':
+        fillvalue = np.nan
+    else:
+        fillvalue = slicenan
+
+    ### Output of the month step
+    numOfEns,numOfYears = ensvalue.shape[:2]
+    if sliceperiod == 'none':
+        enstime = ensvalue
+    elif sliceperiod == 'DJF':
+        ### December of one year with January/February of the next year
+        numOfYears = numOfYears - 1
+        enstime = np.empty((numOfEns,numOfYears,ensvalue.shape[3],ensvalue.shape[4]),
+                           dtype=getComputeDtype())
+    else:
+        enstime = np.empty((numOfEns,numOfYears,ensvalue.shape[3],ensvalue.shape[4]),
+                           dtype=ensvalue.dtype)
+
+    ### Blocks of years of one member that fit in INGESTBYTES
+    yearbytes = max(ensvalue[0,0].nbytes,1)
+    numOfBlock = int(min(max(INGESTBYTES//yearbytes,1),max(numOfYears,1)))
+
+    for i in range(numOfEns):
+        for yr in range(0,numOfYears,numOfBlock):
+            yrs = slice(yr,min(yr+numOfBlock,numOfYears))
+            block = enstime[i,yrs]
+            if sliceperiod == 'DJF':
+                block[:] = np.nanmean(np.stack([ensvalue[i,yrs.start:yrs.stop,2],
+                                                ensvalue[i,yrs.start+1:yrs.stop+1,0],
+                                                ensvalue[i,yrs.start+1:yrs.stop+1,1]]),
+                                      axis=0)
+            elif sliceperiod != 'none':
+                np.nanmean(ensvalue[i,yrs],axis=1,out=block)
+
+            ### Change missing values
+            if slicenan is not None:
+                if slicenan != 'nan':
+                    block[np.isnan(block)] = fillvalue
+                for operator,value in missing:
+                    block[compare[operator](block,value)] = fillvalue
+
+            ### Change units
+            if units is not None:
+                convert[units[0]](block,units[1],out=block)
+
+    ### Shape of output array
+    if sliceperiod == 'none':
+        if sliceshape == 1:
+            ensshape = enstime.ravel()
+        elif sliceshape == 4:
+            ensshape = np.reshape(enstime,(enstime.shape[0],enstime.shape[1]*enstime.shape[2],
+                                           enstime.shape[3],enstime.shape[4]))
+        elif any([sliceshape == 5,sliceshape == 6]):
+            ensshape = enstime
+        print('Shape of output =', ensshape.shape, [[ensshape.ndim]])
+        print('Completed: ALL RAVELED MONTHS!')
+    elif sliceperiod == 'DJF':
+        ensshape = enstime
+        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
+        print('Completed: DJF MEAN!')
+    else:
+        if sliceshape == 1:
+            ensshape = enstime.ravel()
+        elif any([sliceshape == 4,sliceshape == 5]):
+            ensshape = enstime
+        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
+        if sliceperiod == 'annual':
+            print('Completed: ANNUAL MEAN!')
+        else:
+            print('Completed: %s MEAN!' % sliceperiod)
+    if slicenan == 'nan':
+        print('Completed: missing values are =',slicenan)
+    return ensshape
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setReadWorkers(workers,pool='process'):
+    """
+    Function sets how many ensemble member files are read at the same time
+
+    Parameters
+    ----------
+    workers : integer
+        number of member files read at once (1 = one after another)
+    pool : string
+        'process' or 'thread' (threads need a thread-safe netCDF/HDF5 build,
+        which the netCDF4 wheels are not)
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setReadWorkers(workers,pool)
+    """
+    global READWORKERS,READPOOL
+
+    ### Import modules
+    import sys
+
+    if any([workers < 1,pool not in ('thread','process')]):
+        print(ValueError('WRONG NUMBER OF WORKERS OR POOL SELECTED!!!'))
+        sys.exit()
+    READWORKERS = int(workers)
+    READPOOL = pool
+    print('Reading ensemble members with %s %s worker(s)!' % (READWORKERS,READPOOL))
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readMembers(filenames,vari,timeindex,lat_bounds,lon_bounds,
+                latname='lat',lonname='lon',months=None,workers=None,pool=None,
+                out=None,dtype=None):
+    """
+    Function reads all ensemble member files into one [ens,time,lat,lon]
+    array, using a pool of workers when more than one worker is set
+
+    Parameters
+    ----------
+    filenames : list of strings
+        netCDF file for each ensemble member (in order)
+    vari : string
+        variable for analysis
+    timeindex : slice or list of slices
+        time steps to read (one for all files or one per file)
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    latname : string
+        name of the latitude variable
+    lonname : string
+        name of the longitude variable
+    months : list of integers or None
+        months of each year to read and None for all
+    workers : integer or None
+        number of member files read at once and None for READWORKERS
+    pool : string or None
+        'process' or 'thread' and None for READPOOL
+    out : 4d numpy array or None
+        [ens,time,lat,lon] array (or view) to read into and None for a new one
+    dtype : numpy dtype or None
+        data type of a new array and None for READDTYPE or the file type
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    membersvar : 4d numpy array
+        [ens,time,lat,lon] in the same order as filenames
+
+    Usage
+    -----
+    lat1,lon1,membersvar = readMembers(filenames,vari,timeindex,lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor,ProcessPoolExecutor
+    from concurrent.futures import wait,FIRST_COMPLETED
+    import calc_Catalog as CG
+
+    if workers is None:
+        workers = READWORKERS
+    if pool is None:
+        pool = READPOOL
+    READFILES.extend(filenames)
+    if isinstance(timeindex,list):
+        timeindexes = timeindex
+    else:
+        timeindexes = [timeindex]*len(filenames)
+
+    ### Missing or short members stop the request before anything is read
+    ### (see calc_Catalog)
+    if CG.CATALOGFILE is not None:
+        CG.checkFiles(filenames,vari,[getTimeLength(timeq) for timeq in timeindexes])
+
+    def memberArgs(i):
+        return (filenames[i],vari,timeindexes[i],lat_bounds,lon_bounds,
+                latname,lonname,months)
+
+    ### Read the first member to size the output array
+    lat1,lon1,var = readMember(*memberArgs(0))
+    if out is None:
+        if dtype is None:
+            dtype = READDTYPE or var.dtype
+        membersvar = np.empty((len(filenames),) + var.shape,dtype=dtype)
+    else:
+        membersvar = out
+    membersvar[0] = np.ma.getdata(var)
+    del var
+    print('Completed: read Ensemble Member --%s-- (%s)' % (1,filenames[0]))
+
+    ### Read the other members into their slots of the output array
+    if workers == 1:
+        for i in range(1,len(filenames)):
+            membersvar[i] = np.ma.getdata(readMember(*memberArgs(i))[2])
+            print('Completed: read Ensemble Member --%s-- (%s)' % (i+1,filenames[i]))
+    else:
+        if pool == 'thread':
+            executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        with executor:
+            ### Only keep a few members in flight to bound memory
+            pending = {}
+            nextmember = 1
+            while any([nextmember < len(filenames),len(pending) > 0]):
+                while all([nextmember < len(filenames),len(pending) < 2*workers]):
+                    future = executor.submit(readMember,*memberArgs(nextmember))
+                    pending[future] = nextmember
+                    nextmember += 1
+                done,notdone = wait(pending,return_when=FIRST_COMPLETED)
+                for future in done:
+                    i = pending.pop(future)
+                    membersvar[i] = np.ma.getdata(future.result()[2])
+                    print('Completed: read Ensemble Member --%s-- (%s)' % (i+1,filenames[i]))
+
+    return lat1,lon1,membersvar
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setReadDtype(dtype):
+    """
+    Function sets the data type of the arrays built by the readers and by
+    calc_Utilities, calc_Stats, calc_DetrendData and calc_SegmentData. Sums,
+    means and trends are still accumulated in float64
+
+    Parameters
+    ----------
+    dtype : numpy dtype or None
+        for example np.float32 and None to keep the data type of the files
+        (and float64 for the calc_ functions)
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setReadDtype(dtype)
+    """
+    global READDTYPE
+
+    ### Import modules
+    import numpy as np
+
+    if dtype is None:
+        READDTYPE = None
+    else:
+        READDTYPE = np.dtype(dtype)
+    print('Data type of the reader arrays is ---> %s!' % READDTYPE)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def emptyMembers(filename,vari,lat_bounds,lon_bounds,leadshape,
+                 latname='lat',lonname='lon',dtype=None):
+    """
+    Function allocates the output array of a reader from the grid of one
+    member file, so every member and time period can be read straight into it
+
+    Parameters
+    ----------
+    filename : string
+        path of one of the netCDF files
+    vari : string
+        variable for analysis
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    leadshape : tuple of integers
+        leading dimensions of the array, e.g. (ens,years,months)
+    latname : string
+        name of the latitude variable
+    lonname : string
+        name of the longitude variable
+    dtype : numpy dtype or None
+        data type of the array and None for READDTYPE or the file type
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    ensvalue : numpy array
+        uninitialized [leadshape,lat,lon] array
+
+    Usage
+    -----
+    lat1,lon1,ensvalue = emptyMembers(filename,vari,lat_bounds,lon_bounds,leadshape)
+    """
+
+    ### Import modules
+    import numpy as np
+    from netCDF4 import Dataset
+
+    data = Dataset(filename,'r')
+    lat1 = data.variables[latname][:]
+    lon1 = data.variables[lonname][:]
+    ncvar = data.variables['%s' % vari]
+    if dtype is None:
+        if READDTYPE is not None:
+            dtype = READDTYPE
+        elif hasattr(ncvar,'scale_factor'):
+            dtype = np.asarray(ncvar.scale_factor).dtype
+        else:
+            dtype = ncvar.dtype
+    data.close()
+
+    latslice,lonslices = getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    lat1 = lat1[latslice]
+    if len(lonslices) == 1:
+        lon1 = lon1[lonslices[0]]
+    else:
+        lon1 = np.ma.concatenate([lon1[lonq] for lonq in lonslices])
+
+    ensvalue = np.empty(tuple(leadshape) + (lat1.shape[0],lon1.shape[0]),
+                        dtype=dtype)
+    return lat1,lon1,ensvalue
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getComputeDtype(var=None):
+    """
+    Function returns the data type for a new array (see setReadDtype)
+
+    Parameters
+    ----------
+    var : numpy array or None
+        input array whose data type is kept when READDTYPE is not set and
+        None for float64
+
+    Returns
+    -------
+    dtype : numpy dtype
+        READDTYPE, the data type of var or float64
+
+    Usage
+    -----
+    dtype = getComputeDtype(var)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if READDTYPE is not None:
+        dtype = READDTYPE
+    elif var is not None:
+        dtype = np.asarray(var).dtype
+    else:
+        dtype = np.dtype(np.float64)
+    return dtype
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getTimeLength(timeindex):
+    """
+    Function returns how many time steps a file needs for a time index
+
+    Parameters
+    ----------
+    timeindex : slice or 1d array
+        time steps to read
+
+    Returns
+    -------
+    numOfTime : integer or None
+        smallest length of the time dimension and None if it is unknown
+        (e.g., slice(start,None) with start >= 0)
+
+    Usage
+    -----
+    numOfTime = getTimeLength(timeindex)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    if isinstance(timeindex,slice):
+        if timeindex.stop is not None and timeindex.stop > 0:
+            numOfTime = timeindex.stop
+        elif timeindex.start is not None and timeindex.start < 0:
+            numOfTime = -timeindex.start
+        else:
+            numOfTime = None
+    else:
+        timeindex = np.asarray(timeindex)
+        if timeindex.size == 0 or np.min(timeindex) < 0:
+            numOfTime = None
+        else:
+            numOfTime = int(np.max(timeindex)) + 1
+    return numOfTime
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def iterMembers(reader,numOfEns,**arguments):
+    """
+    Function reads an ensemble one member at a time with a reader that
+    takes numOfEns and members (e.g., read_SPEAR_MED or read_LENS2), so a
+    reduction over members only needs one member in memory
+
+    Parameters
+    ----------
+    reader : function
+        read_* function with numOfEns and members arguments
+    numOfEns : integer
+        members 1 to numOfEns are read one at a time
+    **arguments : keyword arguments
+        all other arguments of the reader (e.g., directory, vari,
+        sliceperiod, sliceshape, slicenan, timeper)
+
+    Returns
+    -------
+    members : generator
+        (member_index,lat,lon,var) for each member with var in the shape of
+        the reader without the ensemble dimension (the raveled member for
+        sliceshape 1)
+
+    Usage
+    -----
+    for i,lat,lon,var in iterMembers(reader,numOfEns,**arguments):
+        ...
+    """
+
+    for i,ensmember in enumerate(range(1,numOfEns+1)):
+        lat1,lon1,var = reader(numOfEns=1,members=[ensmember],**arguments)
+        if arguments.get('sliceshape') != 1:
+            var = var[0]
+        yield i,lat1,lon1,var
@@ -0,0 +1,403 @@
+"""
+Functions regrid data from their native lat/lon grid onto the LOWS, MEDS or
+HIGHS grids (the SPEAR_LOW, SPEAR_MED and SPEAR_HIGH grids) as they are
+read, instead of keeping a pre-regridded copy of each data set. Weights are
+sparse matrices that are built once for each (source grid, target grid,
+method) and kept in memory and in the readFiles cache (see
+calc_ReadCache.setCacheDirectory), so regridding is one sparse matrix
+product for each slab of maps
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setRegridMethod(method)
+    [2] getTargetGrid(grid)
+    [3] getWeights1d(src,dst,method,periodic,latitude)
+    [4] getWeights(lat1,lon1,lat2,lon2,method)
+    [5] regridArray(data,lat1,lon1,lat2,lon2,method)
+    [6] readRegridded(variq,dataset,monthlychoice,scenario,grid,lat_bounds,lon_bounds)
+"""
+
+### Data set (see calc_DatasetRegistry) and variable that define each grid
+TARGETGRIDS = {'LOWS' : ('SPEAR_LOW','T2M'),
+               'MEDS' : ('SPEAR_MED','T2M'),
+               'HIGHS' : ('SPEAR_HIGH','T2M')}
+
+### Regridding method (see setRegridMethod)
+REGRIDMETHOD = 'conservative'
+
+### Weights built by this process (key : (weights,covered))
+WEIGHTS = {}
+
+### Number of maps in each sparse matrix product
+SLABSIZE = 120
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setRegridMethod(method):
+    """
+    Function sets the regridding method used by readRegridded
+
+    Parameters
+    ----------
+    method : string
+        conservative (area weighted) or bilinear
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setRegridMethod(method)
+    """
+    global REGRIDMETHOD
+
+    ### Import modules
+    import sys
+
+    if method not in ('conservative','bilinear'):
+        print(ValueError('WRONG REGRIDDING METHOD SELECTED!!!'))
+        sys.exit()
+    REGRIDMETHOD = method
+    print('Regridding method ---> %s' % REGRIDMETHOD)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getTargetGrid(grid):
+    """
+    Function returns the lat/lon of a target grid
+
+    Parameters
+    ----------
+    grid : string
+        LOWS or MEDS or HIGHS
+
+    Returns
+    -------
+    lat2 : 1d numpy array
+        latitudes
+    lon2 : 1d numpy array
+        longitudes
+
+    Usage
+    -----
+    lat2,lon2 = getTargetGrid(grid)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    import calc_DatasetRegistry as DR
+
+    if grid not in TARGETGRIDS:
+        print(ValueError('WRONG TARGET GRID SELECTED!!!'))
+        sys.exit()
+    dataset,vari = TARGETGRIDS[grid]
+    lat2,lon2 = DR.getGrid(dataset,vari)[:2]
+    return np.ma.getdata(lat2),np.ma.getdata(lon2)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getWeights1d(src,dst,method,periodic,latitude=False):
+    """
+    Function builds the weights from one coordinate to another. Rows of the
+    weights sum to 1, or 0 where a target point is outside the source
+
+    Parameters
+    ----------
+    src : 1d numpy array
+        source coordinate (either order)
+    dst : 1d numpy array
+        target coordinate (either order)
+    method : string
+        conservative or bilinear
+    periodic : boolean
+        True for longitudes that go around the globe
+    latitude : boolean
+        True to weight overlaps by area (sin of latitude)
+
+    Returns
+    -------
+    weights : scipy.sparse.csr_matrix
+        [dst,src] weights
+
+    Usage
+    -----
+    weights = getWeights1d(src,dst,method,periodic,latitude)
+    """
+
+    ### Import modules
+    import numpy as np
+    from scipy import sparse
+
+    src = np.asarray(src,dtype=np.float64)
+    dst = np.asarray(dst,dtype=np.float64)
+    order = np.argsort(src)
+    srcs = src[order]
+    rows,cols,vals = [],[],[]
+
+    if method == 'bilinear':
+        if periodic == True:
+            srcs = np.concatenate([srcs[-1:] - 360.,srcs,srcs[:1] + 360.])
+            order = np.concatenate([order[-1:],order,order[:1]])
+            dstq = (dst - srcs[1]) % 360. + srcs[1]
+        else:
+            dstq = dst
+        upper = np.clip(np.searchsorted(srcs,dstq,side='right'),1,srcs.shape[0]-1)
+        lower = upper - 1
+        inside = (dstq >= srcs[0]) & (dstq <= srcs[-1])
+        frac = (dstq - srcs[lower])/(srcs[upper] - srcs[lower])
+        for i in np.where(inside)[0]:
+            rows += [i,i]
+            cols += [order[lower[i]],order[upper[i]]]
+            vals += [1. - frac[i],frac[i]]
+
+    elif method == 'conservative':
+        def getEdges(points):
+            mids = (points[1:] + points[:-1])/2.
+            edges = np.concatenate([[points[0] - (mids[0] - points[0])],mids,
+                                    [points[-1] + (points[-1] - mids[-1])]])
+            if latitude == True:
+                edges = np.clip(edges,-90.,90.)
+            return edges
+        srce = getEdges(srcs)
+        orderdst = np.argsort(dst)
+        edgesdst = getEdges(dst[orderdst])
+        dste = np.empty((dst.shape[0],2))
+        dste[orderdst,0] = edgesdst[:-1]
+        dste[orderdst,1] = edgesdst[1:]
+        if latitude == True:
+            measure = lambda x : np.sin(np.radians(x))
+        else:
+            measure = lambda x : x
+        shifts = [-360.,0.,360.] if periodic == True else [0.]
+        for i in range(dst.shape[0]):
+            for shift in shifts:
+                low = np.maximum(srce[:-1] + shift,dste[i,0])
+                high = np.minimum(srce[1:] + shift,dste[i,1])
+                for j in np.where(high > low)[0]:
+                    rows.append(i)
+                    cols.append(order[j])
+                    vals.append(measure(high[j]) - measure(low[j]))
+    else:
+        print(ValueError('WRONG REGRIDDING METHOD SELECTED!!!'))
+        return None
+
+    weights = sparse.csr_matrix((vals,(rows,cols)),shape=(dst.shape[0],src.shape[0]))
+    weights.sum_duplicates()
+    rowsum = np.asarray(weights.sum(axis=1)).ravel()
+    scale = np.where(rowsum > 0,1./np.where(rowsum > 0,rowsum,1.),0.)
+    weights = sparse.diags(scale) @ weights
+    return weights.tocsr()
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getWeights(lat1,lon1,lat2,lon2,method):
+    """
+    Function returns the weights from one lat/lon grid to another, built
+    once and then read from memory or the readFiles cache
+
+    Parameters
+    ----------
+    lat1 : 1d numpy array
+        source latitudes
+    lon1 : 1d numpy array
+        source longitudes
+    lat2 : 1d numpy array
+        target latitudes
+    lon2 : 1d numpy array
+        target longitudes
+    method : string
+        conservative or bilinear
+
+    Returns
+    -------
+    weights : scipy.sparse.csr_matrix
+        [lat2*lon2,lat1*lon1] weights
+    covered : 1d numpy array
+        False for target points outside the source grid
+
+    Usage
+    -----
+    weights,covered = getWeights(lat1,lon1,lat2,lon2,method)
+    """
+
+    ### Import modules
+    import numpy as np
+    import os
+    import hashlib
+    from scipy import sparse
+    import calc_ReadCache as RC
+
+    lat1,lon1,lat2,lon2 = [np.asarray(np.ma.getdata(x),dtype=np.float64)
+                           for x in (lat1,lon1,lat2,lon2)]
+    request = b''.join([x.tobytes() for x in (lat1,lon1,lat2,lon2)] +
+                       [method.encode('utf-8')])
+    key = hashlib.sha1(request).hexdigest()
+    if key in WEIGHTS:
+        return WEIGHTS[key]
+
+    ### Weights saved by any process with the readFiles cache on
+    if RC.CACHEDIRECTORY is not None:
+        filename = os.path.join(RC.CACHEDIRECTORY,'regrid','%s.npz' % key)
+        if os.path.exists(filename):
+            weights = sparse.load_npz(filename).tocsr()
+            covered = np.asarray(weights.sum(axis=1)).ravel() > 0
+            WEIGHTS[key] = (weights,covered)
+            print('Completed: regridding weights from the cache (%s)' % key)
+            return WEIGHTS[key]
+
+    ### Regular grids, so the 2d weights are the product of the 1d weights
+    spacing = np.abs(np.diff(np.sort(lon1))).max() if lon1.shape[0] > 1 else 360.
+    periodic = (lon1.max() - lon1.min()) + spacing >= 359.9
+    weightslat = getWeights1d(lat1,lat2,method,False,latitude=True)
+    weightslon = getWeights1d(lon1,lon2,method,periodic)
+    weights = sparse.kron(weightslat,weightslon,format='csr')
+    covered = np.asarray(weights.sum(axis=1)).ravel() > 0
+    WEIGHTS[key] = (weights,covered)
+    print('Completed: built %s regridding weights (%s)' % (method,key))
+
+    if RC.CACHEDIRECTORY is not None:
+        directoryregrid = os.path.join(RC.CACHEDIRECTORY,'regrid')
+        os.makedirs(directoryregrid,exist_ok=True)
+        filetemp = os.path.join(directoryregrid,'%s.%s.tmp.npz' % (key,os.getpid()))
+        sparse.save_npz(filetemp,weights)
+        os.replace(filetemp,os.path.join(directoryregrid,'%s.npz' % key))
+    return WEIGHTS[key]
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def regridArray(data,lat1,lon1,lat2,lon2,method):
+    """
+    Function regrids the maps of an array. Missing values are left out and
+    the weights of the remaining points are renormalized
+
+    Parameters
+    ----------
+    data : 2d+ numpy array
+        [...,lat1,lon1] data
+    lat1 : 1d numpy array
+        source latitudes
+    lon1 : 1d numpy array
+        source longitudes
+    lat2 : 1d numpy array
+        target latitudes
+    lon2 : 1d numpy array
+        target longitudes
+    method : string
+        conservative or bilinear
+
+    Returns
+    -------
+    regridded : numpy array
+        [...,lat2,lon2] data with nan where there are no source values
+
+    Usage
+    -----
+    regridded = regridArray(data,lat1,lon1,lat2,lon2,method)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    weights,covered = getWeights(lat1,lon1,lat2,lon2,method)
+    data = np.ma.filled(data,np.nan) if np.ma.isMaskedArray(data) else np.asarray(data)
+    if not np.issubdtype(data.dtype,np.floating):
+        data = data.astype(np.float32)
+    leadshape = data.shape[:-2]
+    maps = data.reshape(-1,data.shape[-2]*data.shape[-1])
+    regridded = np.empty((maps.shape[0],weights.shape[0]),dtype=data.dtype)
+
+    for t in range(0,maps.shape[0],SLABSIZE):
+        slab = maps[t:t+SLABSIZE]
+        valid = np.isfinite(slab)
+        if valid.all():
+            regridded[t:t+SLABSIZE] = (weights @ slab.T).T
+        else:
+            total = (weights @ np.where(valid,slab,0).T).T
+            count = (weights @ valid.T.astype(data.dtype)).T
+            with np.errstate(invalid='ignore',divide='ignore'):
+                regridded[t:t+SLABSIZE] = np.where(count > 1e-6,total/count,np.nan)
+    regridded[:,~covered] = np.nan
+
+    regridded = regridded.reshape(leadshape + (lat2.shape[0],lon2.shape[0]))
+    return regridded
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readRegridded(variq,dataset,monthlychoice,scenario,grid,lat_bounds=None,
+                  lon_bounds=None):
+    """
+    Function reads a data set from its native files and regrids it onto the
+    LOWS or MEDS or HIGHS grid (with REGRIDMETHOD)
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data (native grid)
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    grid : string
+        LOWS or MEDS or HIGHS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region of the target grid
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region of the target grid
+
+    Returns
+    -------
+    data : numpy array
+        regridded data
+    lat2 : 1d numpy array
+        latitudes
+    lon2 : 1d numpy array
+        longitudes
+
+    Usage
+    -----
+    data,lat2,lon2 = readRegridded(variq,dataset,monthlychoice,scenario,grid,
+                                   lat_bounds,lon_bounds)
+    """
+    print('\n>>>>>>>>>> STARTING readRegridded function!')
+
+    ### Import modules
+    import calc_dataFunctions as df
+
+    ### Whole native grid, so the edges of a region have all their neighbours
+    data,lat1,lon1 = df.readFiles(variq,dataset,monthlychoice,scenario)
+    lat2,lon2 = getTargetGrid(grid)
+    data = regridArray(data,lat1,lon1,lat2,lon2,REGRIDMETHOD)
+    print('Completed: regridded %s onto the %s grid (%s)' % (dataset,grid,REGRIDMETHOD))
+
+    if any([lat_bounds is not None,lon_bounds is not None]):
+        data,lat2,lon2 = df.getRegion(data,lat2,lon2,
+                                      lat_bounds if lat_bounds is not None else (-90.,90.),
+                                      lon_bounds if lon_bounds is not None else (0.,360.))
+    print('>>>>>>>>>> ENDING readRegridded function!')
+    return data,lat2,lon2
+
+# ### Test functions - do not use!
+# import calc_Regrid as RG
+# RG.setRegridMethod('conservative')
+# data,lat2,lon2 = RG.readRegridded('T2M','ERA5_1x1','annual',None,'MEDS')
@@ -0,0 +1,340 @@
+"""
+Functions build and read one consolidated [ens,time,lat,lon] file per
+experiment and variable of the SPEAR monthly archive, so a reader opens one
+chunked file instead of one file per member and period
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] setStoreDirectory(directory)
+    [2] getStoreFile(experiment,vari)
+    [3] getStoreChunks(numOfTime,numOfLat,numOfLon)
+    [4] makeStore(experiment,vari,numOfEns,sources)
+    [5] readStore(storefile,vari,numOfEns,years,lat_bounds,lon_bounds,months,members)
+"""
+
+### Directory of the consolidated files and None to read the member files
+### (see setStoreDirectory)
+STOREDIRECTORY = None
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def setStoreDirectory(directory):
+    """
+    Function sets where the consolidated files are kept (None to switch off)
+
+    Parameters
+    ----------
+    directory : string or None
+        directory of the consolidated files and None to read member files
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    setStoreDirectory(directory)
+    """
+    global STOREDIRECTORY
+
+    STOREDIRECTORY = directory
+    print('Consolidated SPEAR files ---> %s' % STOREDIRECTORY)
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getStoreFile(experiment,vari):
+    """
+    Function returns the consolidated file of an experiment and variable
+
+    Parameters
+    ----------
+    experiment : string
+        name of the experiment (e.g., SPEAR_MED or SPEAR_MED_SSP245)
+    vari : string
+        variable for analysis
+
+    Returns
+    -------
+    storefile : string or None
+        path of the file and None if there is no consolidated file
+
+    Usage
+    -----
+    storefile = getStoreFile(experiment,vari)
+    """
+
+    ### Import modules
+    import os
+
+    if STOREDIRECTORY is None:
+        return None
+    storefile = os.path.join(STOREDIRECTORY,experiment,'%s_%s.nc' % (vari,experiment))
+    if not os.path.exists(storefile):
+        return None
+    return storefile
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def getStoreChunks(numOfTime,numOfLat,numOfLon):
+    """
+    Function picks the chunk shape of the consolidated variable. One member,
+    10 years of months and a quarter of the grid in each direction, so maps
+    and time series at a point both only touch a few chunks
+
+    Parameters
+    ----------
+    numOfTime : integer
+        number of months
+    numOfLat : integer
+        number of latitudes
+    numOfLon : integer
+        number of longitudes
+
+    Returns
+    -------
+    chunks : tuple
+        (ens,time,lat,lon) chunk shape
+
+    Usage
+    -----
+    chunks = getStoreChunks(numOfTime,numOfLat,numOfLon)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    chunks = (1,min(numOfTime,120),
+              int(np.ceil(numOfLat/4)),int(np.ceil(numOfLon/4)))
+    return chunks
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def makeStore(experiment,vari,numOfEns,sources):
+    """
+    Function converts the member files of one experiment and variable into a
+    consolidated file in STOREDIRECTORY. The values, fill value and packing
+    attributes are copied as they are in the member files
+
+    Parameters
+    ----------
+    experiment : string
+        name of the experiment (e.g., SPEAR_MED or SPEAR_MED_SSP245)
+    vari : string
+        variable for analysis
+    numOfEns : integer
+        number of ensemble members
+    sources : list of tuples
+        (directory,period) of each time period in order, e.g.
+        [(directory,'1921-2010'),(directoryScenario,'2011-2100')] for the
+        files directory + '%s/%s_%02d_%s.nc' % (vari,vari,ensmember,period)
+
+    Returns
+    -------
+    storefile : string
+        path of the consolidated file
+
+    Usage
+    -----
+    storefile = makeStore(experiment,vari,numOfEns,sources)
+    """
+    print('\n>>>>>>>>>> STARTING makeStore function!')
+
+    ### Import modules
+    import numpy as np
+    import os
+    import sys
+    from netCDF4 import Dataset
+
+    if STOREDIRECTORY is None:
+        print(ValueError('SET THE STORE DIRECTORY FIRST (setStoreDirectory)!!!'))
+        sys.exit()
+
+    ### Time axis of the consolidated file
+    ens = np.arange(1,numOfEns+1,1)
+    years = np.concatenate([np.arange(int(period.split('-')[0]),
+                                      int(period.split('-')[1])+1,1)
+                            for directory,period in sources])
+
+    ### Grid and attributes come from the first member file
+    filename = sources[0][0] + '%s/%s_%02d_%s.nc' % (vari,vari,ens[0],sources[0][1])
+    data = Dataset(filename,'r')
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    ncvar = data.variables['%s' % vari]
+    attributes = {att : ncvar.getncattr(att) for att in ncvar.ncattrs()}
+    dtype = ncvar.dtype
+    data.close()
+
+    directorystore = os.path.join(STOREDIRECTORY,experiment)
+    os.makedirs(directorystore,exist_ok=True)
+    storefile = os.path.join(directorystore,'%s_%s.nc' % (vari,experiment))
+    storetemp = storefile + '.tmp'
+
+    ### Create the consolidated file
+    store = Dataset(storetemp,'w',format='NETCDF4')
+    store.description = 'Consolidated SPEAR monthly %s for %s' % (vari,experiment)
+    store.createDimension('ens',ens.shape[0])
+    store.createDimension('time',years.shape[0]*12)
+    store.createDimension('lat',lat1.shape[0])
+    store.createDimension('lon',lon1.shape[0])
+    store.createVariable('ens','i4',('ens',))[:] = ens
+    store.createVariable('years','i4',('time',))[:] = np.repeat(years,12)
+    store.createVariable('lat',lat1.dtype,('lat',))[:] = lat1
+    store.createVariable('lon',lon1.dtype,('lon',))[:] = lon1
+    storevar = store.createVariable(vari,dtype,('ens','time','lat','lon'),
+                                    fill_value=attributes.pop('_FillValue',None),
+                                    chunksizes=getStoreChunks(years.shape[0]*12,
+                                                              lat1.shape[0],
+                                                              lon1.shape[0]))
+    storevar.setncatts(attributes)
+    storevar.set_auto_maskandscale(False)
+
+    ### Copy each member and period as raw values
+    for i,ensmember in enumerate(ens):
+        timestart = 0
+        for directory,period in sources:
+            filename = directory + '%s/%s_%02d_%s.nc' % (vari,vari,ensmember,period)
+            data = Dataset(filename,'r')
+            ncvar = data.variables['%s' % vari]
+            ncvar.set_auto_maskandscale(False)
+            storevar[i,timestart:timestart+ncvar.shape[0],:,:] = ncvar[:]
+            timestart += ncvar.shape[0]
+            data.close()
+        if timestart != years.shape[0]*12:
+            store.close()
+            os.remove(storetemp)
+            print(ValueError('WRONG NUMBER OF MONTHS IN THE MEMBER FILES!!!'))
+            sys.exit()
+        print('Completed: stored Ensemble Member --%s-- of %s' % (ensmember,experiment))
+    store.close()
+
+    os.replace(storetemp,storefile)
+    print('>>>>>>>>>> ENDING makeStore function ---> %s' % storefile)
+    return storefile
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def readStore(storefile,vari,numOfEns,years,lat_bounds,lon_bounds,months=None,
+              members=None):
+    """
+    Function reads the members, years, months and region of a consolidated
+    file into one [ens,yr,mn,lat,lon] array
+
+    Parameters
+    ----------
+    storefile : string
+        path of the consolidated file (see getStoreFile)
+    vari : string
+        variable for analysis
+    numOfEns : integer
+        number of ensemble members to read
+    years : 1d numpy array
+        consecutive years to read
+    lat_bounds : 2 floats or None
+        (latmin,latmax) and None for all latitudes
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) and None for all longitudes
+    months : list of integers or None
+        months of each year to read (see getMonthIndices) and None for all
+    members : list of integers or None
+        ensemble members to read (1 = first) and None for 1 to numOfEns
+
+    Returns
+    -------
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+    ensvalue : 5d numpy array
+        [ens,yr,mn,lat,lon]
+
+    Usage
+    -----
+    lat1,lon1,ensvalue = readStore(storefile,vari,numOfEns,years,lat_bounds,lon_bounds,months)
+    """
+
+    ### Import modules
+    import numpy as np
+    import sys
+    from netCDF4 import Dataset
+    import calc_ReadUtilities as RU
+
+    if months is None:
+        months = list(range(12))
+    if members is None:
+        ensindex = slice(None,numOfEns)
+        lastmember = numOfEns
+    else:
+        ensindex = [ensmember-1 for ensmember in members]
+        numOfEns = len(ensindex)
+        lastmember = max(members)
+    RU.READFILES.append(storefile)
+
+    data = Dataset(storefile,'r')
+    lat1 = data.variables['lat'][:]
+    lon1 = data.variables['lon'][:]
+    latslice,lonslices = RU.getRegionSlices(lat1,lon1,lat_bounds,lon_bounds)
+    ncvar = data.variables['%s' % vari]
+
+    ### Months of the first and last year
+    yearstore = data.variables['years'][:]
+    timestart = np.where(yearstore == years[0])[0]
+    if timestart.shape[0] > 0:
+        timestart = timestart[0]
+    if any([np.size(timestart) == 0,ncvar.shape[0] < lastmember]) or \
+        yearstore.shape[0] < timestart + years.shape[0]*12:
+        data.close()
+        print(ValueError('YEARS OR MEMBERS ARE NOT IN THE CONSOLIDATED FILE!!!'))
+        sys.exit()
+
+    lat1 = lat1[latslice]
+    if len(lonslices) == 1:
+        lon1 = lon1[lonslices[0]]
+    else:
+        lon1 = np.ma.concatenate([lon1[lonq] for lonq in lonslices])
+    if RU.READDTYPE is not None:
+        dtype = RU.READDTYPE
+    elif hasattr(ncvar,'scale_factor'):
+        dtype = np.asarray(ncvar.scale_factor).dtype
+    else:
+        dtype = ncvar.dtype
+    ensvalue = np.empty((numOfEns,years.shape[0],len(months),
+                         lat1.shape[0],lon1.shape[0]),dtype=dtype)
+
+    ### One strided read of all members for each month (and longitude slab)
+    lonstart = 0
+    for lonq in lonslices:
+        lonstop = lonstart + len(range(*lonq.indices(ncvar.shape[3])))
+        for m,mo in enumerate(months):
+            timeslice = slice(timestart+mo,timestart+years.shape[0]*12,12)
+            ensvalue[:,:,m,:,lonstart:lonstop] = np.ma.getdata(ncvar[ensindex,timeslice,
+                                                                      latslice,lonq])
+        lonstart = lonstop
+    data.close()
+
+    print('Completed: read %s members from %s' % (numOfEns,storefile))
+    return lat1,lon1,ensvalue
+
+# ### Test functions - do not use!
+# import numpy as np
+# import calc_SPEARStore as ST
+# directory = '/work/Zachary.Labe/Data/SPEAR/SPEAR_MED/monthly/'
+# ST.setStoreDirectory('/work/Zachary.Labe/Data/SPEAR/Consolidated/')
+# storefile = ST.makeStore('SPEAR_MED','T2M',30,[(directory,'1921-2010'),
+#                                                 (directory,'2011-2100')])
+# lat,lon,var = ST.readStore(storefile,'T2M',30,np.arange(1921,2100+1,1),None,None)
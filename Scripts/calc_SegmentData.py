@@ -31,6 +31,7 @@ def segment_data(data,classesl,ensTypeExperi,fac,random_segment_seed):
     import numpy as np
     import sys
     import tensorflow.keras as keras
+    import calc_ReadUtilities as RU
     
     ### Create class weights
     def class_weight_creator(Y):
@@ -104,7 +105,7 @@ def segment_data(data,classesl,ensTypeExperi,fac,random_segment_seed):
         ### Training segment----------
         data_train = np.empty((len(trainIndices),datanew.shape[1],
                                 datanew.shape[2],datanew.shape[3],
-                                datanew.shape[4]))
+                                datanew.shape[4]),dtype=RU.getComputeDtype())
         Ytrain = np.empty((len(trainIndices),classeslnew.shape[1],
                             classeslnew.shape[2]))
         for index,ensemble in enumerate(trainIndices):
@@ -132,7 +133,7 @@ def segment_data(data,classesl,ensTypeExperi,fac,random_segment_seed):
         ### Testing segment----------
         data_test = np.empty((len(testIndices),datanew.shape[1],
                                 datanew.shape[2],datanew.shape[3],
-                                datanew.shape[4]))
+                                datanew.shape[4]),dtype=RU.getComputeDtype())
         Ytest = np.empty((len(testIndices),classeslnew.shape[1],
                             classeslnew.shape[2]))
         for index,ensemble in enumerate(testIndices):
@@ -163,7 +164,7 @@ def segment_data(data,classesl,ensTypeExperi,fac,random_segment_seed):
         ### Validation segment----------
         data_val = np.empty((len(valIndices),datanew.shape[1],
                                 datanew.shape[2],datanew.shape[3],
-                                datanew.shape[4]))
+                                datanew.shape[4]),dtype=RU.getComputeDtype())
         Yval = np.empty((len(valIndices),classeslnew.shape[1],
                             classeslnew.shape[2]))
         for index,ensemble in enumerate(valIndices):
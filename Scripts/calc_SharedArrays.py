@@ -0,0 +1,284 @@
+"""
+Functions hand large arrays to multiprocessing workers through
+multiprocessing.shared_memory. The loader publishes an array once and passes
+a small descriptor (name, shape, dtype) to the workers, which attach to the
+same memory instead of receiving a pickled copy
+
+Notes
+-----
+    Author : Zachary Labe
+    Date   : 18 October 2026
+
+Usage
+-----
+    [1] createArray(shape,dtype)
+    [2] publishArray(data)
+    [3] attachArray(descriptor)
+    [4] releaseArray(descriptor)
+    [5] releaseAll()
+    [6] publishFiles(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bounds)
+"""
+
+### Shared memory blocks created by this process (name : SharedMemory),
+### unlinked by releaseArray/releaseAll and at exit
+PUBLISHED = {}
+
+### Shared memory blocks attached by this process (name : SharedMemory)
+ATTACHED = {}
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def createArray(shape,dtype):
+    """
+    Function creates an empty array in a new shared memory block, so a reader
+    can fill it in place (e.g., the out argument of readMembers)
+
+    Parameters
+    ----------
+    shape : tuple
+        shape of the array
+    dtype : numpy dtype
+        data type of the array
+
+    Returns
+    -------
+    descriptor : tuple
+        (name,shape,dtype) to pass to the workers (see attachArray)
+    data : numpy array
+        writable view of the shared memory
+
+    Usage
+    -----
+    descriptor,data = createArray(shape,dtype)
+    """
+
+    ### Import modules
+    import numpy as np
+    import atexit
+    from multiprocessing import shared_memory
+
+    shape = tuple(int(n) for n in shape)
+    dtype = np.dtype(dtype)
+    if len(PUBLISHED) == 0:
+        atexit.register(releaseAll)
+    block = shared_memory.SharedMemory(create=True,
+                                       size=max(int(np.prod(shape))*dtype.itemsize,1))
+    PUBLISHED[block.name] = block
+
+    descriptor = (block.name,shape,dtype.str)
+    data = np.ndarray(shape,dtype=dtype,buffer=block.buf)
+    return descriptor,data
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def publishArray(data):
+    """
+    Function copies an array into a new shared memory block
+
+    Parameters
+    ----------
+    data : numpy array
+        array to share (masked values are not kept)
+
+    Returns
+    -------
+    descriptor : tuple
+        (name,shape,dtype) to pass to the workers (see attachArray)
+
+    Usage
+    -----
+    descriptor = publishArray(data)
+    """
+
+    ### Import modules
+    import numpy as np
+
+    data = np.ma.getdata(data)
+    descriptor,shared = createArray(data.shape,data.dtype)
+    shared[...] = data
+    del shared
+    print('Completed: published %s %s in shared memory (%s)' % (data.shape,
+                                                                data.dtype,
+                                                                descriptor[0]))
+    return descriptor
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def attachArray(descriptor):
+    """
+    Function attaches to an array published by another process (no copy).
+    The array is read-only so workers cannot change each other's data
+
+    Parameters
+    ----------
+    descriptor : tuple
+        (name,shape,dtype) from publishArray
+
+    Returns
+    -------
+    data : numpy array
+        read-only view of the shared memory
+
+    Usage
+    -----
+    data = attachArray(descriptor)
+    """
+
+    ### Import modules
+    import numpy as np
+    from multiprocessing import shared_memory
+
+    name,shape,dtype = descriptor
+    if name in PUBLISHED:
+        block = PUBLISHED[name]
+    elif name in ATTACHED:
+        block = ATTACHED[name]
+    else:
+        block = shared_memory.SharedMemory(name=name)
+        ### Only the publisher unlinks the block (Python < 3.13 also tracks
+        ### attached blocks and would unlink them when a worker exits)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(block._name,'shared_memory')
+        except (ImportError,AttributeError,KeyError):
+            pass
+        ATTACHED[name] = block
+
+    data = np.ndarray(shape,dtype=np.dtype(dtype),buffer=block.buf)
+    data.flags.writeable = False
+    return data
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def releaseArray(descriptor):
+    """
+    Function releases a shared array. The publisher frees the memory and a
+    worker only detaches from it
+
+    Parameters
+    ----------
+    descriptor : tuple
+        (name,shape,dtype) from publishArray
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    releaseArray(descriptor)
+    """
+
+    name = descriptor[0]
+    if name in ATTACHED:
+        ATTACHED.pop(name).close()
+    if name in PUBLISHED:
+        block = PUBLISHED.pop(name)
+        try:
+            block.close()
+        except BufferError:
+            print('Shared array %s is still in use (memory is freed at exit)!' % name)
+        block.unlink()
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def releaseAll():
+    """
+    Function releases every shared array of this process
+
+    Parameters
+    ----------
+    None
+
+    Returns
+    -------
+    None
+
+    Usage
+    -----
+    releaseAll()
+    """
+
+    for name in list(ATTACHED):
+        try:
+            ATTACHED.pop(name).close()
+        except BufferError:
+            pass
+    for name in list(PUBLISHED):
+        block = PUBLISHED.pop(name)
+        try:
+            block.close()
+        except BufferError:
+            pass
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+
+###############################################################################
+###############################################################################
+###############################################################################
+
+def publishFiles(variq,dataset,monthlychoice,scenario,lat_bounds=None,lon_bounds=None):
+    """
+    Function reads a data set with readFiles and publishes it
+
+    Parameters
+    ----------
+    variq : string
+        variable for analysis
+    dataset : string
+        name of data set for primary data
+    monthlychoice : string
+        time period of analysis
+    scenario : string
+        SSP119 or SSP245 or SSP370 or SSP585 or SSP534OS
+    lat_bounds : 2 floats or None
+        (latmin,latmax) for only returning a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) for only returning a region
+
+    Returns
+    -------
+    descriptor : tuple
+        (name,shape,dtype) of the data (see attachArray)
+    lat1 : 1d numpy array
+        latitudes
+    lon1 : 1d numpy array
+        longitudes
+
+    Usage
+    -----
+    descriptor,lat1,lon1 = publishFiles(variq,dataset,monthlychoice,scenario,
+                                        lat_bounds,lon_bounds)
+    """
+
+    ### Import modules
+    import calc_dataFunctions as df
+
+    data,lat1,lon1 = df.readFiles(variq,dataset,monthlychoice,scenario,
+                                  lat_bounds,lon_bounds)
+    descriptor = publishArray(data)
+    del data
+    return descriptor,lat1,lon1
+
+# ### Test functions - do not use!
+# import numpy as np
+# from concurrent.futures import ProcessPoolExecutor
+# import calc_SharedArrays as SA
+# def memberMean(descriptor,i):
+#     return np.nanmean(SA.attachArray(descriptor)[i])
+# descriptor,lat1,lon1 = SA.publishFiles('T2M','SPEAR_MED','annual','SSP585')
+# with ProcessPoolExecutor(max_workers=8) as executor:
+#     means = list(executor.map(memberMean,[descriptor]*30,range(30)))
+# SA.releaseArray(descriptor)
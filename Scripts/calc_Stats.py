@@ -167,13 +167,14 @@ def remove_ensemble_mean(data,ravel_modelens,ravelmodeltime,rm_standard_dev,numO
     
     ### Import modulates
     import numpy as np
+    import calc_ReadUtilities as RU
     
     ### Remove ensemble mean
     if data.ndim == 4:
         datameangoneq = data - np.nanmean(data,axis=0)
     elif data.ndim == 5:
         ensmeanmodel = np.nanmean(data,axis=1)
-        datameangoneq = np.empty((data.shape))
+        datameangoneq = np.empty((data.shape),dtype=RU.getComputeDtype())
         for i in range(data.shape[0]):
             datameangoneq[i,:,:,:,:] = data[i,:,:,:,:] - ensmeanmodel[i,:,:,:]
             print('Completed: Ensemble mean removed for model %s!' % (i+1))
@@ -361,11 +362,15 @@ def standardize_data(Xtrain,Xtest):
     
     ### Import modulates
     import numpy as np
+    import calc_ReadUtilities as RU
 
-    Xmean = np.mean(Xtrain,axis=0)
-    Xstd = np.std(Xtrain,axis=0)
-    Xtest = (Xtest - Xmean)/Xstd
-    Xtrain = (Xtrain - Xmean)/Xstd
+    ### Statistics are accumulated in float64 and the standardized data
+    ### keeps the input type unless a reader dtype is set (see setReadDtype)
+    dtype = RU.getComputeDtype(Xtrain)
+    Xmean = np.mean(Xtrain,axis=0,dtype=np.float64)
+    Xstd = np.std(Xtrain,axis=0,dtype=np.float64)
+    Xtest = ((Xtest - Xmean)/Xstd).astype(dtype,copy=False)
+    Xtrain = ((Xtrain - Xmean)/Xstd).astype(dtype,copy=False)
     
     stdVals = (Xmean,Xstd)
     stdVals = stdVals[:]
@@ -387,13 +392,17 @@ def standardize_dataVal(Xtrain,Xtest,Xval):
     
     ### Import modulates
     import numpy as np
+    import calc_ReadUtilities as RU
 
-    Xmean = np.mean(Xtrain,axis=0)
-    Xstd = np.std(Xtrain,axis=0)
+    ### Statistics are accumulated in float64 and the standardized data
+    ### keeps the input type unless a reader dtype is set (see setReadDtype)
+    dtype = RU.getComputeDtype(Xtrain)
+    Xmean = np.mean(Xtrain,axis=0,dtype=np.float64)
+    Xstd = np.std(Xtrain,axis=0,dtype=np.float64)
     
-    Xtest = (Xtest - Xmean)/Xstd
-    Xtrain = (Xtrain - Xmean)/Xstd
-    Xval = (Xval - Xmean)/Xstd
+    Xtest = ((Xtest - Xmean)/Xstd).astype(dtype,copy=False)
+    Xtrain = ((Xtrain - Xmean)/Xstd).astype(dtype,copy=False)
+    Xval = ((Xval - Xmean)/Xstd).astype(dtype,copy=False)
     
     stdVals = (Xmean,Xstd)
     stdVals = stdVals[:]
@@ -458,18 +467,19 @@ def rm_standard_dev(var,window,ravelmodeltime,numOfEns):
     """
     import pandas as pd
     import numpy as np
+    import calc_ReadUtilities as RU
     
     print('\n\n-----------STARTED: Rolling std!\n\n')
     
     
     if var.ndim == 3:
-        rollingstd = np.empty((var.shape))
+        rollingstd = np.empty((var.shape),dtype=RU.getComputeDtype())
         for i in range(var.shape[1]):
             for j in range(var.shape[2]):
                 series = pd.Series(var[:,i,j])
                 rollingstd[:,i,j] = series.rolling(window).std().to_numpy()
     elif var.ndim == 4:
-        rollingstd = np.empty((var.shape))
+        rollingstd = np.empty((var.shape),dtype=RU.getComputeDtype())
         for ens in range(var.shape[0]):
             for i in range(var.shape[2]):
                 for j in range(var.shape[3]):
@@ -477,7 +487,7 @@ def rm_standard_dev(var,window,ravelmodeltime,numOfEns):
                     rollingstd[ens,:,i,j] = series.rolling(window).std().to_numpy()
     elif var.ndim == 5:
         varn = np.reshape(var,(var.shape[0]*var.shape[1],var.shape[2],var.shape[3],var.shape[4]))
-        rollingstd = np.empty((varn.shape))
+        rollingstd = np.empty((varn.shape),dtype=RU.getComputeDtype())
         for ens in range(varn.shape[0]):
             for i in range(varn.shape[2]):
                 for j in range(varn.shape[3]):
@@ -503,10 +513,11 @@ def rm_variance_dev(var,window,ravelmodeltime):
     """
     import pandas as pd
     import numpy as np
+    import calc_ReadUtilities as RU
     
     print('\n\n-----------STARTED: Rolling vari!\n\n')
     
-    rollingvar = np.empty((var.shape))
+    rollingvar = np.empty((var.shape),dtype=RU.getComputeDtype())
     for ens in range(var.shape[0]):
         for i in range(var.shape[2]):
             for j in range(var.shape[3]):
@@ -531,6 +542,7 @@ def addNoiseTwinSingle(data,data_obs,integer,sizeOfTwin,random_segment_seed,mask
     """
     import numpy as np
     import sys
+    import calc_ReadUtilities as RU
     print('\n----------- USING EXPERIMENT CLASS #%s -----------' % sizeOfTwin)
     
     if sizeOfTwin == 1: 
@@ -773,7 +785,7 @@ def addNoiseTwinSingle(data,data_obs,integer,sizeOfTwin,random_segment_seed,mask
         newmodels = data.copy()
         testens = newmodels[6,:,:,:,:] # 6 for LENS
 
-        newmodeltest = np.empty(testens.shape)
+        newmodeltest = np.empty(testens.shape,dtype=RU.getComputeDtype())
         for sh in range(testens.shape[0]):
             ensnum = np.arange(data.shape[1])
             slices = np.random.choice(ensnum,size=data.shape[0],replace=False)
@@ -819,6 +831,7 @@ def smoothedEnsembles(data,lat_bounds,lon_bounds):
     ### Import modules
     import numpy as np
     import sys
+    import calc_ReadUtilities as RU
     print('\n------- Beginning of smoothing the ensembles per model -------')
        
     ### Save MM
@@ -826,7 +839,7 @@ def smoothedEnsembles(data,lat_bounds,lon_bounds):
     mmean = newmodels[-1,:,:,:,:] # 7 for MMmean
     otherens = newmodels[:7,:,:,:,:]
 
-    newmodeltest = np.empty(otherens.shape)
+    newmodeltest = np.empty(otherens.shape,dtype=RU.getComputeDtype())
     for modi in range(otherens.shape[0]):
         for sh in range(otherens.shape[1]):
             ensnum = np.arange(otherens.shape[1])
@@ -59,6 +59,7 @@ def calcDecJan(varx,vary,lat,lon,level,levsq):
     
     ### Import modules
     import numpy as np
+    import calc_ReadUtilities as RU
     
     ### Reshape for 3d variables
     if level == 'surface':    
@@ -69,8 +70,10 @@ def calcDecJan(varx,vary,lat,lon,level,levsq):
                                (int(vary.shape[0]*12),
                                 int(lat.shape[0]),int(lon.shape[0]))) 
                                
-        varx_dj = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]))
-        vary_dj = np.empty((vary.shape[0]-1,lat.shape[0],lon.shape[0]) )                 
+        varx_dj = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]),
+                           dtype=RU.getComputeDtype())
+        vary_dj = np.empty((vary.shape[0]-1,lat.shape[0],lon.shape[0]),
+                           dtype=RU.getComputeDtype())
         for i in range(0,varxravel.shape[0]-12,12):
             counter = 0
             if i >= 12:
@@ -93,9 +96,11 @@ def calcDecJan(varx,vary,lat,lon,level,levsq):
                                 int(lat.shape[0]),int(lon.shape[0]))) 
                                
         varx_dj = np.empty((int(varx.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))
+                            int(lat.shape[0]),int(lon.shape[0])),
+                           dtype=RU.getComputeDtype())
         vary_dj = np.empty((int(vary.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])) )                 
+                            int(lat.shape[0]),int(lon.shape[0])),
+                           dtype=RU.getComputeDtype())
         for i in range(0,varxravel.shape[0]-12,12):
             counter = 0
             if i >= 12:
@@ -152,6 +157,7 @@ def calcDecJanFeb(varx,lat,lon,level,levsq):
     
     ### Import modules
     import numpy as np
+    import calc_ReadUtilities as RU
     
     ### Reshape for 3d variables
     if level == 'surface':    
@@ -159,7 +165,8 @@ def calcDecJanFeb(varx,lat,lon,level,levsq):
                            (int(varx.shape[0]*12),
                             int(lat.shape[0]),int(lon.shape[0])))
                                
-        varx_djf = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]))                
+        varx_djf = np.empty((varx.shape[0]-1,lat.shape[0],lon.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(0,varxravel.shape[0]-12,12):
             counter = 0
             if i >= 12:
@@ -176,7 +183,8 @@ def calcDecJanFeb(varx,lat,lon,level,levsq):
                             int(lat.shape[0]),int(lon.shape[0])))
                                
         varx_djf = np.empty((int(varx.shape[0]-1),levsq,
-                            int(lat.shape[0]),int(lon.shape[0])))               
+                            int(lat.shape[0]),int(lon.shape[0])),
+                            dtype=RU.getComputeDtype())
         for i in range(0,varxravel.shape[0]-12,12):
             counter = 0
             if i >= 12:
@@ -323,11 +331,13 @@ def calc_weightedAve(var,lats):
     
     ### Import modules
     import numpy as np
+    import calc_ReadUtilities as RU
     import sys
     
     ### Calculate weighted average for various dimensional arrays
     if var.ndim == 6:
-        meanvar = np.empty((var.shape[0],var.shape[1],var.shape[2],var.shape[3]))
+        meanvar = np.empty((var.shape[0],var.shape[1],var.shape[2],var.shape[3]),
+                           dtype=RU.getComputeDtype())
         for mo in range(var.shape[0]):
             for ens in range(var.shape[1]):
                 for i in range(var.shape[2]):
@@ -336,11 +346,12 @@ def calc_weightedAve(var,lats):
                         mask = np.isfinite(varq) & np.isfinite(lats)
                         varmask = varq[mask]
                         areamask = np.cos(np.deg2rad(lats[mask]))
-                        meanvar[mo,ens,i,j] = np.nansum(varmask*areamask) \
-                                            /np.sum(areamask)  
+                        meanvar[mo,ens,i,j] = np.nansum(varmask*areamask,dtype=np.float64) \
+                                            /np.sum(areamask,dtype=np.float64)  
     
     elif var.ndim == 5:
-        meanvar = np.empty((var.shape[0],var.shape[1],var.shape[2]))
+        meanvar = np.empty((var.shape[0],var.shape[1],var.shape[2]),
+                           dtype=RU.getComputeDtype())
         for ens in range(var.shape[0]):
             for i in range(var.shape[1]):
                 for j in range(var.shape[2]):
@@ -348,31 +359,31 @@ def calc_weightedAve(var,lats):
                     mask = np.isfinite(varq) & np.isfinite(lats)
                     varmask = varq[mask]
                     areamask = np.cos(np.deg2rad(lats[mask]))
-                    meanvar[ens,i,j] = np.nansum(varmask*areamask) \
-                                        /np.sum(areamask)  
+                    meanvar[ens,i,j] = np.nansum(varmask*areamask,dtype=np.float64) \
+                                        /np.sum(areamask,dtype=np.float64)  
     elif var.ndim == 4:
-        meanvar = np.empty((var.shape[0],var.shape[1]))
+        meanvar = np.empty((var.shape[0],var.shape[1]),dtype=RU.getComputeDtype())
         for i in range(var.shape[0]):
             for j in range(var.shape[1]):
                 varq = var[i,j,:,:]
                 mask = np.isfinite(varq) & np.isfinite(lats)
                 varmask = varq[mask]
                 areamask = np.cos(np.deg2rad(lats[mask]))
-                meanvar[i,j] = np.nansum(varmask*areamask)/np.sum(areamask)
+                meanvar[i,j] = np.nansum(varmask*areamask,dtype=np.float64)/np.sum(areamask,dtype=np.float64)
     elif var.ndim == 3:
-        meanvar = np.empty((var.shape[0]))
+        meanvar = np.empty((var.shape[0]),dtype=RU.getComputeDtype())
         for i in range(var.shape[0]):
             varq = var[i,:,:]
             mask = np.isfinite(varq) & np.isfinite(lats)
             varmask = varq[mask]
             areamask = np.cos(np.deg2rad(lats[mask]))
-            meanvar[i] = np.nansum(varmask*areamask)/np.sum(areamask)
+            meanvar[i] = np.nansum(varmask*areamask,dtype=np.float64)/np.sum(areamask,dtype=np.float64)
     elif var.ndim == 2:
         varq = var[:,:]
         mask = np.isfinite(varq) & np.isfinite(lats)
         varmask = varq[mask]
         areamask = np.cos(np.deg2rad(lats[mask]))
-        meanvar = np.nansum(varmask*areamask)/np.sum(areamask)
+        meanvar = np.nansum(varmask*areamask,dtype=np.float64)/np.sum(areamask,dtype=np.float64)
     else:
         print(ValueError('Variable has the wrong dimensions!'))
         sys.exit()
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -49,7 +50,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count10 = data.variables['count10'][:,:len(years_LM42),:,:]
+count10 = CO.readStat(data,'count10')[:,:len(years_LM42),:,:]
 data.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -57,7 +58,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-count10_LM42 = data_LM42.variables['count10'][:,:,:,:]
+count10_LM42 = CO.readStat(data_LM42,'count10')
 data_LM42.close()
 
 ### Read in SPEAR_MED
@@ -67,7 +68,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count01 = data.variables['count01'][:,:len(years_LM42),:,:]
+count01 = CO.readStat(data,'count01')[:,:len(years_LM42),:,:]
 data.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -75,7 +76,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-count01_LM42 = data_LM42.variables['count01'][:,:,:,:]
+count01_LM42 = CO.readStat(data_LM42,'count01')
 data_LM42.close()
 
 ### Calculate ensemble means
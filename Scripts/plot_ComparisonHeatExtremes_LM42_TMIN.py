@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -49,7 +50,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count90 = data.variables['count90'][:,:len(years_LM42),:,:]
+count90 = CO.readStat(data,'count90')[:,:len(years_LM42),:,:]
 data.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -57,7 +58,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-count90_LM42 = data_LM42.variables['count90'][:,:,:,:]
+count90_LM42 = CO.readStat(data_LM42,'count90')
 data_LM42.close()
 
 ### Read in SPEAR_MED
@@ -67,7 +68,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count99 = data.variables['count99'][:,:len(years_LM42),:,:]
+count99 = CO.readStat(data,'count99')[:,:len(years_LM42),:,:]
 data.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -75,7 +76,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-count99_LM42 = data_LM42.variables['count99'][:,:,:,:]
+count99_LM42 = CO.readStat(data_LM42,'count99')
 data_LM42.close()
 
 ### Calculate ensemble means
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -81,7 +82,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count90 = data.variables[varcount][:,-86:,:,:]
+count90 = CO.readStat(data,varcount)[:,-86:,:,:]
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -89,7 +90,7 @@ directorydatahHEAT = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_osHEAT = directorydatahHEAT + name_osHEAT
 data_osHEAT = Dataset(filename_osHEAT)
-count90_osHEAT = data_osHEAT.variables[varcount][:,4:,:,:] # Need to start in 2015, not 2011
+count90_osHEAT = CO.readStat(data_osHEAT,varcount)[:,4:,:,:] # Need to start in 2015, not 2011
 latus = data_osHEAT.variables['lat'][:]
 lonus = data_osHEAT.variables['lon'][:]
 data_osHEAT.close()
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -70,7 +71,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-count90_os = data_os.variables['count90'][:,4:,:,:] # Need to start in 2015, not 2011
+count90_os = CO.readStat(data_os,'count90')[:,4:,:,:] # Need to start in 2015, not 2011
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -78,7 +79,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-count90_os10yeq = data_os10ye.variables['count90'][:]
+count90_os10yeq = CO.readStat(data_os10ye,'count90')
 lat1 = data_os10ye.variables['lat'][:]
 lon1 = data_os10ye.variables['lon'][:]
 data_os10ye.close()
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -176,7 +177,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count10 = data.variables[varcount][:]
+count10 = CO.readStat(data,varcount)
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -184,7 +185,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-count10_os = data_os.variables[varcount][:]
+count10_os = CO.readStat(data_os,varcount)
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -192,7 +193,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-count10_os10ye = data_os10ye.variables[varcount][:]
+count10_os10ye = CO.readStat(data_os10ye,varcount)
 data_os10ye.close()
 
 ### Epochs for +- years around selected GWL
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -130,7 +131,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count90 = data.variables[varcount][:]
+count90 = CO.readStat(data,varcount)
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -138,7 +139,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-count90_os = data_os.variables[varcount][:]
+count90_os = CO.readStat(data_os,varcount)
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv
@@ -146,7 +147,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osAMOC = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' + '.nc'
 filename_osAMOC = directorydatah + name_osAMOC
 data_osAMOC = Dataset(filename_osAMOC)
-count90_osAMOC = data_osAMOC.variables[varcount][:]
+count90_osAMOC = CO.readStat(data_osAMOC,varcount)
 data_osAMOC.close()
 
 ### Epochs for +- years around selected GWL
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -271,7 +272,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count90 = data.variables[varcount][:,-86:,:,:]
+count90 = CO.readStat(data,varcount)[:,-86:,:,:]
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -279,7 +280,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-count90_os = data_os.variables[varcount][:,4:,:,:]
+count90_os = CO.readStat(data_os,varcount)[:,4:,:,:]
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -287,7 +288,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-count90_os10ye_1 = data_os10ye.variables[varcount][:]
+count90_os10ye_1 = CO.readStat(data_os10ye,varcount)
 data_os10ye.close()
 
 count90_os10ye = np.append(count90_os[:,:count90_os.shape[1]-count90_os10ye_1.shape[1],:,:],count90_os10ye_1,axis=1)
@@ -7,6 +7,8 @@ Date      : 21 August 2024
 
 import matplotlib.pyplot as plt
 import calc_Utilities as UT
+import calc_Extremes as XT
+import calc_DailyExtract as DX
 import xarray as xr
 import numpy as np
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
@@ -15,7 +17,6 @@ import cmasher as cmr
 import os, glob
 import calc_Stats as dSS
 import sys
-from netCDF4 import Dataset
 
 import time
 startTime = time.time()
@@ -77,26 +78,15 @@ def readData(model,reg_name):
     elif reg_name == 'Globe':
         daysall = np.empty((ENS,years.shape[0],dayslength,360,576))
     for e in range(ENS):
-        data = Dataset(directorydata + 'June/June_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        lat = data.variables['lat'][:]
-        lon = data.variables['lon'][:]
-        june = data.variables['%s' % variq][:].reshape(len(years),len(junedays),lat.shape[0],lon.shape[0])
-        data.close()
-        
-        data2 = Dataset(directorydata + 'July/July_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        july = data2.variables['%s' % variq][:].reshape(len(years),len(julydays),lat.shape[0],lon.shape[0])
-        data2.close()
-
-        data3 = Dataset(directorydata + 'August/August_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-        august = data3.variables['%s' % variq][:].reshape(len(years),len(augustdays),lat.shape[0],lon.shape[0])
-        data3.close()        
+        lat,lon,summer = DX.readSummer(directorydata,vari,variq,reg_name,model,e+1,
+                                       len(years),[len(junedays),len(julydays),len(augustdays)])
 
         ### Convert units if needed
         if any([vari == 'T2M',vari == 'TMAX',vari == 'TMIN']):
-            daysall[e,:,:,:,:] = np.concatenate([june,july,august],axis=1) - 273.15 # K to C
+            daysall[e,:,:,:,:] = summer - 273.15 # K to C
             print('Completed: Changed units (K to C)!')
         else:
-            daysall[e,:,:,:,:] = np.concatenate([june,july,august],axis=1)
+            daysall[e,:,:,:,:] = summer
             
     ### Meshgrid and mask by CONUS
     lon2,lat2 = np.meshgrid(lon,lat)
@@ -143,9 +133,7 @@ def calc_heatExtremes(datamask,model,lat,lon):
         climdist = clim.reshape(ENS,len(baseline)*dayslength,lat.shape[0],lon.shape[0])
     
     ### Calculate heat extremes
-    tx90 = np.nanpercentile(climdist,90,axis=1)
-    tx95 = np.nanpercentile(climdist,95,axis=1)
-    tx99 = np.nanpercentile(climdist,99,axis=1)
+    tx90,tx95,tx99 = XT.calcPercentiles(climdist,[90,95,99])
     
     return tx90,tx95,tx99
 
@@ -123,7 +123,7 @@ def findNearestValueIndex(array,value):
 # data = Dataset(filename)
 # latus = data.variables['lat'][:]
 # lonus = data.variables['lon'][:]
-# freq90 = data.variables[heatvari][:]
+# freq90 = CO.readStat(data,heatvari)
 # data.close()
 
 # ### Read in SPEAR_MED_SSP245
@@ -131,7 +131,7 @@ def findNearestValueIndex(array,value):
 # nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 # filenameSSP245 = directorydatah + nameSSP245
 # dataSSP245 = Dataset(filenameSSP245)
-# freq90SSP245 = dataSSP245.variables[heatvari][:]
+# freq90SSP245 = CO.readStat(dataSSP245,heatvari)
 # data.close()
 
 # ### Read in SPEAR_MED_SSP534OS
@@ -139,7 +139,7 @@ def findNearestValueIndex(array,value):
 # name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 # filename_os = directorydatah + name_os
 # data_os = Dataset(filename_os)
-# freq90_os = data_os.variables[heatvari][:]
+# freq90_os = CO.readStat(data_os,heatvari)
 # data_os.close()
 
 # ### Read in SPEAR_MED_SSP534OS_10ye
@@ -147,7 +147,7 @@ def findNearestValueIndex(array,value):
 # name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 # filename_os10ye = directorydatah + name_os10ye
 # data_os10ye = Dataset(filename_os10ye)
-# freq90_os10ye = data_os10ye.variables[heatvari][:]
+# freq90_os10ye = CO.readStat(data_os10ye,heatvari)
 # data_os10ye.close()
 
 # ### Calculate spatial averages
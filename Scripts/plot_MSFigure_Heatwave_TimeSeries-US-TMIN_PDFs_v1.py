@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -99,7 +100,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-count90 = data.variables['count90'][:]
+count90 = CO.readStat(data,'count90')
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -107,7 +108,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-count90SSP245 = dataSSP245.variables['count90'][:,-len(years_ssp245):,:,:]
+count90SSP245 = CO.readStat(dataSSP245,'count90')[:,-len(years_ssp245):,:,:]
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -115,7 +116,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-count90_os = data_os.variables['count90'][:,-len(years_os):,:,:]
+count90_os = CO.readStat(data_os,'count90')[:,-len(years_os):,:,:]
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -123,7 +124,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-count90_os10ye = data_os10ye.variables['count90'][:]
+count90_os10ye = CO.readStat(data_os10ye,'count90')
 data_os10ye.close()
 
 ### Calculate spatial averages
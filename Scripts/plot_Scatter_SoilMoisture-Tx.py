@@ -123,7 +123,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # name_osHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 # filename_osHEAT = directorydatahHEAT + name_osHEAT
 # data_osHEAT = Dataset(filename_osHEAT)
-# count90_osHEAT = data_osHEAT.variables[varcount][:,4:,:,:] # Need to start in 2015, not 2011
+# count90_osHEAT = CO.readStat(data_osHEAT,varcount)[:,4:,:,:] # Need to start in 2015, not 2011
 # latus = data_osHEAT.variables['lat'][:]
 # lonus = data_osHEAT.variables['lon'][:]
 # data_osHEAT.close()
@@ -133,7 +133,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # name_os10yeHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 # filename_os10yeHEAT = directorydatahHEAT+ name_os10yeHEAT
 # data_os10yeHEAT = Dataset(filename_os10yeHEAT)
-# count90_os10yeqHEAT = data_os10yeHEAT.variables[varcount][:]
+# count90_os10yeqHEAT = CO.readStat(data_os10yeHEAT,varcount)
 # data_os10yeHEAT.close()
 
 # ### Meshgrid for the CONUS
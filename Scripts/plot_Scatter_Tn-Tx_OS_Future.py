@@ -62,14 +62,14 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # data = Dataset(filename)
 # latus = data.variables['lat'][:]
 # lonus = data.variables['lon'][:]
-# spear_am = data.variables[varcount][:,-86:,:,:]
+# spear_am = CO.readStat(data,varcount)[:,-86:,:,:]
 # data.close()
 
 # directorydatahHEAT = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 # name_osHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMIN' + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 # filename_osHEAT = directorydatahHEAT + name_osHEAT
 # data_osHEAT = Dataset(filename_osHEAT)
-# spear_aosm = data_osHEAT.variables[varcount][:,4:,:,:] # Need to start in 2015, not 2011
+# spear_aosm = CO.readStat(data_osHEAT,varcount)[:,4:,:,:] # Need to start in 2015, not 2011
 # latus = data_osHEAT.variables['lat'][:]
 # lonus = data_osHEAT.variables['lon'][:]
 # data_osHEAT.close()
@@ -79,7 +79,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # name_os10yeHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMIN' + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 # filename_os10yeHEAT = directorydatahHEAT+ name_os10yeHEAT
 # data_os10yeHEAT = Dataset(filename_os10yeHEAT)
-# spear_aosm_10yeq = data_os10yeHEAT.variables[varcount][:]
+# spear_aosm_10yeq = CO.readStat(data_os10yeHEAT,varcount)
 # data_os10yeHEAT.close()
 
 # ### Combine data
@@ -134,7 +134,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # data = Dataset(filename)
 # latus = data.variables['lat'][:]
 # lonus = data.variables['lon'][:]
-# count90 = data.variables[varcount][:,-86:,:,:]
+# count90 = CO.readStat(data,varcount)[:,-86:,:,:]
 # data.close()
 
 # ### Read in SPEAR_MED_SSP534OS
@@ -142,7 +142,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # name_osHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 # filename_osHEAT = directorydatahHEAT + name_osHEAT
 # data_osHEAT = Dataset(filename_osHEAT)
-# count90_osHEAT = data_osHEAT.variables[varcount][:,4:,:,:] # Need to start in 2015, not 2011
+# count90_osHEAT = CO.readStat(data_osHEAT,varcount)[:,4:,:,:] # Need to start in 2015, not 2011
 # latus = data_osHEAT.variables['lat'][:]
 # lonus = data_osHEAT.variables['lon'][:]
 # data_osHEAT.close()
@@ -152,7 +152,7 @@ def read_primary_dataset(variq,dataset,monthlychoice,scenario,lat_bounds,lon_bou
 # name_os10yeHEAT = 'HeatStats/HeatStats' + '_JJA_' + 'US' + '_' + 'TMAX' + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 # filename_os10yeHEAT = directorydatahHEAT+ name_os10yeHEAT
 # data_os10yeHEAT = Dataset(filename_os10yeHEAT)
-# count90_os10yeqHEAT = data_os10yeHEAT.variables[varcount][:]
+# count90_os10yeqHEAT = CO.readStat(data_os10yeHEAT,varcount)
 # data_os10yeHEAT.close()
 
 # ### Meshgrid for the CONUS
@@ -10,6 +10,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import palettable.cubehelix as cm
@@ -68,7 +69,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-spear_osm = data_os.variables[varcount][:]
+spear_osm = CO.readStat(data_os,varcount)
 lats = data_os.variables['lat'][:]
 lons = data_os.variables['lon'][:]
 data_os.close()
@@ -78,7 +79,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-spear_osm_10ye = data_os10ye.variables[varcount][:]
+spear_osm_10ye = CO.readStat(data_os10ye,varcount)
 data_os10ye.close()
 lon2,lat2 = np.meshgrid(lons,lats)
 
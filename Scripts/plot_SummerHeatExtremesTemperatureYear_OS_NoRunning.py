@@ -10,6 +10,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import palettable.cubehelix as cm
@@ -69,7 +70,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED' + '.nc'
 filename = directorydatah + name
 data = Dataset(filename)
-spear = data.variables[varcount][:]
+spear = CO.readStat(data,varcount)
 data.close()
 
 ### Select only 1921 to 2015
@@ -82,7 +83,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-spear_osm = data_os.variables[varcount][:]
+spear_osm = CO.readStat(data_os,varcount)
 lats = data_os.variables['lat'][:]
 lons = data_os.variables['lon'][:]
 data_os.close()
@@ -92,7 +93,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-spear_osm_10ye = data_os10ye.variables[varcount][:]
+spear_osm_10ye = CO.readStat(data_os10ye,varcount)
 data_os10ye.close()
 lon2,lat2 = np.meshgrid(lons,lats)
 
@@ -10,6 +10,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import palettable.cubehelix as cm
@@ -68,7 +69,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-spear_osm = data_os.variables[varcount][:]
+spear_osm = CO.readStat(data_os,varcount)
 lats = data_os.variables['lat'][:]
 lons = data_os.variables['lon'][:]
 data_os.close()
@@ -78,7 +79,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osAMOC = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv' + '.nc'
 filename_osAMOC = directorydatah + name_osAMOC
 data_osAMOC = Dataset(filename_osAMOC)
-spear_osm_AMOC = data_osAMOC.variables[varcount][:]
+spear_osm_AMOC = CO.readStat(data_osAMOC,varcount)
 data_osAMOC.close()
 lon2,lat2 = np.meshgrid(lons,lats)
 
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -128,7 +129,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables['freq90'][:]
+freq90 = CO.readStat(data,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -136,7 +137,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables['freq90'][:]
+freq90_os = CO.readStat(data_os,'freq90')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -144,7 +145,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables['freq90'][:]
+freq90_os10ye = CO.readStat(data_os10ye,'freq90')
 data_os10ye.close()
 
 ### Calculate spatial averages
@@ -228,7 +229,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq95 = data.variables['freq95'][:]
+freq95 = CO.readStat(data,'freq95')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -236,7 +237,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq95_os = data_os.variables['freq95'][:]
+freq95_os = CO.readStat(data_os,'freq95')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -244,7 +245,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq95_os10ye = data_os10ye.variables['freq95'][:]
+freq95_os10ye = CO.readStat(data_os10ye,'freq95')
 data_os10ye.close()
 
 ### Calculate spatial averages
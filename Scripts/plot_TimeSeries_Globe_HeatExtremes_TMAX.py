@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -130,7 +131,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables['freq90'][:]
+freq90 = CO.readStat(data,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -138,7 +139,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq90SSP245 = dataSSP245.variables['freq90'][:]
+freq90SSP245 = CO.readStat(dataSSP245,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -146,7 +147,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables['freq90'][:]
+freq90_os = CO.readStat(data_os,'freq90')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -154,7 +155,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables['freq90'][:]
+freq90_os10ye = CO.readStat(data_os10ye,'freq90')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_SSP534OS_STRONGAMOC_1pSv
@@ -162,7 +163,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osamoc= 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' + '.nc'
 filename_osamoc = directorydatah + name_osamoc
 data_osamoc = Dataset(filename_osamoc)
-freq90_osamoc = data_osamoc.variables['freq90'][:]
+freq90_osamoc = CO.readStat(data_osamoc,'freq90')
 data_osamoc.close()
 
 ### Calculate spatial averages
@@ -252,7 +253,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq95 = data.variables['freq95'][:]
+freq95 = CO.readStat(data,'freq95')
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -260,7 +261,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq95SSP245 = dataSSP245.variables['freq95'][:]
+freq95SSP245 = CO.readStat(dataSSP245,'freq95')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -268,7 +269,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq95_os = data_os.variables['freq95'][:]
+freq95_os = CO.readStat(data_os,'freq95')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -276,7 +277,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq95_os10ye = data_os10ye.variables['freq95'][:]
+freq95_os10ye = CO.readStat(data_os10ye,'freq95')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_SSP534OS_STRONGAMOC_1pSv
@@ -284,7 +285,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osamoc= 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' + '.nc'
 filename_osamoc = directorydatah + name_osamoc
 data_osamoc = Dataset(filename_osamoc)
-freq95_osamoc = data_osamoc.variables['freq95'][:]
+freq95_osamoc = CO.readStat(data_osamoc,'freq95')
 data_osamoc.close()
 
 ### Calculate spatial averages
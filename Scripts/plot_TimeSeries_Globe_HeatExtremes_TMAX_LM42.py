@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -131,7 +132,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables['freq90'][:]
+freq90 = CO.readStat(data,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -139,7 +140,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq90SSP245 = dataSSP245.variables['freq90'][:]
+freq90SSP245 = CO.readStat(dataSSP245,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -147,7 +148,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables['freq90'][:]
+freq90_os = CO.readStat(data_os,'freq90')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -155,7 +156,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables['freq90'][:]
+freq90_os10ye = CO.readStat(data_os10ye,'freq90')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -163,7 +164,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-freq90_LM42 = data_LM42.variables['freq90'][:]
+freq90_LM42 = CO.readStat(data_LM42,'freq90')
 data_LM42.close()
 
 ### Calculate spatial averages
@@ -254,7 +255,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq95 = data.variables['freq95'][:]
+freq95 = CO.readStat(data,'freq95')
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -262,7 +263,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq95SSP245 = dataSSP245.variables['freq95'][:]
+freq95SSP245 = CO.readStat(dataSSP245,'freq95')
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -270,7 +271,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq95_os = data_os.variables['freq95'][:]
+freq95_os = CO.readStat(data_os,'freq95')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -278,7 +279,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq95_os10ye = data_os10ye.variables['freq95'][:]
+freq95_os10ye = CO.readStat(data_os10ye,'freq95')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -286,7 +287,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-freq95_LM42 = data_LM42.variables['freq95'][:]
+freq95_LM42 = CO.readStat(data_LM42,'freq95')
 data_LM42.close()
 
 ### Calculate spatial averages
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -119,7 +120,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables[heatvari][:]
+freq90 = CO.readStat(data,heatvari)
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -127,7 +128,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq90SSP245 = dataSSP245.variables[heatvari][:,4:,:,:] # start in 2015
+freq90SSP245 = CO.readStat(dataSSP245,heatvari)[:,4:,:,:] # start in 2015
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -135,7 +136,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables[heatvari][:,4:,:,:] # start in 2015
+freq90_os = CO.readStat(data_os,heatvari)[:,4:,:,:] # start in 2015
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -143,7 +144,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables[heatvari][:]
+freq90_os10ye = CO.readStat(data_os10ye,heatvari)
 data_os10ye.close()
 
 ### Read in SPEAR_MED_SSP534OS_STRONGAMOC_1pSv
@@ -151,7 +152,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osamoc= 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' + '.nc'
 filename_osamoc = directorydatah + name_osamoc
 data_osamoc = Dataset(filename_osamoc)
-freq90_osamoc = data_osamoc.variables[heatvari][:]
+freq90_osamoc = CO.readStat(data_osamoc,heatvari)
 data_osamoc.close()
 
 ### Calculate spatial averages
@@ -241,7 +242,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables[heatvari][:]
+freq90 = CO.readStat(data,heatvari)
 data.close()
 
 ### Read in SPEAR_MED_SSP245
@@ -249,7 +250,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 nameSSP245 = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 filenameSSP245 = directorydatah + nameSSP245
 dataSSP245 = Dataset(filenameSSP245)
-freq90SSP245 = dataSSP245.variables[heatvari][:]
+freq90SSP245 = CO.readStat(dataSSP245,heatvari)
 data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -257,7 +258,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables[heatvari][:]
+freq90_os = CO.readStat(data_os,heatvari)
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -265,7 +266,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables[heatvari][:]
+freq90_os10ye = CO.readStat(data_os10ye,heatvari)
 data_os10ye.close()
 
 ### Read in SPEAR_MED_SSP534OS_STRONGAMOC_1pSv
@@ -273,7 +274,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_osamoc= 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_STRONGAMOC_p1Sv' + '.nc'
 filename_osamoc = directorydatah + name_osamoc
 data_osamoc = Dataset(filename_osamoc)
-freq90_osamoc = data_osamoc.variables[heatvari][:]
+freq90_osamoc = CO.readStat(data_osamoc,heatvari)
 data_osamoc.close()
 
 ### Calculate spatial averages
@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -129,7 +130,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq10 = data.variables['freq10'][:]
+freq10 = CO.readStat(data,'freq10')
 data.close()
 
 # ### Read in SPEAR_MED_SSP245
@@ -137,7 +138,7 @@ data.close()
 # nameSSP245 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 # filenameSSP245 = directorydatah + nameSSP245
 # dataSSP245 = Dataset(filenameSSP245)
-# freq10SSP245 = dataSSP245.variables['freq10'][:]
+# freq10SSP245 = CO.readStat(dataSSP245,'freq10')
 # data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -145,7 +146,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq10_os = data_os.variables['freq10'][:]
+freq10_os = CO.readStat(data_os,'freq10')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -153,7 +154,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq10_os10ye = data_os10ye.variables['freq10'][:]
+freq10_os10ye = CO.readStat(data_os10ye,'freq10')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -161,7 +162,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-freq10_LM42 = data_LM42.variables['freq10'][:]
+freq10_LM42 = CO.readStat(data_LM42,'freq10')
 data_LM42.close()
 
 ### Calculate spatial averages
@@ -252,7 +253,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq05 = data.variables['freq05'][:]
+freq05 = CO.readStat(data,'freq05')
 data.close()
 
 # ### Read in SPEAR_MED_SSP245
@@ -260,7 +261,7 @@ data.close()
 # nameSSP245 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP245' + '.nc'
 # filenameSSP245 = directorydatah + nameSSP245
 # dataSSP245 = Dataset(filenameSSP245)
-# freq05SSP245 = dataSSP245.variables['freq05'][:]
+# freq05SSP245 = CO.readStat(dataSSP245,'freq05')
 # data.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -268,7 +269,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq05_os = data_os.variables['freq05'][:]
+freq05_os = CO.readStat(data_os,'freq05')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -276,7 +277,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq05_os10ye = data_os10ye.variables['freq05'][:]
+freq05_os10ye = CO.readStat(data_os10ye,'freq05')
 data_os10ye.close()
 
 ### Read in SPEAR_MED_LM42p2_test
@@ -284,7 +285,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_LM42 = 'DryStats/DryStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_LM42p2_test' + '.nc'
 filename_LM42 = directorydatah + name_LM42
 data_LM42 = Dataset(filename_LM42)
-freq05_LM42 = data_LM42.variables['freq05'][:]
+freq05_LM42 = CO.readStat(data_LM42,'freq05')
 data_LM42.close()
 
 ### Calculate spatial averages
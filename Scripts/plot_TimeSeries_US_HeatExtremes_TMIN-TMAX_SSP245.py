@@ -9,6 +9,7 @@ from netCDF4 import Dataset
 import matplotlib.pyplot as plt
 from mpl_toolkits.basemap import Basemap, addcyclic, shiftgrid
 import numpy as np
+import calc_CompactOutput as CO
 import cmocean
 import cmasher as cmr
 import calc_Utilities as UT
@@ -73,7 +74,7 @@ filename = directorydatah + name
 data = Dataset(filename)
 latus = data.variables['lat'][:]
 lonus = data.variables['lon'][:]
-freq90 = data.variables['freq90'][:]
+freq90 = CO.readStat(data,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP245 - TMAX
@@ -83,7 +84,7 @@ filename_SSP245 = directorydatah + name
 data_SSP245 = Dataset(filename_SSP245)
 latus_SSP245 = data_SSP245.variables['lat'][:]
 lonus_SSP245 = data_SSP245.variables['lon'][:]
-freq90_SSP245 = data_SSP245.variables['freq90'][:]
+freq90_SSP245 = CO.readStat(data_SSP245,'freq90')
 data_SSP245.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -91,7 +92,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os = data_os.variables['freq90'][:]
+freq90_os = CO.readStat(data_os,'freq90')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -99,7 +100,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye = data_os10ye.variables['freq90'][:]
+freq90_os10ye = CO.readStat(data_os10ye,'freq90')
 data_os10ye.close()
 
 ### Calculate spatial averages
@@ -124,7 +125,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED' + '.nc'
 filename = directorydatah + name
 data = Dataset(filename)
-freq90_tmin = data.variables['freq90'][:]
+freq90_tmin = CO.readStat(data,'freq90')
 data.close()
 
 ### Read in SPEAR_MED_SSP245 - TMAX
@@ -134,7 +135,7 @@ filename_SSP245 = directorydatah + name
 data_SSP245 = Dataset(filename_SSP245)
 latus_SSP245 = data_SSP245.variables['lat'][:]
 lonus_SSP245 = data_SSP245.variables['lon'][:]
-freq90_SSP245_tmin = data_SSP245.variables['freq90'][:]
+freq90_SSP245_tmin = CO.readStat(data_SSP245,'freq90')
 data_SSP245.close()
 
 ### Read in SPEAR_MED_SSP534OS
@@ -142,7 +143,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS' + '.nc'
 filename_os = directorydatah + name_os
 data_os = Dataset(filename_os)
-freq90_os_tmin = data_os.variables['freq90'][:]
+freq90_os_tmin = CO.readStat(data_os,'freq90')
 data_os.close()
 
 ### Read in SPEAR_MED_SSP534OS_10ye
@@ -150,7 +151,7 @@ directorydatah = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 name_os10ye = 'HeatStats/HeatStats' + '_JJA_' + reg_name + '_' + variq + '_' + 'SPEAR_MED_SSP534OS_10ye' + '.nc'
 filename_os10ye = directorydatah + name_os10ye
 data_os10ye = Dataset(filename_os10ye)
-freq90_os10ye_tmin = data_os10ye.variables['freq90'][:]
+freq90_os10ye_tmin = CO.readStat(data_os10ye,'freq90')
 data_os10ye.close()
 
 ### Calculate spatial averages
@@ -6,10 +6,9 @@ Date      : 20 July 2023
 """
 
 import calc_Utilities as UT
-import xarray as xr
+import calc_DailyExtract as DX
 import numpy as np
 import cmocean
-import os, glob
 import calc_Stats as dSS
 import sys
 
@@ -23,6 +22,8 @@ parser.add_argument('--vari', help='variable name for processed data')
 parser.add_argument('--variq', help='variable name for raw SPEAR data')
 parser.add_argument('--reg_name', help='region of analysis')
 parser.add_argument('--model', help='model to read daily data from')
+parser.add_argument('--workers', type=int, default=1, help='number of members extracted at once')
+parser.add_argument('--cube', action='store_true', help='also gather the members into a tile-chunked cube')
 args=parser.parse_args()
 
 ### Parameters
@@ -30,6 +31,8 @@ vari = args.vari
 variq = args.variq
 reg_name = args.reg_name
 model = args.model
+workers = args.workers
+cube = args.cube
 
 # vari = 'q'
 # variq = 'q_ref'
@@ -72,38 +75,17 @@ directorydata = '/work/Zachary.Labe/Data/SPEAR/%s/daily/' % model
 dataoutput = '/work/Zachary.Labe/Research/DetectMitigate/DataExtremes/'
 directoryfigure = '/home/Zachary.Labe/Research/DetectMitigate/Figures/'
 
-for e in range(ENS):
-    glob_pattern = os.path.join(directorydata, '%s/raw/raw_%s/atmos_daily.*.%s.nc' % (vari,e+1,variq))
-    print('<<<<<STARTED: Read in ---> raw_%s/atmos_daily.*.%s.nc' % (e+1,variq))
-    
-    ### Read in data
-    ds = xr.open_mfdataset(glob_pattern,concat_dim="time",combine="nested",
-                            data_vars='minimal',coords='minimal',compat='override',
-                            parallel=True,chunks={'time':'6GB','latitude':1,'longitude':1},
-                            engine='netcdf4')
-    # ds = xr.open_mfdataset(glob_pattern,concat_dim="time",combine="nested", ### for LM42
-    #                         data_vars='minimal',coords='minimal',compat='override',
-    #                         parallel=True,engine='netcdf4')
-    lat1 = ds['lat'].to_numpy()
-    lon1 = ds['lon'].to_numpy()
-    
-    if reg_name != 'Globe':
-        us = ds.sel(lat=slice(lat_bounds[0],lat_bounds[1]),lon=slice(lon_bounds[0],lon_bounds[1]))
-        latus1 = us['lat'].to_numpy()
-        lonus1 = us['lon'].to_numpy()
-    else:
-        us = ds
-        latus1 = us['lat'].to_numpy()
-        lonus1 = us['lon'].to_numpy()
-        
-    ### Calculate months
-    jun = us.where(((ds['time.month'] == 6)),drop=True)
-    jul = us.where(((ds['time.month'] == 7)),drop=True)
-    aug = us.where(((ds['time.month'] == 8)),drop=True)
-    
-    jun.to_netcdf(dataoutput + 'June/June_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-    jul.to_netcdf(dataoutput + 'July/July_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
-    aug.to_netcdf(dataoutput + 'August/August_%s_%s_%s_ens%s.nc' % (vari,reg_name,model,str(e+1).zfill(2)))
+### Extract JJA from the raw files one member per process (members that
+### were already extracted are skipped, so a stopped job can be restarted)
+filenames = DX.extractMembers(directorydata,dataoutput,vari,variq,reg_name,model,
+                              range(1,ENS+1),sliceperiod='JJA',workers=workers)
+
+### Only on request, gather the members into a second copy as a cube with
+### chunks of all years and days for small lat/lon tiles, which the
+### Explore_*Extremes_OS scripts then read one tile at a time (see DX.iterTiles)
+if cube == True:
+    cubefile = DX.writeCube(dataoutput,vari,variq,reg_name,model,ENS,years.shape[0],
+                            [len(junedays),len(julydays),len(augustdays)])
     
 executionTime = (time.time() - startTime)
 print('Execution time in seconds: ' + str(executionTime))
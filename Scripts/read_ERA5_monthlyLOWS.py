@@ -58,6 +58,7 @@ def read_ERA5_monthlyLOWS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
     from netCDF4 import Dataset
     import warnings
     import calc_Utilities as UT
+    import calc_ERA5Store as ES
     import sys
     warnings.simplefilter(action='ignore', category=FutureWarning)
     warnings.simplefilter(action='ignore', category=RuntimeWarning)
@@ -73,15 +74,21 @@ def read_ERA5_monthlyLOWS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
         time = np.arange(1979,2021+1,1)
         mon = 12
         monthslice = sliceyear.shape[0]*mon
-        filename = 'ERA5_LOWS/%s_1979-2021.nc' % variq
-        data = Dataset(directory + filename,'r')
+        filename = directory + 'ERA5_LOWS/%s_1979-2021.nc' % variq
+        
+        ### Append-only store with the newest complete years (see calc_ERA5Store)
+        storefile = ES.getStoreFile(variq,'LOWS')
+        if storefile is not None:
+            filename = storefile
+            time = ES.getStoreYears(storefile)
+        data = Dataset(filename,'r')
         lat1 = data.variables['lat'][:]
         lon1 = data.variables['lon'][:]
         lev1 = level
-        var = data.variables['%s' % variq][:,:,:]
+        var = data.variables['%s' % variq][:time.shape[0]*mon,:,:]
         data.close()
             
-        print('Years of output =',sliceyear.min(),'to',sliceyear.max())
+        print('Years of output =',time.min(),'to',time.max())
         #######################################################################
         ### Reshape data into [year,month,lat,lon]
         datamon = np.reshape(var,(var.shape[0]//mon,mon,
@@ -93,15 +100,21 @@ def read_ERA5_monthlyLOWS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
         time = np.arange(1979,2021+1,1)
         mon = 12
         monthslice = sliceyear.shape[0]*mon
-        filename = 'ERA5_LOWS/%s_1979-2021.nc' % variq
-        data = Dataset(directory + filename,'r')
+        filename = directory + 'ERA5_LOWS/%s_1979-2021.nc' % variq
+        
+        ### Append-only store with the newest complete years (see calc_ERA5Store)
+        storefile = ES.getStoreFile(variq,'LOWS')
+        if storefile is not None:
+            filename = storefile
+            time = ES.getStoreYears(storefile)
+        data = Dataset(filename,'r')
         lat1 = data.variables['lat'][:]
         lon1 = data.variables['lon'][:]
         lev1 = data.variables['level'][:]
-        var = data.variables['%s' % variq][:,:,:,:]
+        var = data.variables['%s' % variq][:time.shape[0]*mon,:,:,:]
         data.close()
             
-        print('Years of output =',sliceyear.min(),'to',sliceyear.max())
+        print('Years of output =',time.min(),'to',time.max())
         #######################################################################
         ### Reshape data into [year,month,level,lat,lon]
         datamon = np.reshape(var,(var.shape[0]//mon,mon,lev1.shape[0],
@@ -58,6 +58,7 @@ def read_ERA5_monthlyMEDS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
     from netCDF4 import Dataset
     import warnings
     import calc_Utilities as UT
+    import calc_ERA5Store as ES
     import sys
     warnings.simplefilter(action='ignore', category=FutureWarning)
     warnings.simplefilter(action='ignore', category=RuntimeWarning)
@@ -68,13 +69,19 @@ def read_ERA5_monthlyMEDS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
         time = np.arange(1940,2022+1,1)
         mon = 12
         monthslice = sliceyear.shape[0]*mon
-        filename = 'ERA5_MEDS/%s_1940-2022.nc' % variq
-        data = Dataset(directory + filename,'r')
+        filename = directory + 'ERA5_MEDS/%s_1940-2022.nc' % variq
+        
+        ### Append-only store with the newest complete years (see calc_ERA5Store)
+        storefile = ES.getStoreFile(variq,'MEDS')
+        if storefile is not None:
+            filename = storefile
+            time = ES.getStoreYears(storefile)
+        data = Dataset(filename,'r')
         data.set_auto_mask(False) # weird fill values after regridding
         lat1 = data.variables['lat'][:]
         lon1 = data.variables['lon'][:]
         lev1 = level
-        var = data.variables['%s' % variq][:,:,:]
+        var = data.variables['%s' % variq][:time.shape[0]*mon,:,:]
         data.close()
             
         print('Years of output =',time.min(),'to',time.max())
@@ -89,12 +96,18 @@ def read_ERA5_monthlyMEDS(variq,directory,sliceperiod,sliceyear,sliceshape,addcl
         time = np.arange(1940,2022+1,1)
         mon = 12
         monthslice = sliceyear.shape[0]*mon
-        filename = 'ERA5_MEDS/%s_1940-2022.nc' % variq
-        data = Dataset(directory + filename,'r')
+        filename = directory + 'ERA5_MEDS/%s_1940-2022.nc' % variq
+        
+        ### Append-only store with the newest complete years (see calc_ERA5Store)
+        storefile = ES.getStoreFile(variq,'MEDS')
+        if storefile is not None:
+            filename = storefile
+            time = ES.getStoreYears(storefile)
+        data = Dataset(filename,'r')
         lat1 = data.variables['lat'][:]
         lon1 = data.variables['lon'][:]
         lev1 = data.variables['level'][:]
-        var = data.variables['%s' % variq][:,:,:,:]
+        var = data.variables['%s' % variq][:time.shape[0]*mon,:,:,:]
         data.close()
             
         print('Years of output =',time.min(),'to',time.max())
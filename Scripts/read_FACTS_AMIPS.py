@@ -55,6 +55,7 @@ def read_FACTS_Experi(scenario,model,vari,slicemonth,sliceshape,slicenan,level):
     import numpy as np
     from netCDF4 import Dataset
     import calc_Utilities as UT
+    import calc_Catalog as CG
     import sys
 
     ###########################################################################
@@ -140,6 +141,15 @@ def read_FACTS_Experi(scenario,model,vari,slicemonth,sliceshape,slicenan,level):
     ###########################################################################
     ### Read in data
     if level == 'surface':
+        ### Check all members against the catalog first (see calc_Catalog)
+        if CG.CATALOGFILE is not None:
+            if scenario == 'spear':
+                filenames = [directory + '%s_%02d_%s-%s.nc' % (vari,ensmember,yrmin,yrmax)
+                             for ensmember in ens]
+            else:
+                filenames = [directory + '%s/%s_%02d_%s-%s.nc' % (model,vari,ensmember,yrmin,yrmax)
+                             for ensmember in ens]
+            CG.checkFiles(filenames,vari,time.shape[0]*12,pad=True)
         membersvar = []
         for i,ensmember in enumerate(ens):
             if scenario == 'spear':
@@ -179,6 +189,15 @@ def read_FACTS_Experi(scenario,model,vari,slicemonth,sliceshape,slicenan,level):
             numOfEns = 10
             ens = np.arange(1,numOfEns+1,1)
             print('\nCHANGED NUMBER OF ENSEMBLES DUE TO VERTICAL LEVELS!!!\n')
+        ### Check all members against the catalog first (see calc_Catalog)
+        if CG.CATALOGFILE is not None:
+            if scenario == 'spear':
+                filenames = [directory + '%s_%02d_%s-%s.nc' % (vari,ensmember,yrmin,yrmax)
+                             for ensmember in ens]
+            else:
+                filenames = [directory + '%s/%s_%02d_%s-%s.nc' % (model,vari,ensmember,yrmin,yrmax)
+                             for ensmember in ens]
+            CG.checkFiles(filenames,vari,time.shape[0]*12,pad=True)
         membersvar = []
         for i,ensmember in enumerate(ens):
             if scenario == 'spear':
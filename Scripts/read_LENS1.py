@@ -53,6 +53,7 @@ def read_LENS1(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
     import numpy as np
     from netCDF4 import Dataset
     import calc_Utilities as UT
+    import calc_ReadUtilities as RU
     import sys
 
     ###########################################################################
@@ -77,7 +78,8 @@ def read_LENS1(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
         membersvar.append(var)
         del var
         
-    ensvalue = np.reshape(np.asarray(membersvar),(len(ens),time.shape[0],mon,
+    membersvar = np.asarray(membersvar,dtype=RU.getComputeDtype(membersvar[0]))
+    ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],mon,
                                     lat1.shape[0],lon1.shape[0]))
     del membersvar
     print('Completed: read all LENS1 Members!\n')
@@ -95,7 +97,8 @@ def read_LENS1(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)
@@ -12,7 +12,7 @@ Usage
     [1] read_LENS2_cmip6bb(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper)
 """
 
-def read_LENS2_cmip6bb(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
+def read_LENS2_cmip6bb(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper,lat_bounds=None,lon_bounds=None,members=None):
     """
     Function reads monthly data from LENS2_cmip6bb
 
@@ -32,6 +32,12 @@ def read_LENS2_cmip6bb(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,t
         integer
     timeper : time period of analysis
         string
+    lat_bounds : 2 floats or None
+        (latmin,latmax) to read only a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) to read only a region (lonmin > lonmax wraps 0E)
+    members : list of integers or None
+        ensemble members to read (1 = first) and None for 1 to numOfEns
 
     Returns
     -------
@@ -51,198 +57,43 @@ def read_LENS2_cmip6bb(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,t
 
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
-    import calc_Utilities as UT
+    import calc_ReadUtilities as RU
     import sys
 
     ###########################################################################
     ### Parameters
     time = np.arange(1850,2100+1,1)
-    mon = 12
-    ens = np.arange(1,numOfEns+1,1)
+    if members is None:
+        ens = np.arange(1,numOfEns+1,1)
+    else:
+        ens = np.asarray(members)
+    months = RU.getMonthIndices(sliceperiod)
 
     ###########################################################################
     ### Read in data
-    membersvar = []
-    for i,ensmember in enumerate(ens):
-        filename1 = directory + 'LENS2_cmip6bb/monthly/%s/%s_%03d_1850-2100.nc' % (vari,vari,
-                                                                                   ensmember)
-        data1 = Dataset(filename1,'r')
-        lat1 = data1.variables['lat'][:]
-        lon1 = data1.variables['lon'][:]
-        var = data1.variables['%s' % vari][:,:,:]
-        data1.close()
-
-        print('Completed: read *LENS2_cmip6bb historical* Ensemble Member --%s-- for %s' % (ensmember,vari))
-        membersvar.append(var)
-        del var
+    filenames1 = [directory + 'LENS2_cmip6bb/monthly/%s/%s_%03d_1850-2100.nc' % (vari,vari,ensmember)
+                  for ensmember in ens]
+    lat1,lon1,membersvar = RU.readMembers(filenames1,vari,slice(None),
+                                          lat_bounds,lon_bounds,months=months)
         
-    ensvalue = np.reshape(np.asarray(membersvar),(len(ens),time.shape[0],mon,
+    ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],len(months),
                                     lat1.shape[0],lon1.shape[0]))
     del membersvar
     print('Completed: read all LENS2_cmip6bb Members!\n')
 
-    ###########################################################################
-    ### Slice over months (currently = [ens,yr,mn,lat,l10on])
-    ### Shape of output array
-    if sliceperiod == 'annual':
-        ensvalue = np.nanmean(ensvalue,axis=2)
-        if sliceshape == 1:
-            ensshape = ensvalue.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = ensvalue
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: ANNUAL MEAN!')
-    elif sliceperiod == 'DJF':
-        ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
-        for i in range(ensvalue.shape[0]):
-            ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
-                                                 lat1,lon1,'surface',1)
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: DJF MEAN!')
-    elif sliceperiod == 'MAM':
-        enstime = np.nanmean(ensvalue[:,:,2:5,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: MAM MEAN!')
-    elif sliceperiod == 'JJA':
-        enstime = np.nanmean(ensvalue[:,:,5:8,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JJA MEAN!')
-    elif sliceperiod == 'SON':
-        enstime = np.nanmean(ensvalue[:,:,8:11,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: SON MEAN!')
-    elif sliceperiod == 'JFM':
-        enstime = np.nanmean(ensvalue[:,:,0:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JFM MEAN!')
-    elif sliceperiod == 'FMA':
-        enstime = np.nanmean(ensvalue[:,:,1:4,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: FMA MEAN!')        
-    elif sliceperiod == 'FM':
-        enstime = np.nanmean(ensvalue[:,:,1:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: FM MEAN!')
-    elif sliceperiod == 'AMJ':
-        enstime = np.nanmean(ensvalue[:,:,3:6,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: AMJ MEAN!')
-    elif sliceperiod == 'JAS':
-        enstime = np.nanmean(ensvalue[:,:,6:9,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JAS MEAN!')
-    elif sliceperiod == 'OND':
-        enstime = np.nanmean(ensvalue[:,:,9:,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: OND MEAN!')
-    elif sliceperiod == 'January':
-        enstime = np.nanmean(ensvalue[:,:,0:1,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: January MEAN!')
-    elif sliceperiod == 'February':
-        enstime = np.nanmean(ensvalue[:,:,1:2,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: February MEAN!')
-    elif sliceperiod == 'March':
-        enstime = np.nanmean(ensvalue[:,:,2:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: March MEAN!')
-    elif sliceperiod == 'April':
-        enstime = np.nanmean(ensvalue[:,:,3:4,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: April MEAN!')
-    elif sliceperiod == 'May':
-        enstime = np.nanmean(ensvalue[:,:,4:5,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: May MEAN!')
-    elif sliceperiod == 'none':
-        if sliceshape == 1:
-            ensshape = ensvalue.ravel()
-        elif sliceshape == 4:
-            ensshape = np.reshape(ensvalue,(ensvalue.shape[0],ensvalue.shape[1]*ensvalue.shape[2],
-                                             ensvalue.shape[3],ensvalue.shape[4]))
-        elif any([sliceshape == 5,sliceshape == 6]):
-            ensshape = ensvalue
-        print('Shape of output =', ensshape.shape, [[ensshape.ndim]])
-        print('Completed: ALL RAVELED MONTHS!')
-    else:
-        print(ValueError('WRONG MONTHS SELECTED FOR WHAT IS AVAILABLE!!!'))
-        sys.exit()
-
-    ###########################################################################
-    ### Change missing values
-    if slicenan == 'nan':
-        ensshape[np.where(np.isnan(ensshape))] = np.nan
-        ensshape[np.where(ensshape < -999)] = np.nan 
-        print('Completed: missing values are =',slicenan)
-    else:
-        ensshape[np.where(np.isnan(ensshape))] = slicenan
-        ensshape[np.where(ensshape < -999)] = slicenan
-
     ###########################################################################
     ### Change units
+    units = None
     if any([vari=='T2M',vari=='SST',vari=='TMAX',vari=='TMIN']):
-        ensshape = ensshape - 273.15 # K to C
+        units = ('-',273.15) # K to C
         print('Completed: Changed units (K to C)!')
-    
+
+    ###########################################################################
+    ### Average over the months that were read (currently = [ens,yr,mn,lat,lon]),
+    ### change missing values and change units in one pass over each member
+    ensshape = RU.ingestMembers(ensvalue,sliceperiod,sliceshape,slicenan,
+                                [('<',-999)],units)
+
     ###########################################################################
     ### Select years of analysis (1850-2100)
     if timeper == 'all':
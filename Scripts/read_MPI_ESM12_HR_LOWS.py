@@ -51,7 +51,7 @@ def read_MPI_ESM12_HR_LOWS(directory,vari,sliceperiod,sliceshape,slicenan,numOfE
 
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
+    import calc_ReadUtilities as RU
     import calc_Utilities as UT
     import sys
 
@@ -63,21 +63,11 @@ def read_MPI_ESM12_HR_LOWS(directory,vari,sliceperiod,sliceshape,slicenan,numOfE
 
     ###########################################################################
     ### Read in data
-    membersvar = []
-    for i,ensmember in enumerate(ens):
-        filename1 = directory + 'MPI_ESM12_HR_LOWS/monthly/%s/%s_%03d_1850-2100.nc' % (vari,vari,
-                                                          ensmember)
-        data1 = Dataset(filename1,'r')
-        lat1 = data1.variables['lat'][:]
-        lon1 = data1.variables['lon'][:]
-        var = data1.variables['%s' % vari][:,:,:]
-        data1.close()
-
-        print('Completed: read *MPI_ESM12_HR_LOWS historical* Ensemble Member --%s-- for %s' % (ensmember,vari))
-        membersvar.append(var)
-        del var
+    filenames1 = [directory + 'MPI_ESM12_HR_LOWS/monthly/%s/%s_%03d_1850-2100.nc' % (vari,vari,ensmember)
+                  for ensmember in ens]
+    lat1,lon1,membersvar = RU.readMembers(filenames1,vari,slice(None),None,None)
         
-    ensvalue = np.reshape(np.asarray(membersvar),(len(ens),time.shape[0],mon,
+    ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],mon,
                                     lat1.shape[0],lon1.shape[0]))
     del membersvar
     print('Completed: read all MPI_ESM12_HR_LOWS Members!\n')
@@ -95,7 +85,8 @@ def read_MPI_ESM12_HR_LOWS(directory,vari,sliceperiod,sliceshape,slicenan,numOfE
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)
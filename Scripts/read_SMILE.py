@@ -14,7 +14,7 @@ Usage
                   slicenan,takeEnsMean)
 """
 
-def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addclimo,slicenan,takeEnsMean):
+def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addclimo,slicenan,takeEnsMean,lat_bounds=None,lon_bounds=None):
     """
     Function reads monthly data from the MMLEA
     
@@ -38,6 +38,10 @@ def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addcli
         Set missing values
     takeEnsMean : binary
         whether to take ensemble mean
+    lat_bounds : 2 floats or None
+        (latmin,latmax) to read only a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) to read only a region (lonmin > lonmax wraps 0E)
         
     Returns
     -------
@@ -60,9 +64,9 @@ def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addcli
     
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
     import warnings
     import calc_Utilities as UT
+    import calc_ReadUtilities as RU
     warnings.simplefilter(action='ignore', category=FutureWarning)
     warnings.simplefilter(action='ignore', category=RuntimeWarning)
     
@@ -110,19 +114,11 @@ def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addcli
     
     ###########################################################################
     ### Read in data
-    membersvar = []
-    for i,ensmember in enumerate(ens):
-        filename = directory + '%s/monthly/%s_%s_%s.nc' % (simulation,vari,ensmember,timeslice)                                                          
-        data = Dataset(filename,'r')
-        lat1 = data.variables['latitude'][:]
-        lon1 = data.variables['longitude'][:]
-        var = data.variables['%s' % vari][:,:,:]
-        data.close()
-        
-        print('Completed: read ensemble --%s for %s for %s--' % (simulation,ensmember,vari))
-        membersvar.append(var)
-        del var
-    membersvar = np.asarray(membersvar)
+    filenames = [directory + '%s/monthly/%s_%s_%s.nc' % (simulation,vari,ensmember,timeslice)
+                 for ensmember in ens]
+    lat1,lon1,membersvar = RU.readMembers(filenames,vari,slice(None),
+                                          lat_bounds,lon_bounds,
+                                          latname='latitude',lonname='longitude')
     ensvar = np.reshape(membersvar,(len(ens),time.shape[0],mon,
                                     lat1.shape[0],lon1.shape[0]))
     del membersvar
@@ -159,7 +155,8 @@ def read_SMILE(directory,simulation,vari,sliceperiod,slicebase,sliceshape,addcli
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)
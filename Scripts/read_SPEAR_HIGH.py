@@ -53,6 +53,7 @@ def read_SPEAR_HIGH(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,time
     import numpy as np
     from netCDF4 import Dataset
     import calc_Utilities as UT
+    import calc_ReadUtilities as RU
     import sys
 
     ###########################################################################
@@ -92,8 +93,8 @@ def read_SPEAR_HIGH(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,time
         del var2
         
     ### Append both time periods together
-    membersvar1 = np.asarray(membersvar1)
-    membersvar2 = np.asarray(membersvar2)
+    membersvar1 = np.asarray(membersvar1,dtype=RU.getComputeDtype(membersvar1[0]))
+    membersvar2 = np.asarray(membersvar2,dtype=RU.getComputeDtype(membersvar2[0]))
     membersvar = np.append(membersvar1,membersvar2,axis=1)
     ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],mon,
                                     lat1.shape[0],lon1.shape[0]))
@@ -115,7 +116,8 @@ def read_SPEAR_HIGH(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,time
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)
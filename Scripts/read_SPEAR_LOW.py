@@ -51,7 +51,7 @@ def read_SPEAR_LOW(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timep
 
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
+    import calc_ReadUtilities as RU
     import calc_Utilities as UT
     import sys
 
@@ -66,43 +66,24 @@ def read_SPEAR_LOW(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timep
 
     ###########################################################################
     ### Read in data
-    membersvar1 = []
-    for i,ensmember in enumerate(ens):
-        filename1 = directory + '%s/%s_%02d_1851-2010.nc' % (vari,vari,
-                                                          ensmember)
-        data1 = Dataset(filename1,'r')
-        lat1 = data1.variables['lat'][:]
-        lon1 = data1.variables['lon'][:]
-        var1 = data1.variables['%s' % vari][-timesat1.shape[0]*mon:,:,:]
-        data1.close()
+    filenames1 = [directory + '%s/%s_%02d_1851-2010.nc' % (vari,vari,ensmember)
+                  for ensmember in ens]
+    filenames2 = [directory + '%s/%s_%02d_2011-2100.nc' % (vari,vari,ensmember)
+                  for ensmember in ens]
 
-        print('Completed: read *SPEAR_LOW historical* Ensemble Member --%s--' % ensmember)
-        membersvar1.append(var1)
-        del var1
+    ### Both time periods are read straight into one output array
+    lat1,lon1,ensvalue = RU.emptyMembers(filenames1[0],vari,None,None,
+                                         (len(ens),time.shape[0],mon))
+    membersvar = np.reshape(ensvalue,(len(ens),time.shape[0]*mon,
+                                      lat1.shape[0],lon1.shape[0]))
+    RU.readMembers(filenames1,vari,slice(-timesat1.shape[0]*mon,None),None,None,
+                   out=membersvar[:,:timesat1.shape[0]*mon])
+    print('Completed: read *SPEAR_LOW historical* Ensemble Members!')
 
-    membersvar2 = []
-    for i,ensmember in enumerate(ens):
-        filename2 = directory + '%s/%s_%02d_2011-2100.nc' % (vari,vari,
-                                                          ensmember)
-        data2 = Dataset(filename2,'r')
-        lat1 = data2.variables['lat'][:]
-        lon1 = data2.variables['lon'][:]
-        var2 = data2.variables['%s' % vari][:timesat2.shape[0]*mon,:,:]
-        data2.close()
-
-        print('Completed: read *SPEAR_LOW SSP585* Ensemble Member --%s--' % ensmember)
-        membersvar2.append(var2)
-        del var2
-        
-    ### Append both time periods together
-    membersvar1 = np.asarray(membersvar1)
-    membersvar2 = np.asarray(membersvar2)
-    membersvar = np.append(membersvar1,membersvar2,axis=1)
-    ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],mon,
-                                    lat1.shape[0],lon1.shape[0]))
+    RU.readMembers(filenames2,vari,slice(None,timesat2.shape[0]*mon),None,None,
+                   out=membersvar[:,timesat1.shape[0]*mon:])
+    print('Completed: read *SPEAR_LOW SSP585* Ensemble Members!')
     del membersvar
-    del membersvar1
-    del membersvar2
     print('Completed: read all SPEAR_LOW Members!\n')
 
     ###########################################################################
@@ -118,7 +99,8 @@ def read_SPEAR_LOW(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timep
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)
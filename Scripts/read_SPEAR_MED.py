@@ -12,7 +12,7 @@ Usage
     [1] read_SPEAR_MED(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper)
 """
 
-def read_SPEAR_MED(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
+def read_SPEAR_MED(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper,lat_bounds=None,lon_bounds=None,members=None):
     """
     Function reads monthly data from SPEAR_MED
 
@@ -32,6 +32,12 @@ def read_SPEAR_MED(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timep
         integer
     timeper : time period of analysis
         string
+    lat_bounds : 2 floats or None
+        (latmin,latmax) to read only a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) to read only a region (lonmin > lonmax wraps 0E)
+    members : list of integers or None
+        ensemble members to read (1 = first) and None for 1 to numOfEns
 
     Returns
     -------
@@ -51,290 +57,84 @@ def read_SPEAR_MED(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timep
 
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
-    import calc_Utilities as UT
+    import calc_ReadUtilities as RU
+    import calc_SPEARStore as ST
+    import calc_HistoricalCache as HC
     import sys
 
     ###########################################################################
     ### Parameters
     time = np.arange(1921,2100+1,1)
     mon = 12
-    ens = np.arange(1,numOfEns+1,1)
+    if members is None:
+        ens = np.arange(1,numOfEns+1,1)
+    else:
+        ens = np.asarray(members)
+    months = RU.getMonthIndices(sliceperiod)
     
     timesat1 = np.arange(1921,2010+1,1)
     timesat2 = np.arange(2011,2100+1,1)
 
     ###########################################################################
     ### Read in data
-    membersvar1 = []
-    for i,ensmember in enumerate(ens):
-        filename1 = directory + '%s/%s_%02d_1921-2010.nc' % (vari,vari,
-                                                          ensmember)
-        data1 = Dataset(filename1,'r')
-        lat1 = data1.variables['lat'][:]
-        lon1 = data1.variables['lon'][:]
-        var1 = data1.variables['%s' % vari][-timesat1.shape[0]*mon:,:,:]
-        data1.close()
-
-        print('Completed: read *SPEAR_MED historical* Ensemble Member --%s--' % ensmember)
-        membersvar1.append(var1)
-        del var1
-
-    membersvar2 = []
-    for i,ensmember in enumerate(ens):
-        filename2 = directory + '%s/%s_%02d_2011-2100.nc' % (vari,vari,
-                                                          ensmember)
-        data2 = Dataset(filename2,'r')
-        lat1 = data2.variables['lat'][:]
-        lon1 = data2.variables['lon'][:]
-        var2 = data2.variables['%s' % vari][:timesat2.shape[0]*mon,:,:]
-        data2.close()
-
-        print('Completed: read *SPEAR_MED SSP585* Ensemble Member --%s--' % ensmember)
-        membersvar2.append(var2)
-        del var2
-        
-    ### Append both time periods together
-    membersvar1 = np.asarray(membersvar1)
-    membersvar2 = np.asarray(membersvar2)
-    membersvar = np.append(membersvar1,membersvar2,axis=1)
-    ensvalue = np.reshape(membersvar,(len(ens),time.shape[0],mon,
-                                    lat1.shape[0],lon1.shape[0]))
-    del membersvar
-    del membersvar1
-    del membersvar2
-    print('Completed: read all SPEAR_MED Members!\n')
-
-    ###########################################################################
-    ### Slice over months (currently = [ens,yr,mn,lat,l10on])
-    ### Shape of output array
-    if sliceperiod == 'annual':
-        ensvalue = np.nanmean(ensvalue,axis=2)
-        if sliceshape == 1:
-            ensshape = ensvalue.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = ensvalue
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: ANNUAL MEAN!')
-    elif sliceperiod == 'DJF':
-        ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
-        for i in range(ensvalue.shape[0]):
-            ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
-                                                 lat1,lon1,'surface',1)
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: DJF MEAN!')
-    elif sliceperiod == 'MAM':
-        enstime = np.nanmean(ensvalue[:,:,2:5,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: MAM MEAN!')
-    elif sliceperiod == 'JJA':
-        enstime = np.nanmean(ensvalue[:,:,5:8,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JJA MEAN!')
-    elif sliceperiod == 'SON':
-        enstime = np.nanmean(ensvalue[:,:,8:11,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: SON MEAN!')
-    elif sliceperiod == 'JFM':
-        enstime = np.nanmean(ensvalue[:,:,0:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JFM MEAN!')
-    elif sliceperiod == 'FMA':
-        enstime = np.nanmean(ensvalue[:,:,1:4,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: FMA MEAN!')        
-    elif sliceperiod == 'FM':
-        enstime = np.nanmean(ensvalue[:,:,1:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: FM MEAN!')
-    elif sliceperiod == 'AMJ':
-        enstime = np.nanmean(ensvalue[:,:,3:6,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: AMJ MEAN!')
-    elif sliceperiod == 'JAS':
-        enstime = np.nanmean(ensvalue[:,:,6:9,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: JAS MEAN!')
-    elif sliceperiod == 'OND':
-        enstime = np.nanmean(ensvalue[:,:,9:,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: OND MEAN!')
-    elif sliceperiod == 'January':
-        enstime = np.nanmean(ensvalue[:,:,0:1,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: January MEAN!')
-    elif sliceperiod == 'February':
-        enstime = np.nanmean(ensvalue[:,:,1:2,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: February MEAN!')
-    elif sliceperiod == 'March':
-        enstime = np.nanmean(ensvalue[:,:,2:3,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: March MEAN!')
-    elif sliceperiod == 'April':
-        enstime = np.nanmean(ensvalue[:,:,3:4,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: April MEAN!')
-    elif sliceperiod == 'May':
-        enstime = np.nanmean(ensvalue[:,:,4:5,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: May MEAN!')
-    elif sliceperiod == 'June':
-        enstime = np.nanmean(ensvalue[:,:,5:6,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: June MEAN!')
-    elif sliceperiod == 'July':
-        enstime = np.nanmean(ensvalue[:,:,6:7,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: July MEAN!')
-    elif sliceperiod == 'August':
-        enstime = np.nanmean(ensvalue[:,:,7:8,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: August MEAN!')
-    elif sliceperiod == 'September':
-        enstime = np.nanmean(ensvalue[:,:,8:9,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: September MEAN!')
-    elif sliceperiod == 'October':
-        enstime = np.nanmean(ensvalue[:,:,9:10,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: October MEAN!')
-    elif sliceperiod == 'November':
-        enstime = np.nanmean(ensvalue[:,:,10:11,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: November MEAN!')
-    elif sliceperiod == 'December':
-        enstime = np.nanmean(ensvalue[:,:,11:12,:,:],axis=2)
-        if sliceshape == 1:
-            ensshape = enstime.ravel()
-        elif any([sliceshape == 4,sliceshape == 5]):
-            ensshape = enstime
-        print('Shape of output = ', ensshape.shape,[[ensshape.ndim]])
-        print('Completed: December MEAN!')
-    elif sliceperiod == 'none':
-        if sliceshape == 1:
-            ensshape = ensvalue.ravel()
-        elif sliceshape == 4:
-            ensshape = np.reshape(ensvalue,(ensvalue.shape[0],ensvalue.shape[1]*ensvalue.shape[2],
-                                             ensvalue.shape[3],ensvalue.shape[4]))
-        elif any([sliceshape == 5,sliceshape == 6]):
-            ensshape = ensvalue
-        print('Shape of output =', ensshape.shape, [[ensshape.ndim]])
-        print('Completed: ALL RAVELED MONTHS!')
-    else:
-        print(ValueError('WRONG MONTHS SELECTED FOR WHAT IS AVAILABLE!!!'))
-        sys.exit()
-
-    ###########################################################################
-    ### Change missing values
-    if slicenan == 'nan':
-        ensshape[np.where(np.isnan(ensshape))] = np.nan
-        ensshape[np.where(ensshape <= -999)] = np.nan 
-        ensshape[np.where(ensshape >= 1e20)] = np.nan 
-        print('Completed: missing values are =',slicenan)
+    storefile = ST.getStoreFile('SPEAR_MED',vari)
+    if storefile is not None:
+        ### One consolidated file for all members and both time periods
+        lat1,lon1,ensvalue = ST.readStore(storefile,vari,len(ens),time,
+                                          lat_bounds,lon_bounds,months,
+                                          members=members)
     else:
-        ensshape[np.where(np.isnan(ensshape))] = slicenan
-        ensshape[np.where(ensshape <= -999)] = slicenan
-        ensshape[np.where(ensshape >= 1e20)] = slicenan
+        filenames1 = [directory + '%s/%s_%02d_1921-2010.nc' % (vari,vari,ensmember)
+                      for ensmember in ens]
+        filenames2 = [directory + '%s/%s_%02d_2011-2100.nc' % (vari,vari,ensmember)
+                      for ensmember in ens]
+
+        ### Both time periods are read straight into one output array
+        lat1,lon1,ensvalue = RU.emptyMembers(filenames1[0],vari,lat_bounds,lon_bounds,
+                                             (len(ens),time.shape[0],len(months)))
+        membersvar = np.reshape(ensvalue,(len(ens),time.shape[0]*len(months),
+                                          lat1.shape[0],lon1.shape[0]))
+
+        ### The historical segment is shared by all scenarios (see calc_HistoricalCache)
+        historical = membersvar[:,:timesat1.shape[0]*len(months)]
+        if not HC.loadSegment(filenames1,vari,months,lat_bounds,lon_bounds,historical):
+            RU.readMembers(filenames1,vari,slice(-timesat1.shape[0]*mon,None),
+                           lat_bounds,lon_bounds,months=months,out=historical)
+            HC.saveSegment(historical,filenames1,vari,months,lat_bounds,lon_bounds)
+        del historical
+        print('Completed: read *SPEAR_MED historical* Ensemble Members!')
+
+        RU.readMembers(filenames2,vari,slice(None,timesat2.shape[0]*mon),
+                       lat_bounds,lon_bounds,months=months,
+                       out=membersvar[:,timesat1.shape[0]*len(months):])
+        print('Completed: read *SPEAR_MED SSP585* Ensemble Members!')
+        del membersvar
+    print('Completed: read all SPEAR_MED Members!\n')
 
     ###########################################################################
     ### Change units
+    units = None
     if any([vari=='T2M',vari=='TS',vari=='SST',vari=='TMAX',vari=='TMIN',vari=='TMAXabs',vari=='TMINabs']):
-        ensshape = ensshape - 273.15 # K to C
+        units = ('-',273.15) # K to C
         print('Completed: Changed units (K to C)!')
     elif any([vari=='PRECL',vari=='PRECC',vari=='PRECT',vari=='WA',vari=='EVAP',vari=='SNOWRATE']):
-        ensshape = ensshape * 86400 # kg/m2/s to mm/day
+        units = ('*',86400) # kg/m2/s to mm/day
         ### "Average Monthly Rate of Precipitation"
         print('*** CURRENT UNITS ---> [[ mm/day ]]! ***')
     elif any([vari=='SNOW']):
-        ensshape = ensshape / 1000 # kg/m^2 to m
+        units = ('/',1000) # kg/m^2 to m
         ### "Average Monthly column-integrated snow water"
         print('*** CURRENT UNITS ---> [[ m ]]! ***')
     elif any([vari == 'tau_x',vari == 'tau_y']):
-        ensshape = ensshape * -1 # (-1 x forcing on the atmosphere; show downward stress)
+        units = ('*',-1) # (-1 x forcing on the atmosphere; show downward stress)
         print('*** CURRENT UNITS (multiplied by -1) ---> [[ N/m2 ]]! ***')
-    
+
+    ###########################################################################
+    ### Average over the months that were read (currently = [ens,yr,mn,lat,lon]),
+    ### change missing values and change units in one pass over each member
+    ensshape = RU.ingestMembers(ensvalue,sliceperiod,sliceshape,slicenan,
+                                [('<=',-999),('>=',1e20)],units)
+
     ###########################################################################
     ### Select years of analysis (1921-2100)
     if timeper == 'all':
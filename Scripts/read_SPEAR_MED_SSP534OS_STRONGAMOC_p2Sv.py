@@ -12,7 +12,7 @@ Usage
     [1] read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper)
 """
 
-def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper):
+def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshape,slicenan,numOfEns,timeper,lat_bounds=None,lon_bounds=None):
     """
     Function reads monthly data from SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv
 
@@ -32,6 +32,10 @@ def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshap
         integer
     timeper : time period of analysis
         string
+    lat_bounds : 2 floats or None
+        (latmin,latmax) to read only a region
+    lon_bounds : 2 floats or None
+        (lonmin,lonmax) to read only a region (lonmin > lonmax wraps 0E)
 
     Returns
     -------
@@ -51,8 +55,8 @@ def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshap
 
     ### Import modules
     import numpy as np
-    from netCDF4 import Dataset
     import calc_Utilities as UT
+    import calc_ReadUtilities as RU
     import sys
     import read_SPEAR_MED_Scenario as SC
 
@@ -63,7 +67,6 @@ def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshap
     ens = np.arange(1,numOfEns+1,1)
     
     timesat1 = np.arange(1921,2040+1,1)
-    timesat2 = np.arange(2041,2100+1,1)
  
     ###########################################################################
     ### Climate change emissions scenario
@@ -73,49 +76,42 @@ def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshap
 
     ###########################################################################
     ### Read in data
-    lat,lon,membersvar1 = SC.read_SPEAR_MED_Scenario(directoryScenario,'SSP534OS',vari,'none',5,slicenan,9,'STRONGAMOC')
+    lat,lon,membersvar1 = SC.read_SPEAR_MED_Scenario(directoryScenario,'SSP534OS',vari,'none',5,slicenan,9,'STRONGAMOC',
+                                                        lat_bounds,lon_bounds)
     
-    membersvar2 = []
-    for i,ensmember in enumerate(ens):
-        filename2 = directory + '%s/%s_%02d_2041-2100.nc' % (vari,vari,
-                                                          ensmember)
-        data2 = Dataset(filename2,'r')
-        lat1 = data2.variables['lat'][:]
-        lon1 = data2.variables['lon'][:]
-        var2 = data2.variables['%s' % vari][:,:,:]
-        data2.close()
+    filenames2 = [directory + '%s/%s_%02d_2041-2100.nc' % (vari,vari,ensmember)
+                  for ensmember in ens]
 
-        print('Completed: read *SPEAR_MED %s Ensemble Member --%s--' % ('SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv',ensmember))
-        membersvar2.append(var2)
-        del var2
+    ### Both time periods go straight into one output array
+    lat1,lon1,ensvalue = RU.emptyMembers(filenames2[0],vari,lat_bounds,lon_bounds,
+                                         (len(ens),time.shape[0],mon),
+                                         dtype=membersvar1.dtype)
+    ensvalue[:,:timesat1.shape[0]] = membersvar1
+    del membersvar1
+    membersvar = np.reshape(ensvalue,(len(ens),time.shape[0]*mon,
+                                      lat1.shape[0],lon1.shape[0]))
+    membersvar2 = membersvar[:,timesat1.shape[0]*mon:]
+    RU.readMembers(filenames2,vari,slice(None),
+                   lat_bounds,lon_bounds,out=membersvar2)
         
     ###########################################################################
-    ### Change units
-    membersvar2 = np.asarray(membersvar2)
-    
+    ### Change units (in place on the second time period)
     if any([vari=='T2M',vari=='SST',vari=='TMAX',vari=='TMIN',vari=='TMAXabs',vari=='TMINabs']):
-        membersvar2 = membersvar2 - 273.15 # K to C
+        membersvar2 -= 273.15 # K to C
         print('Completed: Changed units (K to C)!')
     elif any([vari=='PRECL',vari=='PRECC',vari=='PRECT',vari=='WA',vari=='EVAP',vari=='SNOWRATE']):
-        membersvar2 = membersvar2 * 86400 # kg/m2/s to mm/day
+        membersvar2 *= 86400 # kg/m2/s to mm/day
         ### "Average Monthly Rate of Precipitation"
         print('*** CURRENT UNITS ---> [[ mm/day ]]! ***')
     elif any([vari=='SNOW']):
-        membersvar2 = membersvar2 / 1000 # kg/m^2 to m
+        membersvar2 /= 1000 # kg/m^2 to m
         ### "Average Monthly column-integrated snow water"
         print('*** CURRENT UNITS ---> [[ m ]]! ***')
     elif any([vari == 'tau_x',vari == 'tau_y']):
-        membersvar2 = membersvar2 * -1 # (-1 x forcing on the atmosphere; show downward stress)
+        membersvar2 *= -1 # (-1 x forcing on the atmosphere; show downward stress)
         print('*** CURRENT UNITS (multiplied by -1) ---> [[ N/m2 ]]! ***')
-        
-    ### Append both time periods together
-    membersvar1 = np.asarray(membersvar1)
-    membersvar2 = np.reshape(membersvar2,(len(ens),timesat2.shape[0],mon,
-                                    lat1.shape[0],lon1.shape[0]))
-    print(membersvar1.shape,membersvar2.shape)
-    ensvalue = np.append(membersvar1,membersvar2,axis=1)
 
-    del membersvar1
+    del membersvar
     del membersvar2
     print('Completed: appended all SPEAR_MED Members!\n')
 
@@ -132,7 +128,8 @@ def read_SPEAR_MED_SSP534OS_STRONGAMOC_p2Sv(directory,vari,sliceperiod,sliceshap
         print('Completed: ANNUAL MEAN!')
     elif sliceperiod == 'DJF':
         ensshape = np.empty((ensvalue.shape[0],ensvalue.shape[1]-1,
-                             lat1.shape[0],lon1.shape[0]))
+                             lat1.shape[0],lon1.shape[0]),
+                            dtype=RU.getComputeDtype())
         for i in range(ensvalue.shape[0]):
             ensshape[i,:,:,:] = UT.calcDecJanFeb(ensvalue[i,:,:,:,:],
                                                  lat1,lon1,'surface',1)